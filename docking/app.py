@@ -69,6 +69,7 @@ def main() -> None:
     window.show_all()
     Gtk.main()
 
+    dnd.flush_pending_save()
     model.stop_applets()
 
 
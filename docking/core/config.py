@@ -17,6 +17,8 @@ DEFAULT_CONFIG_FILE = DEFAULT_CONFIG_DIR / "dock.json"
 
 DEFAULT_PINNED: list[str] = []
 
+DRAG_ICON_SCALE = 1.2  # dragged icon shown at this multiplier of icon_size
+
 
 @dataclass
 class Config:
@@ -56,6 +58,20 @@ class Config:
         """Position as enum."""
         return Position(self.position)
 
+    # Derived sizes are properties rather than cached values: icon_size is
+    # assigned directly by the menu, and a product is cheaper than any
+    # invalidation scheme.
+
+    @property
+    def zoomed_icon_size(self) -> int:
+        """Icon size at full zoom; icons are loaded at this size."""
+        return int(self.icon_size * self.zoom_percent)
+
+    @property
+    def drag_icon_size(self) -> int:
+        """Size of the icon shown under the cursor while dragging."""
+        return int(self.icon_size * DRAG_ICON_SCALE)
+
     def __post_init__(self) -> None:
         self._path: Path = DEFAULT_CONFIG_FILE
 
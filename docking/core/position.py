@@ -19,6 +19,10 @@ class Position(str, enum.Enum):
     RIGHT = "right"
 
 
+_HORIZONTAL = frozenset((Position.BOTTOM, Position.TOP))
+
+
 def is_horizontal(pos: Position) -> bool:
     """True for bottom/top (icons laid out left-to-right)."""
-    return pos in (Position.BOTTOM, Position.TOP)
+    # Set membership avoids looking the enum members up on every call
+    return pos in _HORIZONTAL
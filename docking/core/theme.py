@@ -12,7 +12,7 @@ For example, with icon_size=48 the scale factor is 4.8:
 
 This scaling unit means a single theme JSON produces correct proportions
 at any icon size -- 32px, 48px, 64px, 128px, etc.  All downstream code
-receives pixel values from the Theme dataclass and never touches the raw
+receives pixel values from the Theme tuple and never touches the raw
 JSON scaling values.
 
 Animation parameters (bounce heights, durations, opacity) are not scaled
@@ -22,13 +22,19 @@ final units (fractions, milliseconds, opacity 0-1).
 
 from __future__ import annotations
 
+import functools
 import json
-from dataclasses import dataclass
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
-# Bundled themes directory (relative to package)
-_BUILTIN_THEMES_DIR = Path(__file__).resolve().parent.parent / "assets" / "themes"
+# Bundled themes directory (relative to package). abspath is pure string
+# work; Path.resolve() would stat the whole symlink chain at import time.
+_BUILTIN_THEMES_DIR = (
+    Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    / "assets"
+    / "themes"
+)
 
 # Color types as Cairo-compatible floats (0.0-1.0)
 RGB = tuple[float, float, float]
@@ -40,12 +46,39 @@ def _rgba(values: list[int]) -> RGBA:
     return values[0] / 255, values[1] / 255, values[2] / 255, values[3] / 255
 
 
-@dataclass(frozen=True)
-class Theme:
+# JSON fallbacks for keys a theme file may omit. Colors are [R, G, B, A]
+# (0-255); animation values keep the type of their default.
+_COLOR_DEFAULTS: dict[str, list[int]] = {
+    "fill_start": [40, 40, 40, 220],
+    "fill_end": [30, 30, 30, 220],
+    "stroke": [41, 41, 41, 255],
+    "inner_stroke": [255, 255, 255, 255],
+    "indicator_color": [255, 255, 255, 200],
+    "active_indicator_color": [100, 180, 255, 255],
+}
+_ANIMATION_DEFAULTS: dict[str, float | int] = {
+    "urgent_bounce_height": 1.66,
+    "launch_bounce_height": 0.625,
+    "urgent_bounce_time_ms": 600,
+    "launch_bounce_time_ms": 600,
+    "click_time_ms": 300,
+    "hover_lighten": 0.2,
+    "active_time_ms": 150,
+    "max_indicator_dots": 3,
+    "glow_opacity": 0.6,
+    "urgent_glow_time_ms": 10000,
+    "urgent_glow_pulse_ms": 2000,
+    "urgent_glow_size": 0.6,
+}
+
+
+class Theme(NamedTuple):
     """Visual theme for the dock.
 
     All layout fields store pixel values, computed at load time from the
     JSON scaling units.  Downstream rendering code uses these directly.
+    A NamedTuple rather than a dataclass: immutable, and field reads on the
+    per-frame render path are tuple index lookups.
     """
 
     # --- Colors (Cairo 0.0-1.0) ---
@@ -154,30 +187,28 @@ class Theme:
             A Theme instance with all layout values in pixels.
         """
         path = _BUILTIN_THEMES_DIR / f"{name}.json"
-        if not path.exists():
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
             return cls()
+        # Keyed on the mtime so an edited theme file is picked up
+        return _load_cached(path=str(path), mtime_ns=mtime_ns, icon_size=icon_size)
 
-        with open(path) as f:
-            data: dict[str, Any] = json.load(f)
-
+    @classmethod
+    def _from_json(cls, data: dict[str, Any], icon_size: int) -> "Theme":
+        """Build a Theme from parsed theme JSON (see load() for the units)."""
         # --- Scale factor ---
         # All layout values in JSON use "tenths of percent of icon_size".
         # Multiply by this to convert to pixels.
         scaled = icon_size / 10.0
 
         # --- Colors (not scaled, just converted 0-255 -> 0.0-1.0) ---
-        fill_start = _rgba(values=data.get("fill_start", [40, 40, 40, 220]))
-        fill_end = _rgba(values=data.get("fill_end", [30, 30, 30, 220]))
-        stroke = _rgba(values=data.get("stroke", [41, 41, 41, 255]))
+        fields: dict[str, Any] = {
+            key: _rgba(values=data.get(key, default))
+            for key, default in _COLOR_DEFAULTS.items()
+        }
         stroke_width = float(data.get("stroke_width", 1.0))
-        inner_stroke = _rgba(values=data.get("inner_stroke", [255, 255, 255, 255]))
         roundness = float(data.get("roundness", 4.0))
-        indicator_color = _rgba(
-            values=data.get("indicator_color", [255, 255, 255, 200])
-        )
-        active_indicator_color = _rgba(
-            values=data.get("active_indicator_color", [100, 180, 255, 255])
-        )
 
         # --- Layout values: JSON scaling unit -> pixels ---
         # indicator_size is stored as raw pixels (diameter), halved to radius.
@@ -224,44 +255,28 @@ class Theme:
         shelf_height = max(0.0, icon_size + top_offset + bottom_offset)
 
         # --- Animation params (direct values, not scaled) ---
-        urgent_bounce_height = float(data.get("urgent_bounce_height", 1.66))
-        launch_bounce_height = float(data.get("launch_bounce_height", 0.625))
-        urgent_bounce_time_ms = int(data.get("urgent_bounce_time_ms", 600))
-        launch_bounce_time_ms = int(data.get("launch_bounce_time_ms", 600))
-        click_time_ms = int(data.get("click_time_ms", 300))
-        hover_lighten = float(data.get("hover_lighten", 0.2))
-        active_time_ms = int(data.get("active_time_ms", 150))
-        max_indicator_dots = int(data.get("max_indicator_dots", 3))
-        glow_opacity = float(data.get("glow_opacity", 0.6))
-        urgent_glow_time_ms = int(data.get("urgent_glow_time_ms", 10000))
-        urgent_glow_pulse_ms = int(data.get("urgent_glow_pulse_ms", 2000))
-        urgent_glow_size = float(data.get("urgent_glow_size", 0.6))
+        for key, default in _ANIMATION_DEFAULTS.items():
+            fields[key] = type(default)(data.get(key, default))
 
         return cls(
-            fill_start=fill_start,
-            fill_end=fill_end,
-            stroke=stroke,
             stroke_width=stroke_width,
-            inner_stroke=inner_stroke,
             roundness=roundness,
-            indicator_color=indicator_color,
-            active_indicator_color=active_indicator_color,
             indicator_radius=indicator_radius,
             h_padding=h_padding_px,
             top_padding=top_padding_px,
             bottom_padding=bottom_padding_px,
             item_padding=item_padding_px,
             shelf_height=shelf_height,
-            urgent_bounce_height=urgent_bounce_height,
-            launch_bounce_height=launch_bounce_height,
-            urgent_bounce_time_ms=urgent_bounce_time_ms,
-            launch_bounce_time_ms=launch_bounce_time_ms,
-            click_time_ms=click_time_ms,
-            hover_lighten=hover_lighten,
-            active_time_ms=active_time_ms,
-            max_indicator_dots=max_indicator_dots,
-            glow_opacity=glow_opacity,
-            urgent_glow_time_ms=urgent_glow_time_ms,
-            urgent_glow_pulse_ms=urgent_glow_pulse_ms,
-            urgent_glow_size=urgent_glow_size,
+            **fields,
         )
+
+
+@functools.lru_cache(maxsize=8)
+def _load_cached(path: str, mtime_ns: int, icon_size: int) -> Theme:
+    """Parse a theme file once per (path, mtime, icon size).
+
+    Theme is immutable, so the cached instance is safely shared between the
+    renderer, menu and app.
+    """
+    data: dict[str, Any] = json.loads(Path(path).read_bytes())
+    return Theme._from_json(data=data, icon_size=icon_size)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
+import time
 from pathlib import Path
 from typing import NamedTuple
 
@@ -18,6 +20,17 @@ DESKTOP_SUFFIX = ".desktop"
 FALLBACK_ICON = "application-x-executable"
 DEFAULT_XDG_DATA_DIRS = "/usr/local/share:/usr/share"
 GNOME_APP_PREFIX = "org.gnome."
+# Rasterized theme icons persisted across restarts, keyed by theme/name/size
+ICON_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "docking"
+    / "icons"
+)
+# Cached icons not rewritten for this long are pruned, which also clears out
+# entries left behind by a previous icon theme
+ICON_CACHE_MAX_AGE_S = 30 * 24 * 60 * 60
+# PNG text chunk recording the theme file a cached icon was rendered from
+_SOURCE_OPTION = "tEXt::docking-source"
 _log = get_logger(name="launcher")
 
 
@@ -37,6 +50,8 @@ class Launcher:
     def __init__(self) -> None:
         self._desktop_dirs = self._get_desktop_dirs()
         self._icon_cache: dict[tuple[str, int], GdkPixbuf.Pixbuf | None] = {}
+        self._icon_cache_dir = ICON_CACHE_DIR
+        self._icon_cache_pruned = False
 
     def resolve(self, desktop_id: str) -> DesktopInfo | None:
         """Resolve a desktop ID (e.g. 'firefox.desktop') to full info."""
@@ -83,10 +98,113 @@ class Launcher:
         if key in self._icon_cache:
             return self._icon_cache[key]
 
-        pixbuf = self._try_load_icon(icon_name=icon_name, size=size)
+        path = self._disk_icon_path(icon_name=icon_name, size=size)
+        pixbuf = None
+        if path is not None:
+            pixbuf = self._load_disk_icon(path=path)
+            if pixbuf is None:
+                pixbuf = self._render_theme_icon(
+                    icon_name=icon_name, size=size, path=path
+                )
+        if pixbuf is None:
+            pixbuf = self._try_load_icon(icon_name=icon_name, size=size)
         self._icon_cache[key] = pixbuf
         return pixbuf
 
+    def _disk_icon_path(self, icon_name: str, size: int) -> Path | None:
+        """Disk cache path for a theme icon, or None for file-path icons.
+
+        The icon theme name is part of the key so switching themes does not
+        serve stale artwork.
+        """
+        if os.path.isabs(icon_name):
+            return None
+        theme_name = Gtk.Settings.get_default().get_property("gtk-icon-theme-name")
+        key = f"{theme_name}:{icon_name}:{size}".encode()
+        return self._icon_cache_dir / f"{hashlib.sha1(key).hexdigest()}.png"
+
+    @staticmethod
+    def _load_disk_icon(path: Path) -> GdkPixbuf.Pixbuf | None:
+        """Load a previously rasterized icon if its theme file is unchanged.
+
+        The source file and its mtime are stored in the PNG itself, so a warm
+        start costs one decode and one stat, with no theme lookup; a theme
+        package upgrade changes the mtime and misses.
+        """
+        if not path.exists():
+            return None
+        try:
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file(str(path))
+        except GLib.Error as exc:
+            _log.debug("Discarding unreadable cached icon %s: %s", path, exc)
+            return None
+        source, _, mtime_ns = (pixbuf.get_option(_SOURCE_OPTION) or "").rpartition("\n")
+        try:
+            if source and os.stat(source).st_mtime_ns == int(mtime_ns):
+                return pixbuf
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _render_theme_icon(
+        self, icon_name: str, size: int, path: Path
+    ) -> GdkPixbuf.Pixbuf | None:
+        """Load a theme icon and persist it to the disk cache at path.
+
+        Returns None when the theme has no such icon; fallback icons are
+        never cached, as they would mask a later install.
+        """
+        info = Gtk.IconTheme.get_default().lookup_icon(
+            icon_name, size, Gtk.IconLookupFlags.FORCE_SIZE
+        )
+        if info is None:
+            return None
+        try:
+            pixbuf = info.load_icon()
+        except GLib.Error as exc:
+            _log.debug("Theme icon not loadable (%s): %s", icon_name, exc)
+            return None
+        source = info.get_filename()
+        if source:
+            self._save_disk_icon(path=path, source=source, pixbuf=pixbuf)
+        return pixbuf
+
+    def _save_disk_icon(
+        self, path: Path, source: str, pixbuf: GdkPixbuf.Pixbuf
+    ) -> None:
+        """Persist a theme icon so the next start skips theme lookup/rasterize."""
+        if not self._icon_cache_pruned:
+            self._icon_cache_pruned = True
+            self._prune_disk_icons()
+        # Write beside the target and rename, so an interrupted save never
+        # leaves a truncated PNG under the final name
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            stamp = f"{source}\n{os.stat(source).st_mtime_ns}"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            pixbuf.savev(str(tmp), "png", [_SOURCE_OPTION], [stamp])
+            os.replace(tmp, path)
+        except (GLib.Error, OSError) as exc:
+            _log.debug("Failed to cache icon %s: %s", path, exc)
+            tmp.unlink(missing_ok=True)
+
+    def _prune_disk_icons(self) -> None:
+        """Delete cached icons (and stray temp files) older than the max age.
+
+        Runs once per process, on the first write rather than at startup.
+        """
+        cutoff = time.time() - ICON_CACHE_MAX_AGE_S
+        try:
+            entries = list(os.scandir(self._icon_cache_dir))
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except OSError:
+                continue
+
     def _try_load_icon(self, icon_name: str, size: int) -> GdkPixbuf.Pixbuf | None:
         """Attempt to load icon from theme or file path."""
         theme = Gtk.IconTheme.get_default()
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Callable
+import sys
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
 
 from docking.log import get_logger
 
@@ -19,32 +19,120 @@ gi.require_version("GdkPixbuf", "2.0")
 from gi.repository import GdkPixbuf, GLib  # noqa: E402
 
 
-@dataclass
 class DockItem:
-    """A single item in the dock."""
+    """A single item in the dock.
+
+    Hand-written rather than a dataclass: items are built on every new
+    transient window, and a slotted class with a plain __init__ constructs
+    noticeably faster. Equality is identity, which is what the model's
+    list membership checks want.
+    """
+
+    __slots__ = (
+        "desktop_id",
+        "name",
+        "icon_name",
+        "wm_class",
+        "is_pinned",
+        "is_running",
+        "is_active",
+        "is_urgent",
+        "instance_count",
+        "icon",
+        "main_size",
+        "last_clicked",
+        "last_launched",
+        "last_urgent",
+        "tooltip_builder",
+    )
 
     desktop_id: str
-    name: str = ""
-    icon_name: str = "application-x-executable"
-    wm_class: str = ""
-    is_pinned: bool = False
-    is_running: bool = False
-    is_active: bool = False
-    is_urgent: bool = False
-    instance_count: int = 0
-    icon: GdkPixbuf.Pixbuf | None = None
+    name: str
+    icon_name: str
+    wm_class: str
+    is_pinned: bool
+    is_running: bool
+    is_active: bool
+    is_urgent: bool
+    instance_count: int
+    icon: GdkPixbuf.Pixbuf | None
     # Custom slot width along main axis (0 = use icon_size)
-    main_size: int = 0
+    main_size: int
     # Timestamps for animations (monotonic microseconds, 0 = inactive)
-    last_clicked: int = 0
-    last_launched: int = 0
-    last_urgent: int = 0
+    last_clicked: int
+    last_launched: int
+    last_urgent: int
     # Callable returning tooltip widget/content; used by applets for rich tooltips
-    tooltip_builder: Callable[[], Any] | None = None
+    tooltip_builder: Callable[[], Any] | None
+
+    def __init__(
+        self,
+        desktop_id: str,
+        name: str = "",
+        icon_name: str = "application-x-executable",
+        wm_class: str = "",
+        is_pinned: bool = False,
+        is_running: bool = False,
+        is_active: bool = False,
+        is_urgent: bool = False,
+        instance_count: int = 0,
+        icon: GdkPixbuf.Pixbuf | None = None,
+        main_size: int = 0,
+        last_clicked: int = 0,
+        last_launched: int = 0,
+        last_urgent: int = 0,
+        tooltip_builder: Callable[[], Any] | None = None,
+    ) -> None:
+        self.desktop_id = desktop_id
+        self.name = name
+        self.icon_name = icon_name
+        self.wm_class = wm_class
+        self.is_pinned = is_pinned
+        self.is_running = is_running
+        self.is_active = is_active
+        self.is_urgent = is_urgent
+        self.instance_count = instance_count
+        self.icon = icon
+        self.main_size = main_size
+        self.last_clicked = last_clicked
+        self.last_launched = last_launched
+        self.last_urgent = last_urgent
+        self.tooltip_builder = tooltip_builder
+
+
+class RunState(NamedTuple):
+    """Per-app running state, normalized from a WindowTracker entry."""
+
+    active: bool
+    count: int
+    urgent: bool
+
+
+def _move_item(items: list[DockItem], from_index: int, to_index: int) -> None:
+    """Move items[from_index] to to_index, shifting the run in between.
+
+    Adjacent moves (the common drag step) are a plain swap; longer moves
+    rebuild the affected run with one slice assignment instead of pop+insert.
+    """
+    if abs(from_index - to_index) == 1:
+        items[from_index], items[to_index] = items[to_index], items[from_index]
+    elif from_index < to_index:
+        moved = items[from_index]
+        items[from_index : to_index + 1] = [
+            *items[from_index + 1 : to_index + 1],
+            moved,
+        ]
+    elif from_index > to_index:
+        moved = items[from_index]
+        items[to_index : from_index + 1] = [moved, *items[to_index:from_index]]
 
 
 class DockModel:
-    """Ordered collection of dock items, merging pinned and running apps."""
+    """Ordered collection of dock items, merging pinned and running apps.
+
+    Main-thread only: applets with worker threads hand their results back
+    through GLib.idle_add before touching items or calling notify().
+    """
 
     def __init__(self, config: Config, launcher: Launcher) -> None:
         self._config = config
@@ -53,19 +141,38 @@ class DockModel:
         self._transient: list[DockItem] = []
         self._applets: dict[str, Applet] = {}
         self.on_change: Callable[[], None] | None = None
+        # Signature of the last running dict applied; None forces the next update
+        self._last_running_sig: tuple[tuple[str, RunState], ...] | None = None
+        # Scratch set reused by update_running to avoid a new set per tick
+        self._matched_scratch: set[str] = set()
+        # pinned_items + _transient and its desktop_id index; None = stale
+        self._visible_cache: list[DockItem] | None = None
+        self._by_desktop_id: dict[str, DockItem] = {}
+        # Visible items by casefolded wm_class, built on first lookup
+        self._by_wm_class: dict[str, DockItem] | None = None
 
         self._load_pinned()
 
+    def _icon_size(self) -> int:
+        """Icon pixel size at full zoom, which is what dock icons are loaded at.
+
+        Icons themselves are memoized by (name, size) in Launcher.load_icon,
+        so a config change simply misses the cache at the new size.
+        """
+        return self._config.zoomed_icon_size
+
     def _load_pinned(self) -> None:
         """Load pinned items from config and resolve their desktop info."""
         from docking.applets import get_registry
         from docking.applets.base import applet_id_from, is_applet
 
-        icon_size = int(self._config.icon_size * self._config.zoom_percent)
+        icon_size = self._icon_size()
         registry = get_registry()
 
         log = get_logger(name="model")
         for desktop_id in self._config.pinned:
+            # Interned ids/classes hash and compare by pointer in the lookups
+            desktop_id = sys.intern(desktop_id)
             if is_applet(desktop_id=desktop_id):
                 did = applet_id_from(desktop_id=desktop_id)
                 cls = registry.get(did)
@@ -93,8 +200,8 @@ class DockModel:
                 DockItem(
                     desktop_id=desktop_id,
                     name=info.name,
-                    icon_name=info.icon_name,
-                    wm_class=info.wm_class,
+                    icon_name=sys.intern(info.icon_name),
+                    wm_class=sys.intern(info.wm_class),
                     is_pinned=True,
                     icon=icon,
                 )
@@ -114,13 +221,13 @@ class DockModel:
         except ValueError:
             return
 
-        desktop_id = applet_desktop_id(applet_id=did)
+        desktop_id = sys.intern(applet_desktop_id(applet_id=did))
         if desktop_id in self._applets:
             return
         cls = get_registry().get(did)
         if not cls:
             return
-        icon_size = int(self._config.icon_size * self._config.zoom_percent)
+        icon_size = self._icon_size()
         try:
             applet = cls(icon_size, config=self._config)
         except Exception:
@@ -146,9 +253,11 @@ class DockModel:
         prefix = f"{APPLET_PREFIX}{AppletId.SEPARATOR}#"
         nums = [int(k[len(prefix) :]) for k in self._applets if k.startswith(prefix)]
         n = max(nums, default=-1) + 1
-        desktop_id = applet_desktop_id(applet_id=AppletId.SEPARATOR, instance=n)
+        desktop_id = sys.intern(
+            applet_desktop_id(applet_id=AppletId.SEPARATOR, instance=n)
+        )
 
-        icon_size = int(self._config.icon_size * self._config.zoom_percent)
+        icon_size = self._icon_size()
         try:
             applet = cls(icon_size, config=self._config)
         except Exception:
@@ -186,22 +295,37 @@ class DockModel:
         for applet in self._applets.values():
             applet.stop()
 
+    def _invalidate(self) -> None:
+        """Drop the cached visible list and its indexes after a mutation."""
+        self._visible_cache = None
+        self._by_wm_class = None
+
     def visible_items(self) -> list[DockItem]:
-        """All items to display: pinned first, then transient running apps."""
-        return self.pinned_items + self._transient
+        """All items to display: pinned first, then transient running apps.
+
+        The list is cached until the next mutation and shared between
+        callers, so it must be treated as read-only.
+        """
+        if self._visible_cache is None:
+            self._visible_cache = self.pinned_items + self._transient
+            # Reversed so a pinned item wins over a same-id transient
+            self._by_desktop_id = {
+                item.desktop_id: item for item in reversed(self._visible_cache)
+            }
+        return self._visible_cache
 
     def find_by_desktop_id(self, desktop_id: str) -> DockItem | None:
-        for item in self.pinned_items + self._transient:
-            if item.desktop_id == desktop_id:
-                return item
-        return None
+        self.visible_items()
+        return self._by_desktop_id.get(desktop_id)
 
     def find_by_wm_class(self, wm_class: str) -> DockItem | None:
-        wm_lower = wm_class.lower()
-        for item in self.pinned_items + self._transient:
-            if item.wm_class.lower() == wm_lower:
-                return item
-        return None
+        if self._by_wm_class is None:
+            # Reversed so the first visible item with a class wins
+            self._by_wm_class = {
+                item.wm_class.casefold(): item
+                for item in reversed(self.visible_items())
+            }
+        return self._by_wm_class.get(wm_class.casefold())
 
     def update_running(self, running: dict[str, dict[str, Any]]) -> None:
         """Update running state from WindowTracker data.
@@ -209,67 +333,83 @@ class DockModel:
         Args:
             running: {desktop_id: {"count": int, "active": bool}}
         """
-        # Reset running state (preserve is_urgent for transition detection)
-        for item in self.pinned_items:
-            item.is_running = False
-            item.is_active = False
-            item.instance_count = 0
+        # Normalize once so the loops below read plain tuple fields
+        states = {
+            desktop_id: RunState(
+                active=info.get("active", False),
+                count=info.get("count", 1),
+                urgent=info.get("urgent", False),
+            )
+            for desktop_id, info in running.items()
+        }
+        # Skip the whole pass (and the redraw it triggers) when nothing changed
+        sig = tuple(sorted(states.items()))
+        if sig == self._last_running_sig:
+            return
+        self._last_running_sig = sig
 
-        # Update pinned items that are running
-        matched_ids = set()
+        # Single pass over pinned items: reset the ones not running,
+        # update the ones that are
+        matched_ids = self._matched_scratch
+        matched_ids.clear()
         for item in self.pinned_items:
-            if item.desktop_id not in running:
+            state = states.get(item.desktop_id)
+            if state is None:
+                item.is_running = False
+                item.is_active = False
+                item.instance_count = 0
                 item.is_urgent = False
                 continue
-            info = running[item.desktop_id]
             item.is_running = True
-            item.is_active = info.get("active", False)
-            item.instance_count = info.get("count", 1)
+            item.is_active = state.active
+            item.instance_count = state.count
             # Set urgent timestamp only on false->true transition
-            urgent = info.get("urgent", False)
+            urgent = state.urgent
             if urgent and not item.is_urgent:
                 item.last_urgent = GLib.get_monotonic_time()
             item.is_urgent = urgent
             matched_ids.add(item.desktop_id)
 
         # Add transient items for running apps not in pinned
+        icon_size = self._icon_size()
         new_transient: list[DockItem] = []
-        for desktop_id, info in running.items():
+        transient_by_id = {t.desktop_id: t for t in self._transient}
+        for desktop_id, state in states.items():
             if desktop_id not in matched_ids:
-                existing = next(
-                    (t for t in self._transient if t.desktop_id == desktop_id), None
-                )
+                existing = transient_by_id.get(desktop_id)
                 if existing:
                     existing.is_running = True
-                    existing.is_active = info.get("active", False)
-                    existing.instance_count = info.get("count", 1)
+                    existing.is_active = state.active
+                    existing.instance_count = state.count
                     new_transient.append(existing)
                 else:
                     resolved = self._launcher.resolve(desktop_id)
-                    icon_size = int(self._config.icon_size * self._config.zoom_percent)
                     icon = self._launcher.load_icon(
                         resolved.icon_name if resolved else "application-x-executable",
                         icon_size,
                     )
                     new_transient.append(
                         DockItem(
-                            desktop_id=desktop_id,
+                            desktop_id=sys.intern(desktop_id),
                             name=resolved.name if resolved else desktop_id,
                             icon_name=(
-                                resolved.icon_name
+                                sys.intern(resolved.icon_name)
                                 if resolved
                                 else "application-x-executable"
                             ),
-                            wm_class=resolved.wm_class if resolved else "",
+                            wm_class=(
+                                sys.intern(resolved.wm_class) if resolved else ""
+                            ),
                             is_pinned=False,
                             is_running=True,
-                            is_active=info.get("active", False),
-                            instance_count=info.get("count", 1),
+                            is_active=state.active,
+                            instance_count=state.count,
                             icon=icon,
                         )
                     )
 
         self._transient = new_transient
+        self._invalidate()
         self.notify()
 
     def pin_item(self, desktop_id: str) -> None:
@@ -305,8 +445,7 @@ class DockModel:
         """Move a pinned item from one position to another."""
         items = self.pinned_items
         if 0 <= from_index < len(items) and 0 <= to_index < len(items):
-            item = items.pop(from_index)
-            items.insert(to_index, item)
+            _move_item(items, from_index=from_index, to_index=to_index)
             self.sync_pinned_to_config()
             self.notify()
 
@@ -319,40 +458,43 @@ class DockModel:
         if not (0 <= from_index < len(items) and 0 <= to_index < len(items)):
             return
 
+        # visible_items() is pinned + transient, so a visible index below
+        # n_pinned is already the pinned index -- no list.index() scans
+        n_pinned = len(self.pinned_items)
         item = items[from_index]
+        target_item = items[to_index]
 
         # Auto-pin transient items so they can be reordered among pinned items
-        if not item.is_pinned:
-            if item in self._transient:
-                self._transient.remove(item)
-            item.is_pinned = True
-            self.pinned_items.append(item)
-
-        # Map visible index -> pinned index for the source item
-        pinned_from = self.pinned_items.index(item)
+        if from_index < n_pinned:
+            pinned_from = from_index
+        else:
+            pinned_from = self._auto_pin(item=item)
 
         # Map visible target index -> pinned index (auto-pin target if transient)
-        target_item = items[to_index] if to_index < len(items) else None
-        if target_item and not target_item.is_pinned:
-            if target_item in self._transient:
-                self._transient.remove(target_item)
-            target_item.is_pinned = True
-            self.pinned_items.append(target_item)
-
-        if target_item and target_item in self.pinned_items:
-            pinned_to = self.pinned_items.index(target_item)
+        if to_index < n_pinned:
+            pinned_to = to_index
+        elif target_item is item:
+            pinned_to = pinned_from
         else:
-            pinned_to = len(self.pinned_items) - 1
+            pinned_to = self._auto_pin(item=target_item)
 
-        if pinned_from != pinned_to:
-            self.pinned_items.pop(pinned_from)
-            self.pinned_items.insert(pinned_to, item)
+        _move_item(self.pinned_items, from_index=pinned_from, to_index=pinned_to)
 
         self.sync_pinned_to_config()
         self.notify()
 
+    def _auto_pin(self, item: DockItem) -> int:
+        """Move a transient item to the end of pinned_items; return its index."""
+        self._transient.remove(item)
+        item.is_pinned = True
+        self.pinned_items.append(item)
+        return len(self.pinned_items) - 1
+
     def sync_pinned_to_config(self) -> None:
         """Write current pinned_items order back to config (does not save to disk)."""
+        # Pinned set changed: the next running update must be applied in full
+        self._last_running_sig = None
+        self._invalidate()
         self._config.pinned = [item.desktop_id for item in self.pinned_items]
 
     def notify(self) -> None:
@@ -89,6 +89,7 @@ partial variant.
 from __future__ import annotations
 
 import ctypes
+import functools
 
 from gi.repository import Gdk, GdkX11
 
@@ -98,20 +99,32 @@ ATOM_STRUT_PARTIAL = b"_NET_WM_STRUT_PARTIAL"
 ATOM_STRUT = b"_NET_WM_STRUT"
 ATOM_CARDINAL = b"CARDINAL"
 
-
-def set_struts(gdk_window: GdkX11.X11Window, struts: list[int]) -> None:
-    """Write the raw strut arrays to X11 properties via ctypes/Xlib."""
+# Reused property buffers; XChangeProperty copies the data before returning
+_STRUT_PARTIAL_BUF = (ctypes.c_long * 12)()
+_STRUT_BUF = (ctypes.c_long * 4)()
+# (edge index, start index) into the 12-value strut array per position:
+#   Index:  0     1      2    3       4..5          6..7
+#           left  right  top  bottom  left_start/end_y  right_start/end_y
+#   Index:  8..9            10..11
+#           top_start/end_x  bottom_start/end_x
+_STRUT_INDICES: dict[Position, tuple[int, int]] = {
+    Position.LEFT: (0, 4),
+    Position.RIGHT: (1, 6),
+    Position.TOP: (2, 8),
+    Position.BOTTOM: (3, 10),
+}
+# Last struts written per X window id, to skip redundant round-trips.
+# Entries are dropped by clear_struts and forget_struts, so a reused XID or
+# a remapped window never inherits a stale value.
+_last_struts: dict[int, tuple[int, ...]] = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_xlib() -> ctypes.CDLL:
+    """Load libX11 once and declare the signatures set_struts relies on."""
     xlib = ctypes.cdll.LoadLibrary("libX11.so.6")
-    xid = gdk_window.get_xid()
-    xdisplay = ctypes.c_void_p(hash(GdkX11.X11Display.get_default().get_xdisplay()))
-
     xlib.XInternAtom.restype = ctypes.c_ulong
     xlib.XInternAtom.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
-
-    atom_partial = xlib.XInternAtom(xdisplay, ATOM_STRUT_PARTIAL, 0)
-    atom_strut = xlib.XInternAtom(xdisplay, ATOM_STRUT, 0)
-    xa_cardinal = xlib.XInternAtom(xdisplay, ATOM_CARDINAL, 0)
-
     xlib.XChangeProperty.argtypes = [
         ctypes.c_void_p,
         ctypes.c_ulong,
@@ -122,9 +135,56 @@ def set_struts(gdk_window: GdkX11.X11Window, struts: list[int]) -> None:
         ctypes.c_void_p,
         ctypes.c_int,
     ]
+    return xlib
+
+
+@functools.lru_cache(maxsize=4)
+def _intern_atoms(xdisplay: int) -> tuple[int, int, int]:
+    """Intern the strut atoms once per X display connection.
+
+    Keyed on the display pointer so a reopened display gets fresh atoms.
+    """
+    xlib = _load_xlib()
+    display = ctypes.c_void_p(xdisplay)
+    return (
+        xlib.XInternAtom(display, ATOM_STRUT_PARTIAL, 0),
+        xlib.XInternAtom(display, ATOM_STRUT, 0),
+        xlib.XInternAtom(display, ATOM_CARDINAL, 0),
+    )
 
-    arr12 = (ctypes.c_long * 12)(*struts)
-    arr4 = (ctypes.c_long * 4)(*struts[:4])
+
+@functools.lru_cache(maxsize=1)
+def _xdisplay_pointer(display: GdkX11.X11Display) -> int:
+    """Return the Xlib Display* behind a GdkX11 display.
+
+    PyGObject hands the Display* back as a GI pointer wrapper whose hash is
+    the wrapped C pointer; some bindings return a PyCapsule instead, which
+    hash() would not unwrap. Both are handled, once per display.
+    """
+    xdisplay = display.get_xdisplay()
+    if type(xdisplay).__name__ == "PyCapsule":
+        get_pointer = ctypes.pythonapi.PyCapsule_GetPointer
+        get_pointer.restype = ctypes.c_void_p
+        get_pointer.argtypes = [ctypes.py_object, ctypes.c_char_p]
+        return get_pointer(xdisplay, None) or 0
+    return hash(xdisplay)
+
+
+def set_struts(gdk_window: GdkX11.X11Window, struts: list[int]) -> None:
+    """Write the raw strut arrays to X11 properties via ctypes/Xlib."""
+    xid = gdk_window.get_xid()
+    values = tuple(struts)
+    if _last_struts.get(xid) == values:
+        return
+    xlib = _load_xlib()
+    xdisplay_ptr = _xdisplay_pointer(GdkX11.X11Display.get_default())
+    atom_partial, atom_strut, xa_cardinal = _intern_atoms(xdisplay_ptr)
+    xdisplay = ctypes.c_void_p(xdisplay_ptr)
+
+    arr12 = _STRUT_PARTIAL_BUF
+    arr4 = _STRUT_BUF
+    arr12[:] = struts
+    arr4[:] = struts[:4]
 
     xlib.XChangeProperty(
         xdisplay, xid, atom_partial, xa_cardinal, 32, 0, ctypes.byref(arr12), 12
@@ -133,6 +193,7 @@ def set_struts(gdk_window: GdkX11.X11Window, struts: list[int]) -> None:
         xdisplay, xid, atom_strut, xa_cardinal, 32, 0, ctypes.byref(arr4), 4
     )
     xlib.XFlush(xdisplay)
+    _last_struts[xid] = values
 
 
 def compute_struts(
@@ -151,30 +212,17 @@ def compute_struts(
     All inputs are in logical pixels; outputs are physical pixels
     (multiplied by scale).
     """
-    #   Index:  0     1      2    3       4..5          6..7
-    #           left  right  top  bottom  left_start/end_y  right_start/end_y
-    #   Index:  8..9            10..11
-    #           top_start/end_x  bottom_start/end_x
-    idx_edge = {
-        Position.LEFT: 0,
-        Position.RIGHT: 1,
-        Position.TOP: 2,
-        Position.BOTTOM: 3,
-    }
-    idx_start = {
-        Position.LEFT: 4,
-        Position.RIGHT: 6,
-        Position.TOP: 8,
-        Position.BOTTOM: 10,
-    }
+    idx_edge, idx_start = _STRUT_INDICES[position]
 
     # Gap between monitor edge and logical screen edge (multi-monitor)
-    gap = {
-        Position.BOTTOM: screen_h - monitor_y - monitor_h,
-        Position.TOP: monitor_y,
-        Position.LEFT: monitor_x,
-        Position.RIGHT: screen_w - monitor_x - monitor_w,
-    }
+    if position == Position.BOTTOM:
+        gap = screen_h - monitor_y - monitor_h
+    elif position == Position.TOP:
+        gap = monitor_y
+    elif position == Position.LEFT:
+        gap = monitor_x
+    else:
+        gap = screen_w - monitor_x - monitor_w
 
     # Monitor span along the axis parallel to the dock edge
     horizontal = position in (Position.TOP, Position.BOTTOM)
@@ -184,9 +232,9 @@ def compute_struts(
     )
 
     struts = [0] * 12
-    struts[idx_edge[position]] = int((dock_height + gap[position]) * scale)
-    struts[idx_start[position]] = span_start
-    struts[idx_start[position] + 1] = span_end
+    struts[idx_edge] = int((dock_height + gap) * scale)
+    struts[idx_start] = span_start
+    struts[idx_start + 1] = span_end
     return struts
 
 
@@ -213,5 +261,14 @@ def set_dock_struts(
 
 
 def clear_struts(gdk_window: GdkX11.X11Window) -> None:
-    """Remove strut reservation by setting all struts to zero."""
+    """Remove strut reservation by setting all struts to zero.
+
+    Always reaches the X server, even if zeros were the last values written.
+    """
+    forget_struts(gdk_window=gdk_window)
     set_struts(gdk_window=gdk_window, struts=[0] * 12)
+
+
+def forget_struts(gdk_window: GdkX11.X11Window) -> None:
+    """Drop the remembered struts for a window, e.g. before it is unrealized."""
+    _last_struts.pop(gdk_window.get_xid(), None)
@@ -2,36 +2,43 @@
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING, Any
 
 import gi
 
 gi.require_version("Wnck", "3.0")
 gi.require_version("Gtk", "3.0")
-from gi.repository import GLib, Gtk, Wnck  # noqa: E402
+from gi.repository import Gio, GLib, Gtk, Wnck  # noqa: E402
 
 from docking.platform.launcher import DESKTOP_SUFFIX, GNOME_APP_PREFIX
 
+# Never treated as app windows. Checked before any WM_CLASS query: Caja's
+# desktop window can segfault on those, and docks are not apps.
+_SKIPPED_WINDOW_TYPES = (Wnck.WindowType.DESKTOP, Wnck.WindowType.DOCK)
 
-def _wm_class_desktop_candidates(class_lower: str) -> list[str]:
+
+@functools.lru_cache(maxsize=256)
+def _wm_class_desktop_candidates(class_lower: str) -> tuple[str, ...]:
     """Generate desktop ID candidates from a lowercased WM_CLASS.
 
     Handles apps whose WM_CLASS contains spaces (e.g. "mongodb compass",
-    "aws vpn client") by trying hyphenated and no-space variants.
-    Returns a deduplicated list of candidates to try.
+    "aws vpn client") by trying hyphenated and no-space variants. The three
+    variants are always distinct when a space is present, so no dedup pass
+    is needed; results are memoized since the same classes recur per scan.
     """
-    candidates = [class_lower]
-    if " " in class_lower:
-        candidates.append(class_lower.replace(" ", "-"))
-        candidates.append(class_lower.replace(" ", ""))
-    # Deduplicate while preserving order
-    seen: set[str] = set()
-    return [c for c in candidates if not (c in seen or seen.add(c))]
+    if " " not in class_lower:
+        return (class_lower,)
+    return (
+        class_lower,
+        class_lower.replace(" ", "-"),
+        class_lower.replace(" ", ""),
+    )
 
 
 if TYPE_CHECKING:
     from docking.platform.launcher import Launcher
-    from docking.platform.model import DockModel
+    from docking.platform.model import DockItem, DockModel
 
 
 class WindowTracker:
@@ -42,21 +49,52 @@ class WindowTracker:
         self._launcher = launcher
         self._screen: Wnck.Screen | None = None
         self._wm_class_to_desktop: dict[str, str] = {}
-        # Latest known window XIDs per desktop_id from _update_running().
-        # Preview/toggle paths use this cache to avoid rematching WM_CLASS
-        # during hover-time UI events.
-        self._running_xids_by_desktop: dict[str, list[int]] = {}
+        # Window XIDs per desktop_id from the latest _update_running() scan.
+        # Preview/toggle paths read this instead of rematching WM_CLASS during
+        # hover-time UI events. Rescans are deferred to idle, so a window may
+        # close after the scan; XIDs are resolved against the live window
+        # list on use rather than holding on to Wnck.Window objects.
+        self._xids_by_desktop: dict[str, list[int]] = {}
+        # Casefolded WM_CLASS names that no .desktop file resolves to. Wnck
+        # rescans on every window event, so without this foreign windows
+        # re-run the Gio lookups each time. Cleared when dock items or the
+        # installed applications change.
+        self._unresolved: set[str] = set()
+        self._item_wm_classes: dict[str, str] = {}
+        self._mapped_items: list[DockItem] | None = None
+        # True while an idle rescan is queued for a burst of Wnck signals
+        self._update_pending = False
 
         self._build_wm_class_map()
+        self._app_monitor = Gio.AppInfoMonitor.get()
+        self._app_monitor.connect("changed", self._on_apps_changed)
         # Defer screen init to after GTK is ready
         GLib.idle_add(self._init_screen)
 
     def _build_wm_class_map(self) -> None:
-        """Build reverse map from WM_CLASS -> desktop_id for pinned items."""
+        """Build reverse map from WM_CLASS -> desktop_id for pinned items.
+
+        The model returns the same cached visible list until it mutates, so
+        an unchanged list means the map (including classes resolved through
+        Gio since the last rebuild) is still valid and is kept as is.
+        """
+        items = self._model.visible_items()
+        if items is self._mapped_items:
+            return
+        self._mapped_items = items
+        mapping = {
+            item.wm_class.casefold(): item.desktop_id for item in items if item.wm_class
+        }
+        if mapping != self._item_wm_classes:
+            # A new item may claim a class previously recorded as unresolved
+            self._item_wm_classes = mapping
+            self._unresolved.clear()
         self._wm_class_to_desktop.clear()
-        for item in self._model.visible_items():
-            if item.wm_class:
-                self._wm_class_to_desktop[item.wm_class.lower()] = item.desktop_id
+        self._wm_class_to_desktop.update(mapping)
+
+    def _on_apps_changed(self, _monitor: Gio.AppInfoMonitor) -> None:
+        """Installed .desktop files changed; retry previously unresolved classes."""
+        self._unresolved.clear()
 
     def _init_screen(self) -> bool:
         """Initialize Wnck screen and connect signals."""
@@ -74,8 +112,21 @@ class WindowTracker:
         return False
 
     def _on_window_changed(self, _screen: Wnck.Screen, *_args: Any) -> None:
-        """Called when any window state changes."""
+        """Called when any window state changes.
+
+        Opening or closing a window fires several of these signals in the
+        same main-loop iteration; one idle rescan services the whole burst.
+        """
+        if self._update_pending:
+            return
+        self._update_pending = True
+        GLib.idle_add(self._flush_update)
+
+    def _flush_update(self) -> bool:
+        """Run the coalesced rescan scheduled by _on_window_changed."""
+        self._update_pending = False
         self._update_running()
+        return False
 
     def _update_running(self) -> None:
         """Scan all windows and update the dock model."""
@@ -91,78 +142,90 @@ class WindowTracker:
         active_xid = active_window.get_xid() if active_window else 0
 
         # {desktop_id: {"count": n, "active": bool, "urgent": bool,
-        #               "windows": [...], "xids": [...]}}
+        #               "windows": [...]}}
         running: dict[str, dict[str, Any]] = {}
 
+        is_app_window = self._is_app_window
         for window in self._screen.get_windows():
-            window_type = window.get_window_type()
-            if window_type in (Wnck.WindowType.DESKTOP, Wnck.WindowType.DOCK):
-                continue
-            if window.is_skip_tasklist():
+            if not is_app_window(window=window):
                 continue
 
             desktop_id = self._match_window(window=window)
             if desktop_id is None:
                 continue
 
-            if desktop_id not in running:
-                running[desktop_id] = {
+            # One hash lookup per window; mutate the entry through a local
+            entry = running.get(desktop_id)
+            if entry is None:
+                entry = running[desktop_id] = {
                     "count": 0,
                     "active": False,
                     "urgent": False,
                     "windows": [],
-                    "xids": [],
                 }
 
-            xid = window.get_xid()
-            running[desktop_id]["count"] += 1
-            running[desktop_id]["windows"].append(window)
-            running[desktop_id]["xids"].append(xid)
-            if xid == active_xid:
-                running[desktop_id]["active"] = True
+            entry["count"] += 1
+            entry["windows"].append(window)
+            if window.get_xid() == active_xid:
+                entry["active"] = True
             if window.needs_attention():
-                running[desktop_id]["urgent"] = True
+                entry["urgent"] = True
 
-        self._running_xids_by_desktop = {
-            desktop_id: list(info.get("xids", []))
+        self._xids_by_desktop = {
+            desktop_id: [window.get_xid() for window in info["windows"]]
             for desktop_id, info in running.items()
         }
+
         self._model.update_running(running)
 
+    @staticmethod
+    def _is_app_window(window: Wnck.Window) -> bool:
+        """Whether a window belongs in the dock (not desktop/dock/skip-tasklist)."""
+        return (
+            window.get_window_type() not in _SKIPPED_WINDOW_TYPES
+            and not window.is_skip_tasklist()
+        )
+
     def _match_window(self, window: Wnck.Window) -> str | None:
         """Match a window to a desktop_id via WM_CLASS."""
         class_group = window.get_class_group_name()
         if not class_group:
             return None
 
-        class_lower = class_group.lower()
+        # Keys are casefolded, matching DockModel.find_by_wm_class
+        class_key = class_group.casefold()
 
         # Direct match
-        if class_lower in self._wm_class_to_desktop:
-            return self._wm_class_to_desktop[class_lower]
+        if class_key in self._wm_class_to_desktop:
+            return self._wm_class_to_desktop[class_key]
 
         # Try matching class instance name
         class_instance = window.get_class_instance_name()
         if class_instance:
-            inst_lower = class_instance.lower()
-            if inst_lower in self._wm_class_to_desktop:
-                return self._wm_class_to_desktop[inst_lower]
+            inst_key = class_instance.casefold()
+            if inst_key in self._wm_class_to_desktop:
+                return self._wm_class_to_desktop[inst_key]
+
+        if class_key in self._unresolved:
+            return None
 
-        # Try to resolve via Gio: exact, hyphenated, no-spaces variants
-        for candidate in _wm_class_desktop_candidates(class_lower=class_lower):
+        # Try to resolve via Gio: exact, hyphenated, no-spaces variants.
+        # Desktop file names are plain lowercase, not casefolded ("ß" stays)
+        for candidate in _wm_class_desktop_candidates(class_lower=class_group.lower()):
             desktop_id = f"{candidate}{DESKTOP_SUFFIX}"
             info = self._launcher.resolve(desktop_id)
             if info:
-                self._wm_class_to_desktop[class_lower] = info.desktop_id
+                self._wm_class_to_desktop[class_key] = info.desktop_id
                 return info.desktop_id
 
         # Try with org.gnome prefix
         gnome_id = f"{GNOME_APP_PREFIX}{class_group}{DESKTOP_SUFFIX}"
         info = self._launcher.resolve(gnome_id)
         if info:
-            self._wm_class_to_desktop[class_lower] = info.desktop_id
+            self._wm_class_to_desktop[class_key] = info.desktop_id
             return info.desktop_id
 
+        self._unresolved.add(class_key)
         return None
 
     def get_windows_for(self, desktop_id: str) -> list[Wnck.Window]:
@@ -177,8 +240,13 @@ class WindowTracker:
             window.unminimize(timestamp)
         window.activate(timestamp)
 
-    def toggle_focus(self, desktop_id: str) -> None:
-        """Focus or minimize windows for a desktop_id (smart focus)."""
+    def toggle_focus(self, desktop_id: str, timestamp: int = 0) -> None:
+        """Focus or minimize windows for a desktop_id (smart focus).
+
+        timestamp is the X server time of the triggering click; callers
+        running outside the event handler pass it since there is no
+        current event to read it from then.
+        """
         if self._screen is None:
             return
 
@@ -194,7 +262,7 @@ class WindowTracker:
                 w.minimize()
         else:
             # Activate the most recent window
-            timestamp = Gtk.get_current_event_time() or 0
+            timestamp = timestamp or Gtk.get_current_event_time() or 0
             windows[0].activate(timestamp)
 
     def close_all(self, desktop_id: str) -> None:
@@ -204,29 +272,21 @@ class WindowTracker:
             w.close(timestamp)
 
     def _get_windows_for(self, desktop_id: str) -> list[Wnck.Window]:
-        """Get windows for desktop_id using cached XIDs from last scan.
+        """Get live windows for desktop_id using XIDs from the last scan.
 
         This avoids rematching WM_CLASS in hover/preview paths, which can
-        race with native Wnck object lifetime transitions.
+        race with native Wnck object lifetime transitions. Windows that
+        closed since the scan are not in the live list and are skipped.
         """
         if self._screen is None:
             return []
-
-        # Build current XID -> window map from live screen windows.
-        by_xid: dict[int, Wnck.Window] = {}
-        for window in self._screen.get_windows():
-            window_type = window.get_window_type()
-            # Skip DESKTOP/DOCK types -- Caja's desktop window can segfault on
-            # WM_CLASS queries, and docks should never appear as app windows.
-            if window_type in (Wnck.WindowType.DESKTOP, Wnck.WindowType.DOCK):
-                continue
-            if window.is_skip_tasklist():
-                continue
-            by_xid[window.get_xid()] = window
-
-        result: list[Wnck.Window] = []
-        for xid in self._running_xids_by_desktop.get(desktop_id, []):
-            window = by_xid.get(xid)
-            if window is not None:
-                result.append(window)
-        return result
+        xids = self._xids_by_desktop.get(desktop_id)
+        if not xids:
+            return []
+        is_app_window = self._is_app_window
+        by_xid = {
+            window.get_xid(): window
+            for window in self._screen.get_windows()
+            if is_app_window(window=window)
+        }
+        return [by_xid[xid] for xid in xids if xid in by_xid]
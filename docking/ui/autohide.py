@@ -5,6 +5,7 @@ from __future__ import annotations
 import enum
 from typing import TYPE_CHECKING
 
+from docking.core.position import is_horizontal
 from docking.log import get_logger
 
 log = get_logger(name="autohide")
@@ -12,14 +13,12 @@ log = get_logger(name="autohide")
 import gi
 
 gi.require_version("Gtk", "3.0")
-from gi.repository import GLib  # noqa: E402
+from gi.repository import Gdk, GLib, Gtk  # noqa: E402
 
 if TYPE_CHECKING:
     from docking.core.config import Config
     from docking.ui.dock_window import DockWindow
 
-FRAME_INTERVAL_MS = 16  # ~60fps
-
 
 class HideState(enum.Enum):
     VISIBLE = "visible"
@@ -38,29 +37,31 @@ def ease_out_cubic(t: float) -> float:
     return 1.0 - (1.0 - t) ** 3
 
 
-def _source_exists(source_id: int) -> bool:
-    """Return True when a GLib source id is still active."""
-    if source_id <= 0:
-        return False
-    try:
-        ctx = GLib.MainContext.default()
-        return bool(ctx and ctx.find_source_by_id(source_id))
-    except Exception as exc:
-        log.debug("Could not query GLib source id %s: %s", source_id, exc)
-        # If runtime doesn't expose the check, fall back to best effort.
-        return True
-
-
-def _clear_source(source_id: int) -> int:
-    """Safely remove a GLib source if it still exists and return zero id."""
-    if _source_exists(source_id=source_id):
-        GLib.source_remove(source_id)
-    return 0
+# Animating states -> (end state, end offset)
+_ANIMATIONS: dict[HideState, tuple[HideState, float]] = {
+    HideState.HIDING: (HideState.HIDDEN, 1.0),
+    HideState.SHOWING: (HideState.VISIBLE, 0.0),
+}
 
 
 class AutoHideController:
     """Manages dock hide/show animation with configurable delays."""
 
+    # Touched on every animation frame; slots keep these off a per-instance dict
+    __slots__ = (
+        "_window",
+        "_config",
+        "state",
+        "hide_offset",
+        "zoom_progress",
+        "_hide_timer_id",
+        "_unhide_timer_id",
+        "_anim_tick_id",
+        "_anim_start_us",
+        "_anim_progress",
+        "_last_drawn_px",
+    )
+
     def __init__(self, window: DockWindow, config: Config) -> None:
         self._window = window
         self._config = config
@@ -70,8 +71,11 @@ class AutoHideController:
 
         self._hide_timer_id: int = 0
         self._unhide_timer_id: int = 0
-        self._anim_timer_id: int = 0
+        self._anim_tick_id: int = 0
+        self._anim_start_us: int = 0
         self._anim_progress: float = 0.0
+        # Cross-axis pixel offset of the last frame that queued a redraw
+        self._last_drawn_px: int = -1
 
     @property
     def enabled(self) -> bool:
@@ -81,8 +85,7 @@ class AutoHideController:
         """Force dock visible -- call when auto-hide is toggled off."""
         self._cancel_hide_timer()
         self._cancel_unhide_timer()
-        if self._anim_timer_id:
-            self._anim_timer_id = _clear_source(source_id=self._anim_timer_id)
+        self._cancel_animation()
         self.state = HideState.VISIBLE
         self.hide_offset = 0.0
         self.zoom_progress = 0.0
@@ -136,10 +139,26 @@ class AutoHideController:
         return False
 
     def _start_animation(self) -> None:
-        """Start the animation tick loop."""
-        if self._anim_timer_id:
-            self._anim_timer_id = _clear_source(source_id=self._anim_timer_id)
-        self._anim_timer_id = GLib.timeout_add(FRAME_INTERVAL_MS, self._animation_tick)
+        """Start the animation tick loop on the drawing area's frame clock."""
+        self._cancel_animation()
+        if self._config.hide_time_ms <= 0:
+            # Animation disabled: land on the end state without a frame tick
+            end_state, end_offset = _ANIMATIONS[self.state]
+            self.state = end_state
+            self.hide_offset = end_offset
+            self.zoom_progress = 1.0 - end_offset
+            self._window.queue_redraw()
+            return
+        self._anim_start_us = 0
+        self._last_drawn_px = -1
+        self._anim_tick_id = self._window.drawing_area.add_tick_callback(
+            self._on_frame_tick
+        )
+
+    def _cancel_animation(self) -> None:
+        if self._anim_tick_id:
+            self._window.drawing_area.remove_tick_callback(self._anim_tick_id)
+            self._anim_tick_id = 0
 
     # Autohide state machine:
     #
@@ -156,62 +175,84 @@ class AutoHideController:
     # SHOWING: hide_offset animates 1->0 using ease_out_cubic (decelerating)
     # VISIBLE/HIDDEN: stable states, no animation running
     #
-    # Each animation frame advances _anim_progress by a fixed step
-    # (FRAME_INTERVAL_MS / hide_time_ms), giving consistent timing
-    # regardless of how many frames actually render.
+    # Frames are driven by the GDK frame clock rather than a GLib timeout,
+    # so ticks land on vsync and _anim_progress is the real elapsed time
+    # since the first frame divided by hide_time_ms. A late or dropped frame
+    # therefore never stretches the animation.
+
+    def _on_frame_tick(self, _widget: Gtk.Widget, frame_clock: Gdk.FrameClock) -> bool:
+        """Frame-clock callback: derive progress from the frame timestamp."""
+        now_us = frame_clock.get_frame_time()
+        if not self._anim_start_us:
+            self._anim_start_us = now_us
+        duration_us = self._config.hide_time_ms * 1000
+        if duration_us > 0:
+            elapsed_us = now_us - self._anim_start_us
+            self._anim_progress = min(1.0, elapsed_us / duration_us)
+        else:
+            self._anim_progress = 1.0
+        if self._animation_tick():
+            return True
+        self._anim_tick_id = 0
+        return False
 
     def _animation_tick(self) -> bool:
-        """Single animation frame."""
-        duration = self._config.hide_time_ms
-        step = FRAME_INTERVAL_MS / duration if duration > 0 else 1.0
-        self._anim_progress = min(1.0, self._anim_progress + step)
+        """Apply one animation frame at the current _anim_progress.
+
+        Returns False once the animation has reached its terminal state.
+        """
+        animation = _ANIMATIONS.get(self.state)
+        if animation is None:
+            return False
+        end_state, end_offset = animation
 
         if self.state == HideState.HIDING:
             self.hide_offset = ease_in_cubic(t=self._anim_progress)
-            # Zoom progress decay -- smooth zoom fadeout during hide.
-            #
-            # As the dock slides down (hide_offset goes 0.0 -> 1.0), we
-            # simultaneously decay the zoom effect. The formula:
-            #   zoom_progress *= (1.0 - hide_offset)
-            #
-            # This is a multiplicative decay that couples zoom to the
-            # hide animation. Early in the hide (hide_offset ≈ 0.1),
-            # zoom_progress drops by ~10%. Late in the hide
-            # (hide_offset ≈ 0.9), it drops rapidly toward zero.
-            #
-            # The visual effect: icons gradually shrink back to their
-            # rest size AS the dock slides away, rather than snapping
-            # to unzoomed before the slide starts.
-            # Plank's formula: direct linear decay, not compounding.
-            # zoom_in_progress = zoom_progress * (1 - hide_progress)
-            # We keep zoom_progress at its initial value (set to 1.0 on
-            # mouse_enter) and let the renderer apply the decay.
-            self.zoom_progress = 1.0 - self.hide_offset
-            if self._anim_progress >= 1.0:
-                self.state = HideState.HIDDEN
-                self.hide_offset = 1.0
-                self.zoom_progress = 0.0
-                self._anim_timer_id = 0
-                self._window.queue_redraw()
-                return False
-
-        elif self.state == HideState.SHOWING:
+        else:
             self.hide_offset = 1.0 - ease_out_cubic(t=self._anim_progress)
-            self.zoom_progress = 1.0 - self.hide_offset
-            if self._anim_progress >= 1.0:
-                self.state = HideState.VISIBLE
-                self.hide_offset = 0.0
-                self._anim_timer_id = 0
-                self._window.queue_redraw()
-                return False
-
-        self._window.queue_redraw()
+        # Zoom progress decay -- smooth zoom fadeout during hide.
+        #
+        # As the dock slides down (hide_offset goes 0.0 -> 1.0), we
+        # simultaneously decay the zoom effect, and ramp it back up while
+        # showing. The visual effect: icons gradually shrink back to their
+        # rest size AS the dock slides away, rather than snapping to
+        # unzoomed before the slide starts.
+        # Plank's formula: direct linear decay, not compounding.
+        # zoom_in_progress = zoom_progress * (1 - hide_progress)
+        # We keep zoom_progress at its initial value (set to 1.0 on
+        # mouse_enter) and let the renderer apply the decay.
+        self.zoom_progress = 1.0 - self.hide_offset
+        if self._anim_progress >= 1.0:
+            self.state = end_state
+            self.hide_offset = end_offset
+            self.zoom_progress = 1.0 - end_offset
+            self._window.queue_redraw()
+            return False
+
+        # Near the ends of the cubic curves consecutive frames often move the
+        # dock by less than a pixel; only repaint when the offset changes.
+        px = self._offset_px()
+        if px != self._last_drawn_px:
+            self._last_drawn_px = px
+            self._window.queue_redraw()
         return True
 
+    def _offset_px(self) -> int:
+        """hide_offset in whole pixels along the window's cross axis."""
+        width, height = self._window.get_size()
+        cross = height if is_horizontal(pos=self._config.pos) else width
+        return round(self.hide_offset * cross)
+
+    # Timer ids are only nonzero while their source is live: the delay
+    # callbacks zero them before returning False, so cancelling never needs
+    # to probe the main context.
+
     def _cancel_hide_timer(self) -> None:
         if self._hide_timer_id:
-            self._hide_timer_id = _clear_source(source_id=self._hide_timer_id)
+            GLib.source_remove(self._hide_timer_id)
+            self._hide_timer_id = 0
 
     def _cancel_unhide_timer(self) -> None:
         if self._unhide_timer_id:
-            self._unhide_timer_id = _clear_source(source_id=self._unhide_timer_id)
+            GLib.source_remove(self._unhide_timer_id)
+            self._unhide_timer_id = 0
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-from typing import TYPE_CHECKING
+import bisect
+import functools
+import logging
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 from urllib.parse import unquote, urlparse
 
 from docking.log import get_logger
@@ -29,7 +34,8 @@ if TYPE_CHECKING:
     from docking.ui.dock_window import DockWindow
     from docking.ui.renderer import DockRenderer
 
-DRAG_ICON_SCALE = 1.2  # dragged icon shown at this multiplier of icon_size
+DRAG_ICON_CACHE_SIZE = 32  # scaled drag icons kept, oldest evicted first
+SAVE_DEBOUNCE_MS = 500  # config writes from drags/drops within this share one
 
 # DnD target formats:
 # - dock-item-index: internal reorder (SAME_WIDGET only, info=0)
@@ -39,10 +45,66 @@ _DOCK_ITEM_TARGET = Gtk.TargetEntry.new(
 )
 _URI_TARGET = Gtk.TargetEntry.new("text/uri-list", 0, 1)
 
+# Resolves the .desktop files of multi-file drops in parallel. Gio's
+# DesktopAppInfo parsing is thread-safe; icon loading goes through
+# Gtk.IconTheme, which is not, so that stays on the main thread.
+_RESOLVE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="dnd-resolve")
+
+
+@functools.lru_cache(maxsize=256)
+def _uri_to_desktop_id_cached(uri: str) -> str | None:
+    """Memoized body of DnDHandler._uri_to_desktop_id.
+
+    File managers drop host-less "file:///..." URIs with no query or
+    fragment; those are sliced directly, and an absolute path has no scheme
+    to check. Anything else goes through urlparse so query/fragment
+    stripping and the scheme check stay exact.
+    """
+    if uri.startswith("file:///") and "?" not in uri and "#" not in uri:
+        path_str = uri[7:]
+        if "%" in path_str:
+            path_str = unquote(path_str)
+    elif uri.startswith("/"):
+        path_str = uri
+    else:
+        parsed = urlparse(uri)
+        if parsed.scheme == "file":
+            path_str = unquote(parsed.path)
+        elif parsed.scheme == "" and uri.endswith(".desktop"):
+            path_str = uri
+        else:
+            return None
+
+    name = os.path.basename(path_str)
+    return name if name.endswith(".desktop") else None
+
 
 class DnDHandler:
     """Manages drag-and-drop reordering and external .desktop drops."""
 
+    # Read on every drag-motion event; slots keep these off a per-instance dict
+    __slots__ = (
+        "_window",
+        "_model",
+        "_config",
+        "_renderer",
+        "_theme",
+        "_launcher",
+        "drag_index",
+        "_drag_from",
+        "drop_insert_index",
+        "_drop_pending",
+        "_autohide_entered",
+        "_drag_centers",
+        "_drag_centers_key",
+        "_drag_horizontal",
+        "_pending_new_index",
+        "_reorder_scheduled",
+        "_drag_icon_cache",
+        "_drag_icon_cache_size",
+        "_save_timer_id",
+    )
+
     def __init__(
         self,
         window: DockWindow,
@@ -62,6 +124,30 @@ class DnDHandler:
         self.drag_index: int = -1
         self._drag_from: int = -1
         self.drop_insert_index: int = -1  # for external drops: where to insert
+        # True between drag-drop requesting URI data and drag-data-received
+        self._drop_pending: bool = False
+        # True once this drag has told autohide the cursor entered; reset on
+        # drag-leave/drag-end, the only points the cursor can leave again
+        self._autohide_entered: bool = False
+        # Unzoomed icon centers along the main axis and the inputs they were
+        # computed from (the model's cached visible list plus the sizes that
+        # feed compute_layout); drag-motion bisects these instead of
+        # rebuilding the layout on every event
+        self._drag_centers: list[int] = []
+        self._drag_centers_key: tuple[Any, ...] | None = None
+        self._drag_horizontal: bool = True
+        # Latest reorder target from drag-motion, applied once per main-loop
+        # iteration by _flush_reorder (-1 = nothing pending)
+        self._pending_new_index: int = -1
+        self._reorder_scheduled: bool = False
+        # Scaled drag icons keyed by (id(source pixbuf), size). The source is
+        # stored alongside so a recycled id never returns another icon.
+        self._drag_icon_cache: dict[
+            tuple[int, int], tuple[GdkPixbuf.Pixbuf, GdkPixbuf.Pixbuf]
+        ] = {}
+        self._drag_icon_cache_size: int = 0
+        # Pending debounced config write (0 = none scheduled)
+        self._save_timer_id: int = 0
 
         self._setup_dnd()
 
@@ -119,6 +205,11 @@ class DnDHandler:
         dragged item, stores its index in drag_index/_drag_from, and
         sets a scaled pixbuf as the drag icon.
         """
+        # The hit test needs the zoomed layout the user sees, while motion
+        # bisects rest-state centers; those differ, so rather than sharing a
+        # layout the centers are rebuilt here, ahead of the first motion event
+        self._reset_layout_centers()
+        self._layout_centers()
         items = self._model.visible_items()
         local_cx = self._window.local_cursor_main()
         layout = compute_layout(
@@ -130,32 +221,41 @@ class DnDHandler:
         )
 
         offset = self._window.zoomed_main_offset(layout)
-        horizontal = is_horizontal(pos=self._config.pos)
-        win_cx = self._window.cursor_x if horizontal else self._window.cursor_y
-        log.debug(
-            "drag-begin: win_cx=%.1f local_cx=%.1f offset=%.1f items=%d",
-            win_cx,
-            local_cx,
-            offset,
-            len(items),
-        )
-        for i, li in enumerate(layout):
-            icon_width = li.scale * self._config.icon_size
-            left = li.x + offset
-            right = left + icon_width
+        if self._drag_horizontal:
+            win_cx = self._window.cursor_x
+        else:
+            win_cx = self._window.cursor_y
+        # Checked once: the per-icon trace below would otherwise build its
+        # argument tuple for every icon even at the default WARNING level
+        debug = log.isEnabledFor(logging.DEBUG)
+        if debug:
             log.debug(
-                "  item %d: left=%.1f right=%.1f (win_cx=%.1f)", i, left, right, win_cx
+                "drag-begin: win_cx=%.1f local_cx=%.1f offset=%.1f items=%d",
+                win_cx,
+                local_cx,
+                offset,
+                len(items),
             )
+        base_icon_size = self._config.icon_size
+        for i, li in enumerate(layout):
+            left = li.x + offset
+            right = left + li.scale * base_icon_size
+            if debug:
+                log.debug(
+                    "  item %d: left=%.1f right=%.1f (win_cx=%.1f)",
+                    i,
+                    left,
+                    right,
+                    win_cx,
+                )
             if left <= win_cx <= right:
                 self._drag_from = i
                 self.drag_index = i
 
                 item = items[i]
                 if item.icon:
-                    icon_size = int(self._config.icon_size * DRAG_ICON_SCALE)
-                    scaled = item.icon.scale_simple(
-                        icon_size, icon_size, GdkPixbuf.InterpType.BILINEAR
-                    )
+                    icon_size = self._config.drag_icon_size
+                    scaled = self._drag_icon(icon=item.icon, icon_size=icon_size)
                     if scaled:
                         Gtk.drag_set_icon_pixbuf(
                             context, scaled, icon_size // 2, icon_size // 2
@@ -164,6 +264,25 @@ class DnDHandler:
                 return
         log.debug("  -> no item matched")
 
+    def _drag_icon(
+        self, icon: GdkPixbuf.Pixbuf, icon_size: int
+    ) -> GdkPixbuf.Pixbuf | None:
+        """Return icon scaled for dragging, resampling once per icon and size."""
+        cache = self._drag_icon_cache
+        if icon_size != self._drag_icon_cache_size:
+            cache.clear()
+            self._drag_icon_cache_size = icon_size
+        key = (id(icon), icon_size)
+        hit = cache.get(key)
+        if hit is not None and hit[0] is icon:
+            return hit[1]
+        scaled = icon.scale_simple(icon_size, icon_size, GdkPixbuf.InterpType.BILINEAR)
+        if scaled:
+            if len(cache) >= DRAG_ICON_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[key] = (icon, scaled)
+        return scaled
+
     def _on_drag_motion(
         self,
         widget: Gtk.DrawingArea,
@@ -192,60 +311,136 @@ class DnDHandler:
         # user drags a .desktop file toward the dock to add it.
         #
         # To fix this, we explicitly call autohide.on_mouse_enter() from
-        # the drag-motion handler, which IS delivered during DnD.
-        if self._window.autohide:
+        # the drag-motion handler, which IS delivered during DnD. Once per
+        # entry is enough: nothing can start hiding again before drag-leave.
+        if not self._autohide_entered and self._window.autohide:
+            self._autohide_entered = True
             self._window.autohide.on_mouse_enter()
-        main_coord = x if is_horizontal(pos=self._config.pos) else y
+        centers = self._layout_centers()
+        main_coord = x if self._drag_horizontal else y
 
         if self._drag_from < 0:
-            # External drag -- compute insert position for gap effect
-            items = self._model.visible_items()
-            layout = compute_layout(
-                items,
-                self._config,
-                -1.0,
-                item_padding=self._theme.item_padding,
-                h_padding=self._theme.h_padding,
-            )
-            main_offset = self._window.zoomed_main_offset(layout)
-            insert = len(layout)
-            for i, li in enumerate(layout):
-                center = li.x + main_offset + self._config.icon_size / 2
-                if main_coord < center:
-                    insert = i
-                    break
+            # External drag -- insert before the first icon whose center lies
+            # past the cursor, rendered as a gap
+            insert = bisect.bisect_right(centers, main_coord)
             if insert != self.drop_insert_index:
                 self.drop_insert_index = insert
                 widget.queue_draw()
             Gdk.drag_status(context, Gdk.DragAction.COPY, time)
             return True
 
-        items = self._model.visible_items()
-        layout = compute_layout(
-            items,
-            self._config,
-            -1.0,
-            item_padding=self._theme.item_padding,
-            h_padding=self._theme.h_padding,
-        )
+        # Most motion events stay between the centers around the dragged
+        # slot, which is exactly when the bisect below would return it
+        index = self.drag_index
+        last = len(centers) - 1
+        if (
+            0 <= index <= last
+            and (index == 0 or centers[index - 1] <= main_coord)
+            and (index == last or main_coord < centers[index])
+        ):
+            new_index = index
+        else:
+            new_index = min(bisect.bisect_right(centers, main_coord), last)
+
+        # Motion events can outpace frames; only the last target of a burst
+        # reaches the model
+        self._pending_new_index = new_index
+        if new_index != self.drag_index and not self._reorder_scheduled:
+            self._reorder_scheduled = True
+            GLib.idle_add(self._flush_reorder)
+
+        # No redraw here: the reorder redraws through the model's change
+        # notification when it lands, and the window's slide pump keeps
+        # frames coming until the icons have slid into place. Motion events
+        # beyond one per frame are thereby dropped instead of each
+        # repainting.
+        Gdk.drag_status(context, Gdk.DragAction.MOVE, time)
+        return True
 
-        main_offset = self._window.zoomed_main_offset(layout)
-        new_index = len(layout) - 1
-        for i, li in enumerate(layout):
-            center = li.x + main_offset + self._config.icon_size / 2
-            if main_coord < center:
-                new_index = i
-                break
+    def _flush_reorder(self) -> bool:
+        """Idle callback: apply the pending drag-motion reorder."""
+        self._reorder_scheduled = False
+        self._apply_pending_reorder()
+        return False
 
-        if new_index != self.drag_index:
-            log.debug("drag-motion: reorder %d -> %d", self.drag_index, new_index)
-            self._model.reorder_visible(self.drag_index, new_index)
-            self.drag_index = new_index
+    def _apply_pending_reorder(self) -> None:
+        new_index = self._pending_new_index
+        self._pending_new_index = -1
+        if self._drag_from < 0 or new_index < 0 or new_index == self.drag_index:
+            return
+        old_index = self.drag_index
+        log.debug("drag-motion: reorder %d -> %d", old_index, new_index)
+        # The model's change notification redraws the whole dock. A damage
+        # rect for the moved strip would only clip the final blit: the
+        # renderer repaints its full offscreen frame, and the slides this
+        # reorder starts are pumped with full redraws until they settle.
+        self._model.reorder_visible(old_index, new_index)
+        self.drag_index = new_index
+
+    def _schedule_save(self) -> None:
+        """Write the config SAVE_DEBOUNCE_MS from now, once per burst.
+
+        A reorder followed by a drag-off unpin, or several drops in a row,
+        would otherwise each write dock.json synchronously.
+        """
+        if self._save_timer_id:
+            return
+        self._save_timer_id = GLib.timeout_add(SAVE_DEBOUNCE_MS, self._on_save_timeout)
 
-        Gdk.drag_status(context, Gdk.DragAction.MOVE, time)
+    def _on_save_timeout(self) -> bool:
+        self._save_timer_id = 0
+        self._config.save()
+        return False
 
-        widget.queue_draw()
-        return True
+    def flush_pending_save(self) -> None:
+        """Write a scheduled config save now -- call before exiting."""
+        if self._save_timer_id:
+            GLib.source_remove(self._save_timer_id)
+            self._on_save_timeout()
+
+    def _layout_centers(self) -> list[int]:
+        """Unzoomed icon centers for the current visible items.
+
+        Recomputed only when the model hands out a new visible list (any
+        pin/unpin/reorder does) or a layout input changes; cleared when a
+        drag ends or leaves since the window size may change between drags.
+        Also refreshes _drag_horizontal for the current position.
+        """
+        items = self._model.visible_items()
+        config, theme = self._config, self._theme
+        # Holding the list itself keeps its identity check valid; a rebuilt
+        # list with the same items compares equal and has the same layout
+        key = (
+            items,
+            config.position,
+            config.icon_size,
+            config.zoom_percent,
+            theme.item_padding,
+            theme.h_padding,
+        )
+        if key != self._drag_centers_key:
+            layout = compute_layout(
+                items,
+                config,
+                -1.0,
+                item_padding=theme.item_padding,
+                h_padding=theme.h_padding,
+            )
+            half_icon = config.icon_size / 2
+            main_offset = self._window.zoomed_main_offset(layout) + half_icon
+            # Motion coordinates are ints, and for an int n, c <= n exactly
+            # when ceil(c) <= n: rounding up keeps every comparison's result
+            # while letting them run as int compares
+            self._drag_centers = [math.ceil(li.x + main_offset) for li in layout]
+            # config.pos builds a Position enum per access; resolve it here
+            # once rather than on every motion event
+            self._drag_horizontal = is_horizontal(pos=config.pos)
+            self._drag_centers_key = key
+        return self._drag_centers
+
+    def _reset_layout_centers(self) -> None:
+        self._drag_centers = []
+        self._drag_centers_key = None
 
     def _on_drag_drop(
         self,
@@ -264,6 +459,7 @@ class DnDHandler:
             target,
         )
         if target:
+            self._drop_pending = True
             widget.drag_get_data(context, target, time)
             return True
         # No matching target (e.g. applet URI) -- clear the gap
@@ -287,6 +483,7 @@ class DnDHandler:
         acknowledges completion. External drops parse URI list, resolve
         .desktop files, and insert pinned items at the drop position.
         """
+        self._drop_pending = False
         # Internal reorder -- already handled during drag-motion
         if self._drag_from >= 0:
             log.debug("drag-data-received: internal reorder complete")
@@ -302,37 +499,68 @@ class DnDHandler:
             if text:
                 uris = [line.strip() for line in text.splitlines() if line.strip()]
 
-        added = False
+        # Build every new item first, then splice them in with one slice
+        # assignment per list instead of a mid-list insert per URI
+        desktop_ids: list[str] = []
+        seen: set[str] = set()
         for uri in uris:
             desktop_id = self._uri_to_desktop_id(uri=uri)
-            if desktop_id and not self._model.find_by_desktop_id(desktop_id):
-                resolved = self._launcher.resolve(desktop_id)
-                if resolved:
-                    icon_size = int(self._config.icon_size * self._config.zoom_percent)
-                    icon = self._launcher.load_icon(resolved.icon_name, icon_size)
-                    item = DockItem(
-                        desktop_id=desktop_id,
-                        name=resolved.name,
-                        icon_name=resolved.icon_name,
-                        wm_class=resolved.wm_class,
-                        is_pinned=True,
-                        icon=icon,
-                    )
-                    # Insert at drop position
-                    insert_at = min(insert_at, len(self._model.pinned_items))
-                    self._model.pinned_items.insert(insert_at, item)
-                    self._config.pinned.insert(insert_at, desktop_id)
-                    insert_at += 1
-                    added = True
+            if not desktop_id or desktop_id in seen:
+                continue
+            seen.add(desktop_id)
+            if not self._model.find_by_desktop_id(desktop_id):
+                desktop_ids.append(desktop_id)
+
+        resolve = self._launcher.resolve
+        if len(desktop_ids) > 1:
+            resolved_infos = list(_RESOLVE_POOL.map(resolve, desktop_ids))
+        else:
+            resolved_infos = [resolve(desktop_id) for desktop_id in desktop_ids]
+
+        # Icons are filled in afterwards by _load_dropped_icons; the renderer
+        # skips items whose icon is still None
+        new_items = [
+            DockItem(
+                desktop_id=desktop_id,
+                name=resolved.name,
+                icon_name=resolved.icon_name,
+                wm_class=resolved.wm_class,
+                is_pinned=True,
+            )
+            for desktop_id, resolved in zip(desktop_ids, resolved_infos)
+            if resolved
+        ]
 
         self.drop_insert_index = -1
+        added = bool(new_items)
         if added:
-            self._config.save()
+            # Insert at drop position
+            insert_at = min(insert_at, len(self._model.pinned_items))
+            self._model.pinned_items[insert_at:insert_at] = new_items
+            self._config.pinned[insert_at:insert_at] = [
+                item.desktop_id for item in new_items
+            ]
+            self._schedule_save()
             self._model.sync_pinned_to_config()
             self._model.notify()
+            GLib.idle_add(self._load_dropped_icons, new_items[::-1])
 
         Gtk.drag_finish(context, added, False, time)
 
+    def _load_dropped_icons(self, pending: list[DockItem]) -> bool:
+        """Idle callback: load one dropped item's icon per main-loop pass.
+
+        Gtk.IconTheme lookups must stay on the main thread, so a bulk drop
+        spreads its icon loads over idle iterations instead of blocking
+        drag-data-received. pending is in reverse drop order.
+        """
+        item = pending.pop()
+        item.icon = self._launcher.load_icon(
+            item.icon_name, self._config.zoomed_icon_size
+        )
+        self._model.notify()
+        return bool(pending)
+
     def _on_drag_leave(
         self, widget: Gtk.DrawingArea, _context: Gdk.DragContext, _time: int
     ) -> None:
@@ -340,19 +568,27 @@ class DnDHandler:
 
         GTK fires drag-leave before drag-drop, so we can't clear
         drop_insert_index here (drag-data-received still needs it).
-        Instead we schedule a deferred clear -- if a drop happens,
-        drag-data-received or drag-end will clear it first. If the
-        drag truly left (cancelled), the deferred clear closes the gap.
+        Instead we schedule a clear for the next idle iteration. drag-drop
+        is emitted in the same dispatch as this drag-leave, so by then a
+        real drop has marked its data request pending and the clear backs
+        off; if the drag truly left (cancelled), the gap closes on the
+        next frame.
         """
+        self._reset_layout_centers()
+        self._autohide_entered = False
         if self._drag_from < 0 and self.drop_insert_index >= 0:
-            GLib.timeout_add(100, self._deferred_clear_drop_gap, widget)
+            GLib.idle_add(self._deferred_clear_drop_gap, widget)
         widget.queue_draw()
         if self._window.autohide:
             self._window.autohide.on_mouse_leave()
 
     def _deferred_clear_drop_gap(self, widget: Gtk.DrawingArea) -> bool:
         """Clear stale drop gap if it wasn't consumed by a drop."""
-        if self.drop_insert_index >= 0 and self._drag_from < 0:
+        if (
+            self.drop_insert_index >= 0
+            and self._drag_from < 0
+            and not self._drop_pending
+        ):
             self.drop_insert_index = -1
             widget.queue_draw()
         return False
@@ -363,6 +599,8 @@ class DnDHandler:
         Checks if the cursor ended up beyond the icon_size threshold from
         the dock edge. If so, unpins the item and plays the poof animation.
         """
+        # A reorder still waiting for idle must land before drag_index is read
+        self._apply_pending_reorder()
         if self._drag_from >= 0:
             # Get absolute cursor position and dock window position
             display = self._window.get_display()
@@ -373,7 +611,6 @@ class DnDHandler:
             win_w, win_h = self._window.get_size()
 
             # Outside if cursor moved away from the dock edge
-            items = self._model.visible_items()
             pos = self._config.pos
             icon_sz = self._config.icon_size
             if pos == Position.BOTTOM:
@@ -396,8 +633,9 @@ class DnDHandler:
                 outside,
             )
 
-            if outside:
-                if self.drag_index >= 0 and self.drag_index < len(items):
+            if outside and self.drag_index >= 0:
+                items = self._model.visible_items()
+                if self.drag_index < len(items):
                     item = items[self.drag_index]
                     if item.is_pinned:
                         log.debug(
@@ -414,21 +652,13 @@ class DnDHandler:
         self.drag_index = -1
         self.drop_insert_index = -1
         self._drag_from = -1
-        self._config.save()
+        self._drop_pending = False
+        self._autohide_entered = False
+        self._reset_layout_centers()
+        self._schedule_save()
         widget.queue_draw()
 
     @staticmethod
     def _uri_to_desktop_id(uri: str) -> str | None:
         """Extract a .desktop ID from a file URI or path."""
-        parsed = urlparse(uri)
-        if parsed.scheme == "file":
-            path = Path(unquote(parsed.path))
-        elif parsed.scheme == "" and uri.endswith(".desktop"):
-            path = Path(uri)
-        else:
-            return None
-
-        if not path.name.endswith(".desktop"):
-            return None
-
-        return path.name
+        return _uri_to_desktop_id_cached(uri=uri)
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections.abc import Callable
+from operator import attrgetter
 from typing import TYPE_CHECKING, NamedTuple
 
 import cairo
@@ -16,7 +19,7 @@ from docking.core.position import Position, is_horizontal
 from docking.core.zoom import compute_layout, content_bounds
 from docking.log import get_logger
 from docking.platform.launcher import launch
-from docking.platform.struts import clear_struts, set_dock_struts
+from docking.platform.struts import clear_struts, forget_struts, set_dock_struts
 from docking.ui.autohide import HideState
 from docking.ui.hover import HoverManager
 from docking.ui.tooltip import TooltipManager
@@ -48,6 +51,11 @@ TRIGGER_PX = 2
 # barrier -- the mouse can overshoot into a top panel more easily.
 TRIGGER_PX_TOP = 8
 
+# Main-axis cursor movement (px) below which a motion event does not redraw.
+# Layout depends only on the main-axis cursor, so smaller moves (and any
+# cross-axis move) produce an identical frame.
+MOTION_REDRAW_EPSILON = 0.5
+
 
 class Rect(NamedTuple):
     """Rectangle with named x, y, w, h fields (input region, etc.)."""
@@ -67,6 +75,20 @@ def should_keep_cursor_on_leave(autohide_enabled: bool, preview_visible: bool) -
     return autohide_enabled or preview_visible
 
 
+# Input rect per dock edge from (window_w, window_h, offset, main, cross):
+# the rect hugs the screen edge with main along the dock's main axis
+_INPUT_RECTS: dict[Position, Callable[[int, int, int, int, int], Rect]] = {
+    Position.BOTTOM: lambda _w, h, offset, main, cross: Rect(
+        offset, h - cross, main, cross
+    ),
+    Position.TOP: lambda _w, _h, offset, main, cross: Rect(offset, 0, main, cross),
+    Position.LEFT: lambda _w, _h, offset, main, cross: Rect(0, offset, cross, main),
+    Position.RIGHT: lambda w, _h, offset, main, cross: Rect(
+        w - cross, offset, cross, main
+    ),
+}
+
+
 def compute_input_rect(
     pos: Position,
     window_w: int,
@@ -92,22 +114,24 @@ def compute_input_rect(
     # it switches to the trigger strip. During SHOWING, content rect
     # ensures the mouse stays "inside" until the dock is fully visible.
     if autohide_state == HideState.HIDDEN:
-        trigger = TRIGGER_PX_TOP if pos == Position.TOP else TRIGGER_PX
-        cross = trigger
+        cross = TRIGGER_PX_TOP if pos == Position.TOP else TRIGGER_PX
     else:
         cross = max(content_cross, 1)
-    main = max(content_w, 1)
-
-    if pos == Position.BOTTOM:
-        return Rect(content_offset, window_h - cross, main, cross)
-    elif pos == Position.TOP:
-        return Rect(content_offset, 0, main, cross)
-    elif pos == Position.LEFT:
-        return Rect(0, content_offset, cross, main)
-    else:
-        return Rect(window_w - cross, content_offset, cross, main)
+    return _INPUT_RECTS[pos](
+        window_w, window_h, content_offset, max(content_w, 1), cross
+    )
 
 
+def _run_once(func: Callable[..., object], *args: object) -> bool:
+    """GLib.idle_add callback that calls func(*args) a single time."""
+    func(*args)
+    return False
+
+
+# Zoom layouts kept per item list (one per recent cursor position), oldest
+# evicted first
+LAYOUT_CACHE_SIZE = 8
+
 # X11 mouse button codes
 MOUSE_LEFT = 1
 MOUSE_MIDDLE = 2
@@ -133,6 +157,13 @@ class DockWindow(Gtk.Window):
         self.window_tracker = window_tracker
         self.cursor_x: float = -1.0
         self.cursor_y: float = -1.0
+        # Orientation of config.pos; only changes through reposition(),
+        # which refreshes it in _position_dock
+        self._horizontal: bool = is_horizontal(pos=config.pos)
+        # Monitor the dock sits on and its geometry; None until first use
+        # and again after the monitor layout changes
+        self._monitor: Gdk.Monitor | None = None
+        self._monitor_geom: Gdk.Rectangle | None = None
         self.autohide: AutoHideController | None = None
         self._dnd: DnDHandler | None = None
         self._menu: MenuHandler | None = None
@@ -164,8 +195,10 @@ class DockWindow(Gtk.Window):
         screen = self.get_screen()
         visual = screen.get_rgba_visual() or screen.get_system_visual()
         self.set_visual(visual)
+        screen.connect("monitors-changed", self._on_monitors_changed)
 
         self.connect("realize", self._on_realize)
+        self.connect("unrealize", self._on_unrealize)
         self.connect("destroy", Gtk.main_quit)
 
     def _setup_drawing_area(self) -> None:
@@ -203,6 +236,26 @@ class DockWindow(Gtk.Window):
         self._click_y: float = -1.0
         self._click_button: int = 0
         self._last_input_rect: Rect | None = None
+        # (fully hidden, window size) the input rect was last computed for
+        self._input_region_key: tuple[bool, int, int] | None = None
+        # Main-axis cursor the last frame was rendered with
+        self._last_drawn_main: float = -1.0
+        # Frame-clock callback keeping the urgent glow animating (0 = none)
+        self._glow_tick_id: int = 0
+        # Frame-clock callback keeping reorder slides animating (0 = none)
+        self._slide_tick_id: int = 0
+        # Monotonic time the latest urgent glow ends (see
+        # _has_active_urgent_glow)
+        self._glow_until_us: int = 0
+        # Layouts by local cursor, valid for _layout_cache_key (see
+        # cached_layout)
+        self._layout_cache: dict[float, list[LayoutItem]] = {}
+        self._layout_cache_key: tuple[object, ...] | None = None
+        # zoomed_main_offset of the last layout asked for, and the window
+        # extent it was centered in
+        self._offset_layout: list[LayoutItem] | None = None
+        self._offset_main_size: int = -1
+        self._offset: float = 0.0
 
     def _connect_model(self) -> None:
         """Listen for model changes to trigger redraws."""
@@ -227,6 +280,12 @@ class DockWindow(Gtk.Window):
         self._set_struts()
         self._update_input_region()
 
+    def _on_unrealize(self, _widget: Gtk.Widget) -> None:
+        """Forget the written struts; the XID may be reused by another window."""
+        gdk_window = self.get_window()
+        if isinstance(gdk_window, GdkX11.X11Window):
+            forget_struts(gdk_window=gdk_window)
+
     def _position_dock(self) -> None:
         """Position the dock window at the configured screen edge.
 
@@ -235,9 +294,7 @@ class DockWindow(Gtk.Window):
         wobble during zoom. The cross-axis dimension accommodates the
         max zoomed icon size plus padding and bounce headroom.
         """
-        display = self.get_display()
-        monitor = display.get_primary_monitor() or display.get_monitor(0)
-        geom = monitor.get_geometry()
+        monitor, geom = self._dock_monitor()
         # Work area excludes other panels (e.g. MATE panel) so we don't
         # overlap them. Use full monitor geometry only for the edge where
         # we place the dock (we are a panel), work area for the other axis.
@@ -254,7 +311,8 @@ class DockWindow(Gtk.Window):
         )
 
         pos = self.config.pos
-        if is_horizontal(pos=pos):
+        self._horizontal = is_horizontal(pos=pos)
+        if self._horizontal:
             # Span full monitor width; use workarea Y for positioning
             # to avoid overlapping panels on perpendicular edges
             win_w, win_h = geom.width, cross
@@ -287,6 +345,25 @@ class DockWindow(Gtk.Window):
         self.resize(win_w, win_h)
         self.move(win_x, win_y)
 
+    def _dock_monitor(self) -> tuple[Gdk.Monitor, Gdk.Rectangle]:
+        """Primary (else first) monitor and its geometry, looked up once.
+
+        The work area is not cached: panels can change it without a
+        monitors-changed signal.
+        """
+        if self._monitor is None or self._monitor_geom is None:
+            display = self.get_display()
+            self._monitor = display.get_primary_monitor() or display.get_monitor(0)
+            self._monitor_geom = self._monitor.get_geometry()
+        return self._monitor, self._monitor_geom
+
+    def _on_monitors_changed(self, _screen: Gdk.Screen) -> None:
+        """Forget the cached monitor and move the dock onto the new layout."""
+        self._monitor = None
+        self._monitor_geom = None
+        if self.get_realized():
+            self.reposition()
+
     def _set_struts(self) -> None:
         """Reserve screen space for the dock via _NET_WM_STRUT_PARTIAL."""
         if self.config.autohide:
@@ -297,9 +374,7 @@ class DockWindow(Gtk.Window):
         if not gdk_window or not isinstance(gdk_window, GdkX11.X11Window):
             return
 
-        display = self.get_display()
-        monitor = display.get_primary_monitor() or display.get_monitor(0)
-        geom = monitor.get_geometry()
+        _monitor, geom = self._dock_monitor()
         screen = self.get_screen()
 
         # Reserve space for the full icon height + bottom padding so
@@ -338,7 +413,7 @@ class DockWindow(Gtk.Window):
 
         Delegates rendering to the DockRenderer, then updates the input
         region (which may change during hide animation), resets cursor
-        after hide completes, and re-schedules redraws for urgent glow.
+        after hide completes, and starts the redraw pump for urgent glow.
         """
         hide_offset = self.autohide.hide_offset if self.autohide else 0.0
         # The renderer receives zoom_progress from the autohide controller.
@@ -357,12 +432,9 @@ class DockWindow(Gtk.Window):
             zoom_progress = 1.0
         drag_index = self._dnd.drag_index if self._dnd else -1
         drop_insert = self._dnd.drop_insert_index if self._dnd else -1
-        hovered_id = (
-            self._hover.hovered_item.desktop_id
-            if self._hover and self._hover.hovered_item
-            else ""
-        )
+        hovered_id = self._hover.hovered_id
         main_cursor = self._main_axis_cursor()
+        self._last_drawn_main = main_cursor
         self.renderer.draw(
             cr,
             widget,
@@ -376,17 +448,33 @@ class DockWindow(Gtk.Window):
             zoom_progress,
             hovered_id,
         )
-        # Update input region as hide state changes (shrink when hidden)
-        self._update_input_region()
+        # Update input region as hide state changes (shrink when hidden).
+        # Between the explicit refreshes (realize, reposition, model change)
+        # only entering/leaving HIDDEN or a window resize landing can change
+        # it, so the layout and rect are not recomputed per frame.
+        window_w, window_h = self.get_size()
+        hidden = self._autohide_state() == HideState.HIDDEN
+        if (hidden, window_w, window_h) != self._input_region_key:
+            self._update_input_region()
 
         # Reset cursor after hide completes
         if self.autohide and self.autohide.state == HideState.HIDDEN:
             self.cursor_x = -1.0
             self.cursor_y = -1.0
 
-        # Keep redraw pump alive while urgent glow is visible (dock hidden)
-        if self._has_active_urgent_glow():
-            GLib.timeout_add(16, self._urgent_glow_tick)
+        # Keep redraws flowing while urgent glow is visible (dock hidden).
+        # One frame-clock callback serves the whole glow; scheduling a
+        # timeout per draw stacked up extra pumps whenever anything else
+        # also redrew.
+        if not self._glow_tick_id and self._has_active_urgent_glow():
+            self._glow_tick_id = self.drawing_area.add_tick_callback(
+                self._urgent_glow_tick
+            )
+
+        # Reorder slides decay one step per drawn frame, so keep frames
+        # coming until they settle rather than relying on pointer motion
+        if not self._slide_tick_id and self.renderer.slide_offsets:
+            self._slide_tick_id = self.drawing_area.add_tick_callback(self._slide_tick)
 
         return True
 
@@ -398,9 +486,12 @@ class DockWindow(Gtk.Window):
         """
         self.cursor_x = event.x
         self.cursor_y = event.y
-        self._update_dock_size()
-        widget.queue_draw()
-        self._hover.update(self._main_axis_cursor())
+        # No input region refresh: it is built from the rest layout, which
+        # does not depend on the cursor
+        main_cursor = self._main_axis_cursor()
+        if abs(main_cursor - self._last_drawn_main) >= MOTION_REDRAW_EPSILON:
+            widget.queue_draw()
+        self._hover.update(main_cursor)
         return False  # Propagate so GTK drag source can detect drag threshold
 
     def _on_button_press(
@@ -422,7 +513,7 @@ class DockWindow(Gtk.Window):
     ) -> bool:
         """Handle clicks on dock items (on release to avoid DnD conflicts)."""
         # Only act if release is near the press point (not a drag)
-        if is_horizontal(pos=self.config.pos):
+        if self._horizontal:
             drag_delta = abs(event.x - self._click_x)
         else:
             drag_delta = abs(event.y - self._click_y)
@@ -435,14 +526,8 @@ class DockWindow(Gtk.Window):
             return True
 
         if event.button in (MOUSE_LEFT, MOUSE_MIDDLE):
-            layout = compute_layout(
-                self.model.visible_items(),
-                self.config,
-                self.local_cursor_main(),
-                item_padding=self.theme.item_padding,
-                h_padding=self.theme.h_padding,
-            )
-            main_event = event.x if is_horizontal(pos=self.config.pos) else event.y
+            layout = self.cached_layout(local_cursor=self.local_cursor_main())
+            main_event = event.x if self._horizontal else event.y
             item = self.hit_test(main_coord=main_event, layout=layout)
             if item is None:
                 return True
@@ -467,6 +552,8 @@ class DockWindow(Gtk.Window):
             # two animations plus a small margin for the final frame.
             now = GLib.get_monotonic_time()
             item.last_clicked = now
+            # Timestamps are not model changes; drop the reusable frame
+            self.renderer.invalidate_frame()
 
             # Applets handle their own click
 
@@ -483,12 +570,20 @@ class DockWindow(Gtk.Window):
             force_launch = event.button == MOUSE_MIDDLE or (
                 event.state & Gdk.ModifierType.CONTROL_MASK
             )
+            # The fork/exec and the Wnck round-trips run from idle, after
+            # the first frame of the click animation has been drawn. Idle
+            # callbacks have no current event, so the timestamp is kept now.
             if force_launch or not item.is_running:
                 item.last_launched = now
-                launch(desktop_id=item.desktop_id)
+                GLib.idle_add(_run_once, launch, item.desktop_id)
                 self._hover.start_anim_pump(700)  # 600ms bounce + margin
             else:
-                self.window_tracker.toggle_focus(item.desktop_id)
+                GLib.idle_add(
+                    _run_once,
+                    self.window_tracker.toggle_focus,
+                    item.desktop_id,
+                    Gtk.get_current_event_time(),
+                )
                 self._hover.start_anim_pump(350)  # 300ms click darken
 
         return True
@@ -500,14 +595,8 @@ class DockWindow(Gtk.Window):
         item. If it's an applet, delegates to its on_scroll() and refreshes
         the tooltip (applet name/state may change on scroll, e.g. clippy).
         """
-        layout = compute_layout(
-            self.model.visible_items(),
-            self.config,
-            self.local_cursor_main(),
-            item_padding=self.theme.item_padding,
-            h_padding=self.theme.h_padding,
-        )
-        main_event = event.x if is_horizontal(pos=self.config.pos) else event.y
+        layout = self.cached_layout(local_cursor=self.local_cursor_main())
+        main_event = event.x if self._horizontal else event.y
         item = self.hit_test(main_coord=main_event, layout=layout)
         if item and is_applet(desktop_id=item.desktop_id):
             applet = self.model.get_applet(item.desktop_id)
@@ -560,7 +649,8 @@ class DockWindow(Gtk.Window):
             self.cursor_x = -1.0
             self.cursor_y = -1.0
 
-        self._update_dock_size()
+        # No input region refresh: the rect ignores the cursor, and the hide
+        # state change this leave may start is picked up by _on_draw
         widget.queue_draw()
         if autohide_on and self.autohide:
             self.autohide.on_mouse_leave()
@@ -582,23 +672,47 @@ class DockWindow(Gtk.Window):
         return True
 
     def _has_active_urgent_glow(self) -> bool:
-        """True if dock is hidden and any item has an active urgent glow."""
+        """True if dock is hidden and any item has an active urgent glow.
+
+        The scan records when the latest glow ends; until then each frame
+        only compares timestamps. A newer urgent item can only push that
+        end later, so the items are scanned again only once it has passed.
+        """
         if not self.autohide or self.autohide.state != HideState.HIDDEN:
             return False
         now = GLib.get_monotonic_time()
+        if now < self._glow_until_us:
+            return True
         glow_time_us = self.theme.urgent_glow_time_ms * 1000
-        for item in self.model.visible_items():
-            if item.last_urgent > 0 and (now - item.last_urgent) < glow_time_us:
-                return True
-        return False
+        last_urgent = max(
+            (item.last_urgent for item in self.model.visible_items()), default=0
+        )
+        if last_urgent > 0:
+            self._glow_until_us = last_urgent + glow_time_us
+        return now < self._glow_until_us
 
-    def _urgent_glow_tick(self) -> bool:
-        """One-shot tick to keep redraws flowing during urgent glow."""
-        self.drawing_area.queue_draw()
-        return False  # don't repeat; _on_draw re-schedules if still needed
+    def _urgent_glow_tick(
+        self, widget: Gtk.Widget, _frame_clock: Gdk.FrameClock
+    ) -> bool:
+        """Frame-clock callback: redraw each frame until the glow expires."""
+        if not self._has_active_urgent_glow():
+            self._glow_tick_id = 0
+            return False
+        widget.queue_draw()
+        return True
+
+    def _slide_tick(self, widget: Gtk.Widget, _frame_clock: Gdk.FrameClock) -> bool:
+        """Frame-clock callback: redraw each frame until slides have settled."""
+        if not self.renderer.slide_offsets:
+            self._slide_tick_id = 0
+            return False
+        widget.queue_draw()
+        return True
 
     def _on_model_changed(self) -> None:
         """Reposition and redraw when the model changes."""
+        self._layout_cache.clear()
+        self.renderer.invalidate_frame()
         self._update_dock_size()
         self._hover.on_model_changed()
         self.drawing_area.queue_draw()
@@ -643,18 +757,11 @@ class DockWindow(Gtk.Window):
         if not gdk_window:
             return
 
-        items = self.model.visible_items()
         icon_size = self.config.icon_size
         # Use rest layout (no zoom) for input region bounds. The max-zoom
         # layout was too generous and prevented hide when mouse moved past
         # the last icon on the right.
-        layout = compute_layout(
-            items,
-            self.config,
-            -1e6,  # sentinel: no cursor -> rest positions
-            item_padding=self.theme.item_padding,
-            h_padding=self.theme.h_padding,
-        )
+        layout = self.cached_layout(local_cursor=-1e6)  # no cursor -> rest
         left_edge, right_edge = content_bounds(
             layout=layout,
             icon_size=icon_size,
@@ -663,17 +770,18 @@ class DockWindow(Gtk.Window):
         )
         content_w = right_edge - left_edge
 
-        window_w: int = self.get_size()[0]
-        window_h: int = self.get_size()[1]
+        window_w, window_h = self.get_size()
         pos = self.config.pos
-        horizontal = is_horizontal(pos=pos)
 
         # Content centering along main axis
-        main_size = window_w if horizontal else window_h
+        main_size = window_w if self._horizontal else window_h
         content_offset = int((main_size - content_w) / 2 - left_edge)
 
-        autohide_state = (
-            self.autohide.state if self.autohide and self.autohide.enabled else None
+        autohide_state = self._autohide_state()
+        self._input_region_key = (
+            autohide_state == HideState.HIDDEN,
+            window_w,
+            window_h,
         )
         # Interactive cross-axis extent: icon height + edge padding.
         # This excludes the headroom above icons (zoom/bounce space)
@@ -689,12 +797,24 @@ class DockWindow(Gtk.Window):
             content_cross=content_cross,
             autohide_state=autohide_state,
         )
-        if new_rect != self._last_input_rect:
-            self._last_input_rect = new_rect
-            region = cairo.Region(
-                cairo.RectangleInt(new_rect.x, new_rect.y, new_rect.w, new_rect.h)
-            )
-            gdk_window.input_shape_combine_region(region, 0, 0)
+        if new_rect == self._last_input_rect:
+            return
+        self._last_input_rect = new_rect
+        if new_rect == (0, 0, window_w, window_h):
+            # Covers the whole window: unset the shape rather than have the
+            # X server clip input against a region that clips nothing
+            gdk_window.input_shape_combine_region(None, 0, 0)
+            return
+        region = cairo.Region(
+            cairo.RectangleInt(new_rect.x, new_rect.y, new_rect.w, new_rect.h)
+        )
+        gdk_window.input_shape_combine_region(region, 0, 0)
+
+    def _autohide_state(self) -> HideState | None:
+        """Autohide state, or None when autohide is off."""
+        if self.autohide and self.autohide.enabled:
+            return self.autohide.state
+        return None
 
     # --- Coordinate Conversion Utilities ---
     #
@@ -712,14 +832,14 @@ class DockWindow(Gtk.Window):
         Returns cursor_x for horizontal docks, cursor_y for vertical.
         Negative when no cursor is present (mouse outside window).
         """
-        if is_horizontal(pos=self.config.pos):
+        if self._horizontal:
             return self.cursor_x
         return self.cursor_y
 
     def _main_axis_window_size(self) -> int:
         """Window extent along the dock's main axis."""
         w, h = self.get_size()
-        return int(w if is_horizontal(pos=self.config.pos) else h)
+        return int(w if self._horizontal else h)
 
     def _base_main_offset(self) -> float:
         """Offset to center base (no-zoom) content along the main axis."""
@@ -750,7 +870,14 @@ class DockWindow(Gtk.Window):
         Unlike _base_main_offset() which uses rest-state width, this uses
         the actual zoomed layout bounds so the offset matches where icons
         are rendered during hover.
+
+        Hover, click and menu paths ask for the offset of the same shared
+        cached_layout list several times per event, so the result for the
+        last list is kept; a size change produces a new list.
         """
+        main_size = self._main_axis_window_size()
+        if layout is self._offset_layout and main_size == self._offset_main_size:
+            return self._offset
         left_edge, right_edge = content_bounds(
             layout=layout,
             icon_size=self.config.icon_size,
@@ -758,7 +885,11 @@ class DockWindow(Gtk.Window):
             item_padding=self.theme.item_padding,
         )
         zoomed_w = right_edge - left_edge
-        return (self._main_axis_window_size() - zoomed_w) / 2 - left_edge
+        offset = (main_size - zoomed_w) / 2 - left_edge
+        self._offset_layout = layout
+        self._offset_main_size = main_size
+        self._offset = offset
+        return offset
 
     # Keep short aliases used by other modules
     def local_cursor_x(self) -> float:
@@ -769,25 +900,65 @@ class DockWindow(Gtk.Window):
         """Alias for zoomed_main_offset (backward compat)."""
         return self.zoomed_main_offset(layout=layout)
 
+    def cached_layout(self, local_cursor: float) -> list[LayoutItem]:
+        """compute_layout for the visible items at local_cursor, memoized.
+
+        Hover, clicks, scrolls and the input region each ask for the layout
+        at the current cursor, often several times per event. Entries are
+        dropped when the item list or a size input changes; any negative
+        cursor maps to the one rest layout. The returned list is shared and
+        must not be mutated.
+        """
+        items = self.model.visible_items()
+        config, theme = self.config, self.theme
+        key = (
+            items,
+            config.icon_size,
+            config.zoom_percent,
+            config.zoom_enabled,
+            theme.item_padding,
+            theme.h_padding,
+        )
+        cache = self._layout_cache
+        if key != self._layout_cache_key:
+            cache.clear()
+            self._layout_cache_key = key
+        if local_cursor < 0:
+            local_cursor = -1.0
+        layout = cache.get(local_cursor)
+        if layout is None:
+            if len(cache) >= LAYOUT_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            layout = cache[local_cursor] = compute_layout(
+                items,
+                config,
+                local_cursor,
+                item_padding=theme.item_padding,
+                h_padding=theme.h_padding,
+            )
+        return layout
+
     def hit_test(self, main_coord: float, layout: list[LayoutItem]) -> DockItem | None:
         """Find which DockItem is under the cursor along the main axis.
 
         Converts main_coord from window-space to content-space using the
-        zoomed offset, then checks each layout item's [x, x+width) range.
+        zoomed offset, then checks the [x, x+width] range of the last item
+        starting at or before it. Icons are laid out in main-axis order and
+        never overlap, so that is the only candidate and bisect finds it.
         Returns None if cursor is in empty space between or outside items.
         """
-        offset = self.zoomed_main_offset(layout=layout)
-        items = self.model.visible_items()
-        for i, li in enumerate(layout):
-            icon_w = li.scale * self.config.icon_size
-            left = li.x + offset
-            right = left + icon_w
-            if left <= main_coord <= right:
-                return items[i]
+        local = main_coord - self.zoomed_main_offset(layout=layout)
+        i = bisect_right(layout, local, key=attrgetter("x")) - 1
+        if i < 0:
+            return None
+        li = layout[i]
+        if local <= li.x + li.scale * self.config.icon_size:
+            return self.model.visible_items()[i]
         return None
 
     def reposition(self) -> None:
         """Re-layout after position change -- reposition window, struts, input."""
+        self._layout_cache.clear()
         self._position_dock()
         self._set_struts()
         self._update_input_region()
@@ -7,10 +7,9 @@ from typing import TYPE_CHECKING
 import gi
 
 gi.require_version("Gtk", "3.0")
-from gi.repository import GLib  # noqa: E402
+from gi.repository import Gdk, GLib, Gtk  # noqa: E402
 
 from docking.core.position import Position
-from docking.core.zoom import compute_layout
 from docking.log import get_logger
 
 _log = get_logger(name="hover")
@@ -51,23 +50,29 @@ class HoverManager:
         self._tooltip = tooltip
         self._preview: PreviewPopup | None = None
 
-        self.hovered_item: DockItem | None = None
+        self._hovered_item: DockItem | None = None
+        # desktop_id of hovered_item ("" for none), read by every frame
+        self.hovered_id: str = ""
         self._preview_timer_id: int = 0
-        self._anim_timer_id: int = 0
+        self._anim_tick_id: int = 0
+        # Monotonic time (us) the animation pump keeps redrawing until
+        self._anim_until_us: int = 0
+
+    @property
+    def hovered_item(self) -> DockItem | None:
+        return self._hovered_item
+
+    @hovered_item.setter
+    def hovered_item(self, item: DockItem | None) -> None:
+        self._hovered_item = item
+        self.hovered_id = item.desktop_id if item else ""
 
     def set_preview(self, preview: PreviewPopup) -> None:
         self._preview = preview
 
     def update(self, cursor_main: float) -> None:
         """Detect which item the cursor is over and manage preview timer."""
-        items = self._model.visible_items()
-        layout = compute_layout(
-            items,
-            self._config,
-            self._window.local_cursor_main(),
-            item_padding=self._theme.item_padding,
-            h_padding=self._theme.h_padding,
-        )
+        layout = self._window.cached_layout(self._window.local_cursor_main())
         item = self._window.hit_test(cursor_main, layout)
 
         # Always refresh tooltip (item.name may change while hovered)
@@ -99,25 +104,27 @@ class HoverManager:
             self._preview_timer_id = 0
 
     def start_anim_pump(self, duration_ms: int = 700) -> None:
-        """Start a temporary 60fps redraw loop for time-based animations.
+        """Redraw every frame for the next duration_ms of time-based animation.
 
         Used for click darken (300ms), launch bounce (600ms), and urgent
-        bounce. The pump self-terminates after duration_ms.
+        bounce. Frames come from the drawing area's frame clock, so the
+        pump runs at the display rate and ends by elapsed time rather than
+        a frame count. Overlapping calls extend the one running pump.
         """
-        if self._anim_timer_id:
-            GLib.source_remove(self._anim_timer_id)
-
-        frames_left = [duration_ms // 16]
-
-        def tick() -> bool:
-            frames_left[0] -= 1
-            if frames_left[0] <= 0:
-                self._anim_timer_id = 0
-                return False
-            self._window.drawing_area.queue_draw()
-            return True
+        until_us = GLib.get_monotonic_time() + duration_ms * 1000
+        self._anim_until_us = max(self._anim_until_us, until_us)
+        if not self._anim_tick_id:
+            self._anim_tick_id = self._window.drawing_area.add_tick_callback(
+                self._anim_tick
+            )
 
-        self._anim_timer_id = GLib.timeout_add(16, tick)
+    def _anim_tick(self, widget: Gtk.Widget, frame_clock: Gdk.FrameClock) -> bool:
+        """Frame-clock callback for start_anim_pump."""
+        if frame_clock.get_frame_time() >= self._anim_until_us:
+            self._anim_tick_id = 0
+            return False
+        widget.queue_draw()
+        return True
 
     def on_model_changed(self) -> None:
         """Start anim pump if any item became urgent (needs bounce animation)."""
@@ -141,13 +148,7 @@ class HoverManager:
             return False
 
         items = self._model.visible_items()
-        layout = compute_layout(
-            items,
-            self._config,
-            self._window.local_cursor_main(),
-            item_padding=self._theme.item_padding,
-            h_padding=self._theme.h_padding,
-        )
+        layout = self._window.cached_layout(self._window.local_cursor_main())
 
         idx = None
         for i, it in enumerate(items):
@@ -9,7 +9,8 @@ import cairo
 import gi
 
 gi.require_version("Gtk", "3.0")
-from gi.repository import Gdk, GLib, Gtk  # noqa: E402
+gi.require_version("GdkPixbuf", "2.0")
+from gi.repository import Gdk, GdkPixbuf, GLib, Gtk  # noqa: E402
 
 from docking.core.position import Position, is_horizontal
 from docking.core.theme import RGB
@@ -25,6 +26,7 @@ if TYPE_CHECKING:
 
 
 SHELF_SMOOTH_FACTOR = 0.3
+SHELF_SETTLED_PX = 0.01
 SLIDE_MOVE_THRESHOLD = 2.0
 SLIDE_DECAY_FACTOR = 0.75
 SLIDE_CLEAR_THRESHOLD = 0.5
@@ -33,6 +35,14 @@ INDICATOR_SPACING_MULT = 3
 SLIDE_DURATION_MS = 300
 SLIDE_FRAME_MS = 16
 
+# Enum members are resolved through the metaclass on every attribute access,
+# which costs several times the comparison itself; the per-icon helpers below
+# compare against these aliases instead
+_BOTTOM = Position.BOTTOM
+_TOP = Position.TOP
+_LEFT = Position.LEFT
+_RIGHT = Position.RIGHT
+
 
 def compute_urgent_glow_opacity(
     elapsed_us: int, glow_time_ms: int, pulse_ms: int
@@ -64,11 +74,11 @@ def map_icon_position(
     Returns the top-left corner of the icon in window coordinates.
     """
     cross_rest = cross_size - edge_padding - scaled_size
-    if pos == Position.BOTTOM:
+    if pos == _BOTTOM:
         return main_pos, cross_rest + hide_cross - bounce
-    elif pos == Position.TOP:
+    elif pos == _TOP:
         return main_pos, edge_padding - hide_cross + bounce
-    elif pos == Position.LEFT:
+    elif pos == _LEFT:
         return edge_padding - hide_cross + bounce, main_pos
     else:  # RIGHT
         return cross_rest + hide_cross - bounce, main_pos
@@ -84,6 +94,17 @@ class DockRenderer:
         self._hover_lighten: dict[str, float] = {}
         self._hovered_id: str = ""
         self._icon_colors: dict[str, RGB] = {}
+        # Icon pixbufs converted to Cairo surfaces, by desktop_id, together
+        # with the pixbuf each was made from
+        self._icon_surfaces: dict[str, tuple[GdkPixbuf.Pixbuf, cairo.Surface]] = {}
+        # Visible item list _icon_surfaces was last pruned against
+        self._surfaces_items: list[DockItem] | None = None
+        # Last rendered frame, the draw inputs it was rendered for, and
+        # whether it had no animation in flight (so an identical expose can
+        # repaint it as is)
+        self._frame_surface: cairo.Surface | None = None
+        self._frame_key: tuple[object, ...] | None = None
+        self._frame_settled = False
 
     @staticmethod
     def compute_dock_size(
@@ -127,33 +148,60 @@ class DockRenderer:
         alloc = widget.get_allocation()
         width, height = alloc.width, alloc.height
 
-        # Render to offscreen surface, then blit atomically with SOURCE.
-        # With set_double_buffered(False), we draw directly to the X11
-        # backing surface. CLEAR+draw leaves a transparent gap between
-        # frames that the compositor can catch. Offscreen avoids this:
-        # the window surface is only touched once (the SOURCE blit).
-        offscreen = cr.get_target().create_similar(
-            cairo.Content.COLOR_ALPHA, width, height
-        )
-        ocr = cairo.Context(offscreen)
-        self._draw_content(
-            cr=ocr,
-            width=width,
-            height=height,
-            model=model,
-            config=config,
-            theme=theme,
-            cursor_main=cursor_main,
-            hide_offset=hide_offset,
-            drag_index=drag_index,
-            drop_insert_index=drop_insert_index,
-            zoom_progress=zoom_progress,
-            hovered_id=hovered_id,
+        # An expose with the same inputs as a settled frame (e.g. the WM
+        # re-exposing an idle dock) would render the same pixels; blit the
+        # previous frame instead. Model changes go through invalidate_frame().
+        key = (
+            width,
+            height,
+            cursor_main,
+            hide_offset,
+            drag_index,
+            drop_insert_index,
+            zoom_progress,
+            hovered_id,
+            theme,
+            config.pos,
+            config.icon_size,
+            config.zoom_enabled,
+            config.zoom_percent,
         )
+        offscreen = self._frame_surface
+        if offscreen is None or not self._frame_settled or key != self._frame_key:
+            # Render to offscreen surface, then blit atomically with SOURCE.
+            # With set_double_buffered(False), we draw directly to the X11
+            # backing surface. CLEAR+draw leaves a transparent gap between
+            # frames that the compositor can catch. Offscreen avoids this:
+            # the window surface is only touched once (the SOURCE blit).
+            offscreen = cr.get_target().create_similar(
+                cairo.Content.COLOR_ALPHA, width, height
+            )
+            ocr = cairo.Context(offscreen)
+            self._draw_content(
+                cr=ocr,
+                width=width,
+                height=height,
+                model=model,
+                config=config,
+                theme=theme,
+                cursor_main=cursor_main,
+                hide_offset=hide_offset,
+                drag_index=drag_index,
+                drop_insert_index=drop_insert_index,
+                zoom_progress=zoom_progress,
+                hovered_id=hovered_id,
+            )
+            self._frame_surface = offscreen
+            self._frame_key = key
         cr.set_operator(cairo.OPERATOR_SOURCE)
         cr.set_source_surface(offscreen, 0, 0)
         cr.paint()
 
+    def invalidate_frame(self) -> None:
+        """Force the next draw to render (item state changed in the model)."""
+        self._frame_surface = None
+        self._frame_key = None
+
     def _draw_content(
         self,
         cr: cairo.Context,
@@ -182,6 +230,7 @@ class DockRenderer:
 
         items = model.visible_items()
         if not items:
+            self._frame_settled = True
             return
 
         num_items = len(items)
@@ -286,6 +335,7 @@ class DockRenderer:
 
         gap = icon_size + theme.item_padding if drop_insert_index >= 0 else 0
         self._update_hover_lighten(items=items, hovered_id=hovered_id, theme=theme)
+        self._prune_icon_surfaces(items=items)
 
         # Hide offset: distance to push content toward the screen edge
         hide_cross = icon_hide * cross_size
@@ -394,6 +444,38 @@ class DockRenderer:
                             opacity=opacity,
                         )
 
+        # Slides, hover fades, shelf smoothing and the timed click/bounce/
+        # glow effects all advance per frame, so such a frame is not reusable
+        self._frame_settled = not (
+            self.slide_offsets
+            or abs(self.smooth_shelf_w - target_shelf_w) >= SHELF_SETTLED_PX
+            or any(
+                did != hovered_id or lighten != theme.hover_lighten
+                for did, lighten in self._hover_lighten.items()
+            )
+            or any(
+                self._is_animating(item=item, now=now, theme=theme) for item in items
+            )
+        )
+
+    @staticmethod
+    def _is_animating(item: DockItem, now: int, theme: Theme) -> bool:
+        """Whether a click, launch bounce or urgent effect is still running."""
+        if (
+            item.last_clicked > 0
+            and now - item.last_clicked < theme.click_time_ms * 1000
+        ):
+            return True
+        if (
+            item.last_launched > 0
+            and now - item.last_launched < theme.launch_bounce_time_ms * 1000
+        ):
+            return True
+        if item.last_urgent > 0:
+            urgent_ms = max(theme.urgent_bounce_time_ms, theme.urgent_glow_time_ms)
+            return now - item.last_urgent < urgent_ms * 1000
+        return False
+
     @staticmethod
     def _apply_shelf_transform(
         cr: cairo.Context,
@@ -412,13 +494,13 @@ class DockRenderer:
         - LEFT: rotate so horizontal becomes vertical, square edge at left
         - RIGHT: rotate so horizontal becomes vertical, square edge at right
         """
-        if pos == Position.TOP:
+        if pos == _TOP:
             cr.translate(0, height)
             cr.scale(1, -1)
-        elif pos == Position.LEFT:
+        elif pos == _LEFT:
             cr.translate(width, 0)
             cr.rotate(math.pi / 2)
-        elif pos == Position.RIGHT:
+        elif pos == _RIGHT:
             cr.rotate(-math.pi / 2)
             cr.translate(-height, 0)
         # BOTTOM: identity -- no transform needed
@@ -473,8 +555,8 @@ class DockRenderer:
 
         self.prev_positions = new_positions
 
-    @staticmethod
     def _draw_icon(
+        self,
         cr: cairo.Context,
         item: DockItem,
         li: LayoutItem,
@@ -492,20 +574,26 @@ class DockRenderer:
         icon_width = item.icon.get_width()
         icon_height = item.icon.get_height()
 
-        icon_surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, icon_width, icon_height)
-        icon_cr = cairo.Context(icon_surface)
-
-        Gdk.cairo_set_source_pixbuf(icon_cr, item.icon, 0, 0)
-        icon_cr.paint()
+        # Only hovered or clicked icons need a scratch surface for effects;
+        # the rest are painted straight from the cached conversion
+        icon_surface = self._icon_surface(item=item)
+        if lighten > 0 or darken > 0:
+            source = icon_surface
+            icon_surface = cairo.ImageSurface(
+                cairo.FORMAT_ARGB32, icon_width, icon_height
+            )
+            icon_cr = cairo.Context(icon_surface)
+            icon_cr.set_source_surface(source, 0, 0)
+            icon_cr.paint()
 
-        if lighten > 0:
-            icon_cr.set_operator(cairo.OPERATOR_ADD)
-            icon_cr.paint_with_alpha(lighten)
+            if lighten > 0:
+                icon_cr.set_operator(cairo.OPERATOR_ADD)
+                icon_cr.paint_with_alpha(lighten)
 
-        if darken > 0:
-            icon_cr.set_operator(cairo.OPERATOR_ATOP)
-            icon_cr.set_source_rgba(0, 0, 0, darken)
-            icon_cr.paint()
+            if darken > 0:
+                icon_cr.set_operator(cairo.OPERATOR_ATOP)
+                icon_cr.set_source_rgba(0, 0, 0, darken)
+                icon_cr.paint()
 
         cr.save()
         cr.translate(x, y)
@@ -514,6 +602,38 @@ class DockRenderer:
         cr.paint()
         cr.restore()
 
+    def _prune_icon_surfaces(self, items: list[DockItem]) -> None:
+        """Drop icon conversions for items that left the dock.
+
+        The model hands out the same visible list until an item is added,
+        removed or moved, so a new list is the cue to prune. Swapping one app
+        for another keeps the count but still yields a new list.
+        """
+        if items is self._surfaces_items:
+            return
+        self._surfaces_items = items
+        visible_ids = {item.desktop_id for item in items}
+        for did in [d for d in self._icon_surfaces if d not in visible_ids]:
+            del self._icon_surfaces[did]
+
+    def _icon_surface(self, item: DockItem) -> cairo.Surface:
+        """item.icon as a Cairo surface, converted once per pixbuf.
+
+        Applets and icon reloads assign a new pixbuf rather than editing one
+        in place, so the pixbuf's identity tells whether the entry is stale.
+        """
+        cached = self._icon_surfaces.get(item.desktop_id)
+        if cached is not None and cached[0] is item.icon:
+            return cached[1]
+        surface = cairo.ImageSurface(
+            cairo.FORMAT_ARGB32, item.icon.get_width(), item.icon.get_height()
+        )
+        surface_cr = cairo.Context(surface)
+        Gdk.cairo_set_source_pixbuf(surface_cr, item.icon, 0, 0)
+        surface_cr.paint()
+        self._icon_surfaces[item.desktop_id] = (item.icon, surface)
+        return surface
+
     @staticmethod
     def _draw_active_glow(
         cr: cairo.Context,
@@ -571,11 +691,11 @@ class DockRenderer:
         r, g, b = color
 
         # Position glow center at screen edge, centered on item
-        if pos == Position.BOTTOM:
+        if pos == _BOTTOM:
             gx, gy = main_center, cross_size
-        elif pos == Position.TOP:
+        elif pos == _TOP:
             gx, gy = main_center, 0.0
-        elif pos == Position.LEFT:
+        elif pos == _LEFT:
             gx, gy = 0.0, main_center
         else:  # RIGHT
             gx, gy = cross_size, main_center
@@ -616,21 +736,21 @@ class DockRenderer:
         count = min(item.instance_count, theme.max_indicator_dots)
         spacing = theme.indicator_radius * INDICATOR_SPACING_MULT
 
-        if pos == Position.BOTTOM:
+        if pos == _BOTTOM:
             cx = main_center
             cy = cross_size - edge_padding / 2 + hide_cross
             for j in range(count):
                 dx = cx + (j - (count - 1) / 2) * spacing
                 cr.arc(dx, cy, theme.indicator_radius, 0, 2 * math.pi)
                 cr.fill()
-        elif pos == Position.TOP:
+        elif pos == _TOP:
             cx = main_center
             cy = edge_padding / 2 - hide_cross
             for j in range(count):
                 dx = cx + (j - (count - 1) / 2) * spacing
                 cr.arc(dx, cy, theme.indicator_radius, 0, 2 * math.pi)
                 cr.fill()
-        elif pos == Position.LEFT:
+        elif pos == _LEFT:
             cx = edge_padding / 2 - hide_cross
             cy = main_center
             for j in range(count):
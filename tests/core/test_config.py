@@ -33,6 +33,15 @@ class TestConfigDefaults:
         # Then
         assert c.hide_delay_ms == 0
 
+    def test_derived_icon_sizes_follow_icon_size(self):
+        # Given
+        c = Config(icon_size=48, zoom_percent=1.5)
+        # When
+        c.icon_size = 64
+        # Then
+        assert c.zoomed_icon_size == 96
+        assert c.drag_icon_size == int(64 * 1.2)
+
 
 class TestConfigLoad:
     def test_load_missing_file_creates_default(self, tmp_path):
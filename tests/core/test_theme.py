@@ -1,6 +1,7 @@
 """Tests for theme loading, scaling unit system, and color parsing."""
 
 import json
+import os
 from unittest.mock import patch
 
 import pytest
@@ -41,6 +42,13 @@ class TestThemeDefaults:
         assert t.roundness > 0
         assert t.indicator_radius > 0
 
+    def test_theme_is_immutable(self):
+        # Given
+        t = Theme()
+        # When / Then
+        with pytest.raises(AttributeError):
+            t.roundness = 1.0  # type: ignore[misc]
+
 
 class TestThemeLoad:
     def test_load_default_theme(self):
@@ -71,6 +79,29 @@ class TestThemeLoad:
         # Defaults for unspecified
         assert t.indicator_radius == 2.5
 
+    def test_load_reuses_parsed_theme(self):
+        # Given / When
+        first = Theme.load("default", 48)
+        second = Theme.load("default", 48)
+        # Then
+        assert first is second
+        assert Theme.load("default", 64) is not first
+
+    def test_load_rereads_modified_file(self, tmp_path):
+        # Given
+        theme_file = tmp_path / "edited.json"
+        theme_file.write_text(json.dumps({"roundness": 3}))
+        with patch("docking.core.theme._BUILTIN_THEMES_DIR", tmp_path):
+            before = Theme.load("edited", 48)
+            # When
+            theme_file.write_text(json.dumps({"roundness": 9}))
+            stat = theme_file.stat()
+            os.utime(theme_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            after = Theme.load("edited", 48)
+        # Then
+        assert before.roundness == 3.0
+        assert after.roundness == 9.0
+
 
 class TestScalingUnit:
     """Tests for the scaling unit system: JSON values * (icon_size / 10)."""
@@ -5,6 +5,8 @@ import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 # Mock gi before importing launcher only when PyGObject is unavailable.
 try:
     import gi  # type: ignore # noqa: F401
@@ -14,6 +16,7 @@ except Exception:
     sys.modules.setdefault("gi", gi_mock)
     sys.modules.setdefault("gi.repository", gi_mock.repository)
 
+from docking.platform import launcher as launcher_mod  # noqa: E402
 from docking.platform.launcher import (  # noqa: E402
     Launcher,
     get_actions,
@@ -22,6 +25,12 @@ from docking.platform.launcher import (  # noqa: E402
 )
 
 
+@pytest.fixture(autouse=True)
+def _isolated_icon_cache(tmp_path, monkeypatch):
+    """Keep the on-disk icon cache out of the real ~/.cache."""
+    monkeypatch.setattr(launcher_mod, "ICON_CACHE_DIR", tmp_path / "icons")
+
+
 class TestGetDesktopDirs:
     def test_uses_xdg_data_dirs(self, tmp_path):
         # Given
@@ -53,9 +62,43 @@ class TestGetDesktopDirs:
         assert Path("/nonexistent/path/applications") not in launcher._desktop_dirs
 
 
+@pytest.fixture
+def theme_source(tmp_path, monkeypatch):
+    """Resolve every theme lookup to a real source file under tmp_path."""
+    source = tmp_path / "theme" / "firefox.svg"
+    source.parent.mkdir()
+    source.write_bytes(b"<svg/>")
+    gtk = MagicMock()
+    info = gtk.IconTheme.get_default.return_value.lookup_icon.return_value
+    info.get_filename.return_value = str(source)
+    gtk.Settings.get_default.return_value.get_property.return_value = "Adwaita"
+    monkeypatch.setattr(launcher_mod, "Gtk", gtk)
+    monkeypatch.setattr(launcher_mod.GLib, "Error", RuntimeError, raising=False)
+    return source
+
+
+def _lookup_icon():
+    return launcher_mod.Gtk.IconTheme.get_default.return_value.lookup_icon
+
+
+def _stamp(source):
+    return f"{source}\n{source.stat().st_mtime_ns}"
+
+
+def _cached_pixbuf(monkeypatch, stamp):
+    """Make cache reads return a pixbuf carrying the given source stamp."""
+    pix = MagicMock()
+    pix.get_option.side_effect = lambda key: stamp
+    pixbuf_cls = MagicMock()
+    pixbuf_cls.new_from_file.return_value = pix
+    monkeypatch.setattr(launcher_mod.GdkPixbuf, "Pixbuf", pixbuf_cls, raising=False)
+    return pix
+
+
 class TestIconCache:
-    def test_caches_loaded_icons(self):
+    def test_caches_loaded_icons(self, monkeypatch):
         # Given
+        monkeypatch.setattr(launcher_mod.GLib, "Error", RuntimeError, raising=False)
         launcher = Launcher()
         # When
         icon1 = launcher.load_icon("application-x-executable", 48)
@@ -63,8 +106,9 @@ class TestIconCache:
         # Then
         assert icon1 is icon2
 
-    def test_different_sizes_cached_separately(self):
+    def test_different_sizes_cached_separately(self, monkeypatch):
         # Given
+        monkeypatch.setattr(launcher_mod.GLib, "Error", RuntimeError, raising=False)
         launcher = Launcher()
         # When
         launcher.load_icon("application-x-executable", 48)
@@ -73,6 +117,114 @@ class TestIconCache:
         assert ("application-x-executable", 48) in launcher._icon_cache
         assert ("application-x-executable", 96) in launcher._icon_cache
 
+    def test_fresh_disk_icon_skips_theme_lookup(self, monkeypatch, theme_source):
+        # Given
+        launcher = Launcher()
+        path = launcher._disk_icon_path("firefox", 48)
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"png")
+        pix = _cached_pixbuf(monkeypatch, stamp=_stamp(theme_source))
+        try_load = MagicMock()
+        monkeypatch.setattr(launcher, "_try_load_icon", try_load)
+        # When
+        out = launcher.load_icon("firefox", 48)
+        # Then
+        assert out is pix
+        launcher_mod.GdkPixbuf.Pixbuf.new_from_file.assert_called_once_with(str(path))
+        _lookup_icon().assert_not_called()
+        try_load.assert_not_called()
+
+    def test_disk_icon_from_changed_source_is_rerendered(
+        self, monkeypatch, theme_source
+    ):
+        # Given: the cached PNG was rendered from an older theme file
+        launcher = Launcher()
+        path = launcher._disk_icon_path("firefox", 48)
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"png")
+        _cached_pixbuf(monkeypatch, stamp=f"{theme_source}\n1")
+        fresh = _lookup_icon().return_value.load_icon.return_value
+        # When
+        out = launcher.load_icon("firefox", 48)
+        # Then
+        assert out is fresh
+        fresh.savev.assert_called_once()
+
+    def test_saves_theme_icon_to_disk_cache(self, theme_source):
+        # Given
+        launcher = Launcher()
+        pix = _lookup_icon().return_value.load_icon.return_value
+        pix.savev.side_effect = lambda filename, *_: Path(filename).write_bytes(b"png")
+        # When
+        out = launcher.load_icon("firefox", 48)
+        # Then: written under a temp name with its source stamp, then renamed
+        path = launcher._disk_icon_path("firefox", 48)
+        assert out is pix
+        filename, fmt, keys, values = pix.savev.call_args.args
+        assert filename != str(path)
+        assert (fmt, keys, values) == (
+            "png",
+            ["tEXt::docking-source"],
+            [_stamp(theme_source)],
+        )
+        assert path.read_bytes() == b"png"
+        assert list(path.parent.iterdir()) == [path]
+        _lookup_icon().assert_called_once()
+
+    def test_failed_save_leaves_no_cache_file(self, theme_source):
+        # Given: savev dies after writing part of the file
+        launcher = Launcher()
+        pix = _lookup_icon().return_value.load_icon.return_value
+
+        def partial_save(filename, *_):
+            Path(filename).write_bytes(b"pn")
+            raise OSError("disk full")
+
+        pix.savev.side_effect = partial_save
+        # When
+        launcher.load_icon("firefox", 48)
+        # Then
+        assert list(launcher._icon_cache_dir.iterdir()) == []
+
+    def test_icon_missing_from_theme_is_not_cached(self, monkeypatch, theme_source):
+        # Given
+        launcher = Launcher()
+        _lookup_icon().return_value = None
+        fallback = MagicMock()
+        monkeypatch.setattr(
+            launcher, "_try_load_icon", lambda icon_name, size: fallback
+        )
+        # When
+        out = launcher.load_icon("missing-icon", 48)
+        # Then
+        assert out is fallback
+        assert not launcher._icon_cache_dir.exists()
+
+    def test_first_save_prunes_old_entries(self, theme_source):
+        # Given
+        launcher = Launcher()
+        cache_dir = launcher._icon_cache_dir
+        cache_dir.mkdir(parents=True)
+        old = cache_dir / "old.png"
+        recent = cache_dir / "recent.png"
+        old.write_bytes(b"png")
+        recent.write_bytes(b"png")
+        age = launcher_mod.ICON_CACHE_MAX_AGE_S + 60
+        os.utime(old, (old.stat().st_atime - age, old.stat().st_mtime - age))
+        pix = _lookup_icon().return_value.load_icon.return_value
+        pix.savev.side_effect = lambda filename, *_: Path(filename).write_bytes(b"png")
+        # When
+        launcher.load_icon("firefox", 48)
+        # Then
+        assert not old.exists()
+        assert recent.exists()
+
+    def test_absolute_path_icons_skip_disk_cache(self):
+        # Given
+        launcher = Launcher()
+        # When / Then
+        assert launcher._disk_icon_path("/usr/share/icons/x.png", 48) is None
+
 
 class TestDesktopActions:
     def test_get_actions_returns_pairs(self):
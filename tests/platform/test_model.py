@@ -3,6 +3,8 @@
 import sys
 from unittest.mock import MagicMock
 
+import pytest
+
 # Mock gi before importing dock_model
 gi_mock = MagicMock()
 gi_mock.require_version = MagicMock()
@@ -37,6 +39,7 @@ def _make_config(pinned: list[str]):
     config.pinned = list(pinned)
     config.icon_size = 48
     config.zoom_percent = 2.0
+    config.zoomed_icon_size = 96
     return config
 
 
@@ -85,6 +88,17 @@ class TestDockModelInit:
         assert found is not None
         assert found.desktop_id == "firefox.desktop"
 
+    def test_find_by_wm_class_casefolds(self):
+        # Given
+        config = _make_config(["straße.desktop"])
+        launcher = _make_launcher("straße.desktop")
+        model = DockModel(config, launcher)
+        # When
+        found = model.find_by_wm_class("STRASSE")
+        # Then
+        assert found is not None
+        assert found.desktop_id == "straße.desktop"
+
     def test_find_by_wm_class_not_found(self):
         # Given
         config = _make_config(["firefox.desktop"])
@@ -95,6 +109,49 @@ class TestDockModelInit:
         # Then
         assert found is None
 
+    def test_find_by_wm_class_index_follows_mutations(self):
+        # Given
+        config = _make_config(["a.desktop"])
+        launcher = _make_launcher("a.desktop", "b.desktop")
+        model = DockModel(config, launcher)
+        assert model.find_by_wm_class("B") is None
+        index = model._by_wm_class
+        # When
+        model.find_by_wm_class("A")
+        reused = model._by_wm_class is index
+        model.update_running({"b.desktop": {"count": 1, "active": False}})
+        # Then
+        assert reused
+        assert model.find_by_wm_class("B").desktop_id == "b.desktop"
+
+    def test_visible_items_cached_until_mutation(self):
+        # Given
+        config = _make_config(["a.desktop", "b.desktop"])
+        launcher = _make_launcher("a.desktop", "b.desktop")
+        model = DockModel(config, launcher)
+        first = model.visible_items()
+        # When
+        second = model.visible_items()
+        model.reorder(0, 1)
+        third = model.visible_items()
+        # Then
+        assert second is first
+        assert third is not first
+        assert [it.desktop_id for it in third] == ["b.desktop", "a.desktop"]
+
+    def test_find_by_desktop_id_sees_new_transient(self):
+        # Given
+        config = _make_config(["a.desktop"])
+        launcher = _make_launcher("a.desktop", "b.desktop")
+        model = DockModel(config, launcher)
+        assert model.find_by_desktop_id("b.desktop") is None
+        # When
+        model.update_running({"b.desktop": {"count": 1, "active": False}})
+        # Then
+        found = model.find_by_desktop_id("b.desktop")
+        assert found is not None
+        assert not found.is_pinned
+
     def test_empty_pinned(self):
         # Given
         config = _make_config([])
@@ -218,6 +275,26 @@ class TestReorder:
         assert ids == ["b.desktop", "c.desktop", "a.desktop"]
         assert config.pinned == ["b.desktop", "c.desktop", "a.desktop"]
 
+    def test_reorder_pinned_backwards(self):
+        # Given
+        config = _make_config(["a.desktop", "b.desktop", "c.desktop", "d.desktop"])
+        launcher = _make_launcher("a.desktop", "b.desktop", "c.desktop", "d.desktop")
+        model = DockModel(config, launcher)
+        # When
+        model.reorder(3, 1)
+        # Then
+        assert config.pinned == ["a.desktop", "d.desktop", "b.desktop", "c.desktop"]
+
+    def test_reorder_adjacent_swaps(self):
+        # Given
+        config = _make_config(["a.desktop", "b.desktop", "c.desktop"])
+        launcher = _make_launcher("a.desktop", "b.desktop", "c.desktop")
+        model = DockModel(config, launcher)
+        # When
+        model.reorder(1, 2)
+        # Then
+        assert config.pinned == ["a.desktop", "c.desktop", "b.desktop"]
+
     def test_reorder_out_of_bounds_noop(self):
         # Given
         config = _make_config(["a.desktop"])
@@ -326,6 +403,33 @@ class TestCallbacks:
         # Then
         callback.assert_called_once()
 
+    def test_unchanged_running_skips_notify(self):
+        # Given
+        config = _make_config(["a.desktop"])
+        launcher = _make_launcher("a.desktop")
+        model = DockModel(config, launcher)
+        callback = MagicMock()
+        model.on_change = callback
+        model.update_running({"a.desktop": {"count": 1, "active": False}})
+        # When
+        model.update_running({"a.desktop": {"count": 1, "active": False}})
+        # Then
+        callback.assert_called_once()
+
+    def test_pinned_change_forces_next_update(self):
+        # Given
+        config = _make_config(["a.desktop"])
+        launcher = _make_launcher("a.desktop", "b.desktop")
+        model = DockModel(config, launcher)
+        model.update_running({"b.desktop": {"count": 1, "active": False}})
+        model.pin_item("b.desktop")
+        callback = MagicMock()
+        model.on_change = callback
+        # When
+        model.update_running({"b.desktop": {"count": 1, "active": False}})
+        # Then
+        callback.assert_called_once()
+
 
 class TestAppletLifecycleIntegration:
     def test_add_applet_and_remove_applet_updates_config_and_notifies(
@@ -437,6 +541,21 @@ class TestAppletLifecycleIntegration:
         remove.assert_called_once_with(desktop_id="applet://session")
 
 
+class TestDockItemSlots:
+    def test_has_no_instance_dict(self):
+        # Given
+        item = DockItem(desktop_id="test.desktop")
+        # When / Then
+        assert not hasattr(item, "__dict__")
+
+    def test_rejects_unknown_attributes(self):
+        # Given
+        item = DockItem(desktop_id="test.desktop")
+        # When / Then
+        with pytest.raises(AttributeError):
+            item.is_pinnned = True  # type: ignore[attr-defined]
+
+
 class TestDockItemAnimationFields:
     def test_default_timestamps_zero(self):
         # Given / When
@@ -1,8 +1,11 @@
 """Tests for strut computation across all dock positions."""
 
+import ctypes
 import sys
 from unittest.mock import MagicMock
 
+import pytest
+
 gi_mock = MagicMock()
 gi_mock.require_version = MagicMock()
 sys.modules.setdefault("gi", gi_mock)
@@ -385,6 +388,18 @@ class TestAlwaysTwelveValues:
 
 
 class TestStrutWriters:
+    @pytest.fixture(autouse=True)
+    def _fresh_xlib_cache(self):
+        struts_mod._load_xlib.cache_clear()
+        struts_mod._intern_atoms.cache_clear()
+        struts_mod._xdisplay_pointer.cache_clear()
+        struts_mod._last_struts.clear()
+        yield
+        struts_mod._load_xlib.cache_clear()
+        struts_mod._intern_atoms.cache_clear()
+        struts_mod._xdisplay_pointer.cache_clear()
+        struts_mod._last_struts.clear()
+
     def test_set_struts_writes_partial_and_legacy_atoms(self, monkeypatch):
         # Given
         xlib = MagicMock()
@@ -418,6 +433,106 @@ class TestStrutWriters:
         assert xlib.XChangeProperty.call_args_list[1].args[-1] == 4
         xlib.XFlush.assert_called_once()
 
+    def test_set_struts_loads_xlib_and_atoms_once(self, monkeypatch):
+        # Given
+        xlib = MagicMock()
+        xlib.XInternAtom.side_effect = [11, 12, 13]
+        load = MagicMock(return_value=xlib)
+        monkeypatch.setattr(struts_mod.ctypes.cdll, "LoadLibrary", load)
+        display = MagicMock()
+        display.get_xdisplay.return_value = object()
+        monkeypatch.setattr(
+            struts_mod.GdkX11.X11Display,
+            "get_default",
+            lambda: display,
+            raising=False,
+        )
+        gdk_window = MagicMock()
+        gdk_window.get_xid.return_value = 1234
+
+        # When
+        struts_mod.set_struts(gdk_window=gdk_window, struts=[0] * 12)
+        struts_mod.set_struts(gdk_window=gdk_window, struts=[1] * 12)
+
+        # Then
+        load.assert_called_once()
+        assert xlib.XInternAtom.call_count == 3
+        assert xlib.XChangeProperty.call_count == 4
+
+    def test_set_struts_skips_unchanged_values(self, monkeypatch):
+        # Given
+        xlib = MagicMock()
+        xlib.XInternAtom.side_effect = [11, 12, 13]
+        monkeypatch.setattr(struts_mod.ctypes.cdll, "LoadLibrary", lambda _n: xlib)
+        display = MagicMock()
+        display.get_xdisplay.return_value = object()
+        monkeypatch.setattr(
+            struts_mod.GdkX11.X11Display,
+            "get_default",
+            lambda: display,
+            raising=False,
+        )
+        gdk_window = MagicMock()
+        gdk_window.get_xid.return_value = 1234
+
+        # When
+        struts_mod.set_struts(gdk_window=gdk_window, struts=[5] * 12)
+        struts_mod.set_struts(gdk_window=gdk_window, struts=[5] * 12)
+
+        # Then
+        assert xlib.XChangeProperty.call_count == 2
+        xlib.XFlush.assert_called_once()
+
+    def test_forgotten_or_cleared_struts_are_written_again(self, monkeypatch):
+        # Given
+        xlib = MagicMock()
+        xlib.XInternAtom.side_effect = [11, 12, 13]
+        monkeypatch.setattr(struts_mod.ctypes.cdll, "LoadLibrary", lambda _n: xlib)
+        display = MagicMock()
+        display.get_xdisplay.return_value = object()
+        monkeypatch.setattr(
+            struts_mod.GdkX11.X11Display,
+            "get_default",
+            lambda: display,
+            raising=False,
+        )
+        gdk_window = MagicMock()
+        gdk_window.get_xid.return_value = 1234
+        struts_mod.set_struts(gdk_window=gdk_window, struts=[5] * 12)
+
+        # When: the XID is recycled, then the struts are cleared twice
+        struts_mod.forget_struts(gdk_window=gdk_window)
+        struts_mod.set_struts(gdk_window=gdk_window, struts=[5] * 12)
+        clear_struts(gdk_window=gdk_window)
+        clear_struts(gdk_window=gdk_window)
+
+        # Then
+        assert xlib.XFlush.call_count == 4
+
+    def test_xdisplay_pointer_unwraps_capsule(self):
+        # Given
+        new_capsule = ctypes.pythonapi.PyCapsule_New
+        new_capsule.restype = ctypes.py_object
+        new_capsule.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p]
+        capsule = new_capsule(0xDEADBEEF, None, None)
+        display = MagicMock()
+        display.get_xdisplay.return_value = capsule
+        # When
+        ptr = struts_mod._xdisplay_pointer(display)
+        # Then
+        assert ptr == 0xDEADBEEF
+
+    def test_xdisplay_pointer_uses_gi_wrapper_hash(self):
+        # Given
+        wrapper = MagicMock()
+        wrapper.__hash__.return_value = 0x1234
+        display = MagicMock()
+        display.get_xdisplay.return_value = wrapper
+        # When
+        ptr = struts_mod._xdisplay_pointer(display)
+        # Then
+        assert ptr == 0x1234
+
     def test_set_dock_struts_computes_and_writes(self, monkeypatch):
         # Given
         computed = [9] * 12
@@ -16,7 +16,7 @@ class TestWmClassCandidates:
     """Desktop ID candidates from WM_CLASS with spaces."""
 
     def test_no_spaces(self):
-        assert _wm_class_desktop_candidates(class_lower="firefox") == ["firefox"]
+        assert _wm_class_desktop_candidates(class_lower="firefox") == ("firefox",)
 
     def test_spaces_to_hyphens_and_joined(self):
         result = _wm_class_desktop_candidates(class_lower="mongodb compass")
@@ -106,6 +106,7 @@ def tracker_env(monkeypatch):
         SimpleNamespace(DESKTOP=1, DOCK=2),
         raising=False,
     )
+    monkeypatch.setattr(window_tracker_mod, "_SKIPPED_WINDOW_TYPES", (1, 2))
     monkeypatch.setattr(window_tracker_mod.GLib, "idle_add", lambda _fn: 1)
     monkeypatch.setattr(window_tracker_mod.Gtk, "get_current_event_time", lambda: 123)
 
@@ -171,6 +172,37 @@ class TestWindowTrackerInit:
         tracker._update_running.assert_called_once()
 
 
+class TestWindowChangeCoalescing:
+    def test_burst_of_signals_schedules_one_rescan(self, tracker_env, monkeypatch):
+        # Given
+        tracker, _model, _launcher = tracker_env
+        scheduled = []
+        monkeypatch.setattr(window_tracker_mod.GLib, "idle_add", scheduled.append)
+        tracker._update_running = MagicMock()
+        # When
+        tracker._on_window_changed(MagicMock())
+        tracker._on_window_changed(MagicMock(), MagicMock())
+        tracker._on_window_changed(MagicMock())
+        # Then
+        assert len(scheduled) == 1
+        tracker._update_running.assert_not_called()
+
+    def test_flush_rescans_and_rearms(self, tracker_env, monkeypatch):
+        # Given
+        tracker, _model, _launcher = tracker_env
+        scheduled = []
+        monkeypatch.setattr(window_tracker_mod.GLib, "idle_add", scheduled.append)
+        tracker._update_running = MagicMock()
+        tracker._on_window_changed(MagicMock())
+        # When
+        result = scheduled[0]()
+        tracker._on_window_changed(MagicMock())
+        # Then
+        assert result is False
+        tracker._update_running.assert_called_once()
+        assert len(scheduled) == 2
+
+
 class TestWindowTrackerRunningAggregation:
     def test_update_running_aggregates_windows(self, tracker_env):
         # Given
@@ -200,26 +232,60 @@ class TestWindowTrackerRunningAggregation:
         assert running["firefox.desktop"]["count"] == 2
         assert running["firefox.desktop"]["active"] is True
         assert running["firefox.desktop"]["urgent"] is True
-        assert running["firefox.desktop"]["xids"] == [1, 2]
+        assert running["firefox.desktop"]["windows"] == [w1, w2]
         assert running["code.desktop"]["count"] == 1
-        assert tracker._running_xids_by_desktop == {
-            "firefox.desktop": [1, 2],
-            "code.desktop": [3],
+        assert tracker._xids_by_desktop == {
+            "firefox.desktop": [w1.get_xid(), w2.get_xid()],
+            "code.desktop": [w3.get_xid()],
         }
 
-    def test_get_windows_for_uses_cached_xids_and_filters(self, tracker_env):
+    def test_update_running_refreshes_windows_when_counts_unchanged(self, tracker_env):
         # Given
         tracker, _model, _launcher = tracker_env
-        tracker._running_xids_by_desktop = {"firefox.desktop": [1, 2, 3]}
-        w1 = FakeWindow(1)
+        w1 = FakeWindow(1, class_group="Firefox")
+        w2 = FakeWindow(2, class_group="Firefox")
+        tracker._screen = FakeScreen(windows=[w1], active_window=None)
+        tracker._update_running()
+        # When
+        tracker._screen = FakeScreen(windows=[w2], active_window=None)
+        tracker._update_running()
+        # Then
+        assert tracker.get_windows_for("firefox.desktop") == [w2]
+
+    def test_get_windows_for_reads_last_scan(self, tracker_env):
+        # Given
+        tracker, _model, _launcher = tracker_env
+        w1 = FakeWindow(1, class_group="Firefox")
         w2 = FakeWindow(2, window_type=window_tracker_mod.Wnck.WindowType.DOCK)
-        w3 = FakeWindow(3, skip_tasklist=True)
+        w3 = FakeWindow(3, class_group="Firefox", skip_tasklist=True)
         tracker._screen = FakeScreen(windows=[w1, w2, w3], active_window=None)
+        tracker._update_running()
+        tracker._match_window = MagicMock()
 
         # When
         windows = tracker.get_windows_for("firefox.desktop")
-        # Then
+        # Then: resolved from the scanned XIDs, without rematching WM_CLASS
         assert windows == [w1]
+        tracker._match_window.assert_not_called()
+
+
+class TestIsAppWindow:
+    def test_regular_window_is_app_window(self, tracker_env):
+        # Given
+        tracker, _model, _launcher = tracker_env
+        # When / Then
+        assert tracker._is_app_window(FakeWindow(1)) is True
+
+    def test_desktop_dock_and_skip_tasklist_are_not(self, tracker_env):
+        # Given
+        tracker, _model, _launcher = tracker_env
+        desktop = FakeWindow(1, window_type=1)
+        dock = FakeWindow(2, window_type=2)
+        skipped = FakeWindow(3, skip_tasklist=True)
+        # When / Then
+        assert not tracker._is_app_window(desktop)
+        assert not tracker._is_app_window(dock)
+        assert not tracker._is_app_window(skipped)
 
 
 class TestWindowMatching:
@@ -231,6 +297,18 @@ class TestWindowMatching:
         # Then
         assert tracker._match_window(win) == "firefox.desktop"
 
+    def test_match_casefolds_like_the_model(self, tracker_env):
+        # Given: .lower() would keep "ß" and miss "STRASSE"
+        tracker, model, launcher = tracker_env
+        launcher.resolve.return_value = None
+        model.visible_items.return_value = [
+            DockItem(desktop_id="strasse.desktop", wm_class="Straße"),
+        ]
+        tracker._build_wm_class_map()
+        win = FakeWindow(19, class_group="STRASSE")
+        # When / Then
+        assert tracker._match_window(win) == "strasse.desktop"
+
     def test_match_uses_class_instance_map(self, tracker_env):
         # Given
         tracker, _model, _launcher = tracker_env
@@ -269,6 +347,54 @@ class TestWindowMatching:
         # Then
         assert tracker._match_window(win) == "org.gnome.Terminal.desktop"
 
+    def test_unresolved_class_is_not_looked_up_again(self, tracker_env):
+        # Given
+        tracker, _model, launcher = tracker_env
+        launcher.resolve.return_value = None
+        win = FakeWindow(15, class_group="Foreign")
+        tracker._match_window(win)
+        calls = launcher.resolve.call_count
+        # When
+        result = tracker._match_window(win)
+        # Then
+        assert result is None
+        assert launcher.resolve.call_count == calls
+
+    def test_unresolved_cache_cleared_when_items_change(self, tracker_env):
+        # Given
+        tracker, model, launcher = tracker_env
+        launcher.resolve.return_value = None
+        tracker._match_window(FakeWindow(16, class_group="Foreign"))
+        assert "foreign" in tracker._unresolved
+        # When
+        model.visible_items.return_value = [
+            DockItem(desktop_id="foreign.desktop", wm_class="Foreign"),
+        ]
+        tracker._build_wm_class_map()
+        # Then
+        assert tracker._unresolved == set()
+
+    def test_resolved_class_survives_unchanged_rescan(self, tracker_env):
+        # Given
+        tracker, _model, launcher = tracker_env
+        info = SimpleNamespace(desktop_id="foreign.desktop")
+        launcher.resolve.return_value = info
+        tracker._match_window(FakeWindow(18, class_group="Foreign"))
+        # When
+        tracker._build_wm_class_map()
+        # Then
+        assert tracker._wm_class_to_desktop["foreign"] == "foreign.desktop"
+
+    def test_unresolved_cache_cleared_when_apps_change(self, tracker_env):
+        # Given
+        tracker, _model, launcher = tracker_env
+        launcher.resolve.return_value = None
+        tracker._match_window(FakeWindow(17, class_group="Foreign"))
+        # When
+        tracker._on_apps_changed(MagicMock())
+        # Then
+        assert tracker._unresolved == set()
+
     def test_match_returns_none_for_empty_class_group(self, tracker_env):
         # Given
         tracker, _model, _launcher = tracker_env
@@ -284,7 +410,7 @@ class TestWindowActions:
         tracker, _model, _launcher = tracker_env
         w1 = FakeWindow(1)
         w2 = FakeWindow(2)
-        tracker._running_xids_by_desktop = {"firefox.desktop": [1, 2]}
+        tracker._xids_by_desktop = {"firefox.desktop": [1, 2]}
         tracker._screen = FakeScreen(windows=[w1, w2], active_window=w2)
 
         # When
@@ -299,7 +425,7 @@ class TestWindowActions:
         w1 = FakeWindow(1)
         w2 = FakeWindow(2)
         other = FakeWindow(99)
-        tracker._running_xids_by_desktop = {"firefox.desktop": [1, 2]}
+        tracker._xids_by_desktop = {"firefox.desktop": [1, 2]}
         tracker._screen = FakeScreen(windows=[w1, w2, other], active_window=other)
 
         # When
@@ -308,12 +434,41 @@ class TestWindowActions:
         assert w1.activated_with == [123]
         assert w2.activated_with == []
 
+    def test_toggle_focus_uses_passed_timestamp(self, tracker_env):
+        # Given
+        tracker, _model, _launcher = tracker_env
+        w1 = FakeWindow(1)
+        tracker._xids_by_desktop = {"firefox.desktop": [1]}
+        tracker._screen = FakeScreen(windows=[w1], active_window=None)
+
+        # When
+        tracker.toggle_focus("firefox.desktop", 456)
+        # Then
+        assert w1.activated_with == [456]
+
+    def test_windows_closed_since_scan_are_skipped(self, tracker_env):
+        # Given: two windows scanned, then one closes before the idle rescan
+        tracker, _model, _launcher = tracker_env
+        w1 = FakeWindow(1)
+        w2 = FakeWindow(2)
+        tracker._xids_by_desktop = {"firefox.desktop": [1, 2]}
+        tracker._screen = FakeScreen(windows=[w2], active_window=None)
+
+        # When
+        windows = tracker.get_windows_for("firefox.desktop")
+        tracker.close_all("firefox.desktop")
+
+        # Then
+        assert windows == [w2]
+        assert w1.closed_with == []
+        assert w2.closed_with == [123]
+
     def test_close_all_closes_all_matching_windows(self, tracker_env):
         # Given
         tracker, _model, _launcher = tracker_env
         w1 = FakeWindow(1)
         w2 = FakeWindow(2)
-        tracker._running_xids_by_desktop = {"firefox.desktop": [1, 2]}
+        tracker._xids_by_desktop = {"firefox.desktop": [1, 2]}
         tracker._screen = FakeScreen(windows=[w1, w2], active_window=None)
 
         # When
@@ -74,6 +74,7 @@ class TestEasing:
 class TestAutoHideState:
     def _make_controller(self, autohide=True, hide_delay=0, unhide_delay=0):
         window = MagicMock()
+        window.get_size.return_value = (800, 100)
         config = MagicMock()
         config.autohide = autohide
         config.hide_delay_ms = hide_delay
@@ -131,14 +132,15 @@ class TestAutoHideState:
         ctrl = self._make_controller()
         ctrl.state = HideState.SHOWING
         ctrl.hide_offset = 0.4
-        ctrl._anim_timer_id = 42
+        ctrl._anim_tick_id = 42
         ctrl._unhide_timer_id = 7
         # When
         ctrl.reset()
         # Then
         assert ctrl.state == HideState.VISIBLE
         assert ctrl.hide_offset == 0.0
-        assert ctrl._anim_timer_id == 0
+        assert ctrl._anim_tick_id == 0
+        ctrl._window.drawing_area.remove_tick_callback.assert_called_once_with(42)
 
     def test_reset_when_already_visible(self):
         # Given
@@ -149,6 +151,20 @@ class TestAutoHideState:
         assert ctrl.state == HideState.VISIBLE
         assert ctrl.hide_offset == 0.0
 
+    def test_mouse_enter_cancels_pending_hide_timer(self, monkeypatch):
+        # Given
+        import docking.ui.autohide as autohide_mod
+
+        source_remove = MagicMock()
+        monkeypatch.setattr(autohide_mod.GLib, "source_remove", source_remove)
+        ctrl = self._make_controller()
+        ctrl._hide_timer_id = 11
+        # When
+        ctrl.on_mouse_enter()
+        # Then
+        source_remove.assert_called_once_with(11)
+        assert ctrl._hide_timer_id == 0
+
 
 class TestZoomProgressFormula:
     """zoom_progress must use linear formula (1 - hide_offset), not compound.
@@ -161,6 +177,7 @@ class TestZoomProgressFormula:
 
     def _make_controller(self):
         window = MagicMock()
+        window.get_size.return_value = (800, 100)
         config = MagicMock()
         config.autohide = True
         config.hide_delay_ms = 0
@@ -204,3 +221,124 @@ class TestZoomProgressFormula:
         ctrl._animation_tick()
         # near fully shown
         assert ctrl.zoom_progress > 0.9
+
+
+class TestFrameClockDriver:
+    def _make_controller(self, hide_time_ms=250):
+        window = MagicMock()
+        window.get_size.return_value = (800, 100)
+        window.drawing_area.add_tick_callback.return_value = 5
+        config = MagicMock()
+        config.autohide = True
+        config.hide_delay_ms = 0
+        config.unhide_delay_ms = 0
+        config.hide_time_ms = hide_time_ms
+        return AutoHideController(window, config)
+
+    @staticmethod
+    def _clock(frame_time_us):
+        clock = MagicMock()
+        clock.get_frame_time.return_value = frame_time_us
+        return clock
+
+    def test_start_hiding_registers_tick_callback(self):
+        # Given
+        ctrl = self._make_controller()
+        # When
+        ctrl.on_mouse_leave()
+        # Then
+        ctrl._window.drawing_area.add_tick_callback.assert_called_once_with(
+            ctrl._on_frame_tick
+        )
+        assert ctrl._anim_tick_id == 5
+
+    def test_progress_follows_frame_time(self):
+        # Given
+        ctrl = self._make_controller()
+        ctrl._start_hiding()
+        ctrl._on_frame_tick(None, self._clock(frame_time_us=1_000_000))
+        # When: 125ms later, half of the 250ms animation
+        keep = ctrl._on_frame_tick(None, self._clock(frame_time_us=1_125_000))
+        # Then
+        assert keep
+        assert ctrl._anim_progress == pytest.approx(0.5)
+        assert ctrl.hide_offset == pytest.approx(ease_in_cubic(t=0.5))
+
+    def test_offset_follows_curve_between_60hz_frames(self):
+        # Given: a 144Hz frame lands between two 16ms steps
+        ctrl = self._make_controller()
+        ctrl._start_showing()
+        ctrl._on_frame_tick(None, self._clock(frame_time_us=1_000_000))
+        # When
+        ctrl._on_frame_tick(None, self._clock(frame_time_us=1_007_000))
+        # Then
+        assert ctrl.hide_offset == pytest.approx(1.0 - ease_out_cubic(t=0.028))
+
+    def test_late_frame_finishes_animation(self):
+        # Given
+        ctrl = self._make_controller()
+        ctrl._start_hiding()
+        ctrl._on_frame_tick(None, self._clock(frame_time_us=1_000_000))
+        # When: next frame arrives well past the duration
+        keep = ctrl._on_frame_tick(None, self._clock(frame_time_us=2_000_000))
+        # Then
+        assert not keep
+        assert ctrl.state == HideState.HIDDEN
+        assert ctrl.hide_offset == 1.0
+        assert ctrl._anim_tick_id == 0
+
+    def test_subpixel_frames_skip_redraw(self):
+        # Given: a hide in progress that has drawn its current offset
+        ctrl = self._make_controller()
+        ctrl._start_hiding()
+        ctrl._on_frame_tick(None, self._clock(frame_time_us=1_000_000))
+        ctrl._on_frame_tick(None, self._clock(frame_time_us=1_016_000))
+        ctrl._window.queue_redraw.reset_mock()
+        # When: the next frame moves the dock by less than a pixel
+        ctrl._on_frame_tick(None, self._clock(frame_time_us=1_016_500))
+        # Then
+        ctrl._window.queue_redraw.assert_not_called()
+
+    def test_terminal_frame_always_redraws(self):
+        # Given
+        ctrl = self._make_controller()
+        ctrl._start_hiding()
+        ctrl._on_frame_tick(None, self._clock(frame_time_us=1_000_000))
+        ctrl._window.queue_redraw.reset_mock()
+        # When
+        ctrl._on_frame_tick(None, self._clock(frame_time_us=1_250_000))
+        # Then
+        ctrl._window.queue_redraw.assert_called_once()
+
+    def test_zero_duration_hides_without_tick_callback(self):
+        # Given
+        ctrl = self._make_controller(hide_time_ms=0)
+        # When
+        ctrl.on_mouse_leave()
+        # Then
+        ctrl._window.drawing_area.add_tick_callback.assert_not_called()
+        assert ctrl.state == HideState.HIDDEN
+        assert ctrl.hide_offset == 1.0
+        assert ctrl.zoom_progress == 0.0
+        ctrl._window.queue_redraw.assert_called_once()
+
+    def test_zero_duration_shows_immediately(self):
+        # Given
+        ctrl = self._make_controller(hide_time_ms=0)
+        ctrl.state = HideState.HIDDEN
+        ctrl.hide_offset = 1.0
+        # When
+        ctrl.on_mouse_enter()
+        # Then
+        assert ctrl.state == HideState.VISIBLE
+        assert ctrl.hide_offset == 0.0
+
+
+class TestSlots:
+    def test_controller_has_no_instance_dict(self):
+        # Given
+        ctrl = AutoHideController(MagicMock(), MagicMock())
+        # When / Then
+        assert not hasattr(ctrl, "__dict__")
+        with pytest.raises(AttributeError):
+            ctrl.unknown_attribute = 1
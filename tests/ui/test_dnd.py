@@ -9,7 +9,8 @@ gi_mock.require_version = MagicMock()
 sys.modules.setdefault("gi", gi_mock)
 sys.modules.setdefault("gi.repository", gi_mock.repository)
 
-from docking.ui.dnd import DRAG_ICON_SCALE, DnDHandler  # noqa: E402
+from docking.core.config import DRAG_ICON_SCALE  # noqa: E402
+from docking.ui.dnd import DnDHandler  # noqa: E402
 
 
 class TestConstants:
@@ -129,3 +130,58 @@ class TestUriToDesktopId:
     def test_non_desktop_plain_path(self):
         # Given / When / Then
         assert DnDHandler._uri_to_desktop_id("readme.txt") is None
+
+    def test_absolute_plain_path_is_not_percent_decoded(self):
+        # Given
+        uri = "/usr/share/applications/my%20app.desktop"
+        # When / Then
+        assert DnDHandler._uri_to_desktop_id(uri) == "my%20app.desktop"
+
+    def test_file_uri_with_host(self):
+        # Given
+        uri = "file://localhost/usr/share/applications/firefox.desktop"
+        # When / Then
+        assert DnDHandler._uri_to_desktop_id(uri) == "firefox.desktop"
+
+    def test_file_uri_query_and_fragment_are_stripped(self):
+        # Given
+        uri = "file:///usr/share/applications/firefox.desktop?x=1#top"
+        # When / Then
+        assert DnDHandler._uri_to_desktop_id(uri) == "firefox.desktop"
+
+    def test_scheme_without_slashes_returns_none(self):
+        # Given
+        uri = "mailto:someone@example.com/app.desktop"
+        # When / Then
+        assert DnDHandler._uri_to_desktop_id(uri) is None
+
+    def test_plain_file_uri_skips_urlparse(self, monkeypatch):
+        # Given
+        from docking.ui import dnd as dnd_mod
+
+        def fail(_uri):
+            raise AssertionError("urlparse called")
+
+        monkeypatch.setattr(dnd_mod, "urlparse", fail)
+        uri = "file:///usr/share/applications/fast-path%20test.desktop"
+        # When / Then
+        assert DnDHandler._uri_to_desktop_id(uri) == "fast-path test.desktop"
+
+    def test_file_uri_without_path_returns_none(self):
+        # Given: the name is the host, not a path
+        uri = "file://firefox.desktop"
+        # When / Then
+        assert DnDHandler._uri_to_desktop_id(uri) is None
+
+    def test_repeat_uri_is_memoized(self):
+        # Given
+        from docking.ui.dnd import _uri_to_desktop_id_cached
+
+        uri = "file:///usr/share/applications/memo-test.desktop"
+        DnDHandler._uri_to_desktop_id(uri)
+        hits = _uri_to_desktop_id_cached.cache_info().hits
+        # When
+        result = DnDHandler._uri_to_desktop_id(uri)
+        # Then
+        assert result == "memo-test.desktop"
+        assert _uri_to_desktop_id_cached.cache_info().hits == hits + 1
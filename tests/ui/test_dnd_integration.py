@@ -36,9 +36,12 @@ def _make_handler(monkeypatch, lock_icons: bool = False):
     model = MagicMock()
     config = SimpleNamespace(
         lock_icons=lock_icons,
+        position="bottom",
         pos=Position.BOTTOM,
         icon_size=48,
         zoom_percent=2.0,
+        zoomed_icon_size=96,
+        drag_icon_size=57,
         pinned=[],
         save=MagicMock(),
     )
@@ -64,14 +67,15 @@ class TestSetupAndToggle:
     def test_set_locked_toggles_dnd(self, monkeypatch):
         # Given
         handler = _make_handler(monkeypatch)
-        handler._disable_dnd = MagicMock()
-        handler._enable_dnd = MagicMock()
+        disable, enable = MagicMock(), MagicMock()
+        monkeypatch.setattr(dnd_mod.DnDHandler, "_disable_dnd", disable)
+        monkeypatch.setattr(dnd_mod.DnDHandler, "_enable_dnd", enable)
         # When
         handler.set_locked(True)
         handler.set_locked(False)
         # Then
-        handler._disable_dnd.assert_called_once()
-        handler._enable_dnd.assert_called_once()
+        disable.assert_called_once()
+        enable.assert_called_once()
 
 
 class TestDragBeginMotion:
@@ -96,6 +100,50 @@ class TestDragBeginMotion:
         assert handler.drag_index == 0
         icon_set.assert_called_once()
 
+    def test_first_motion_uses_centers_built_at_drag_begin(self, monkeypatch):
+        # Given
+        handler = _make_handler(monkeypatch)
+        handler._model.visible_items.return_value = [
+            DockItem(desktop_id="a.desktop"),
+            DockItem(desktop_id="b.desktop"),
+        ]
+        compute = MagicMock(return_value=_layout([0.0, 70.0]))
+        monkeypatch.setattr(dnd_mod, "compute_layout", compute)
+        monkeypatch.setattr(dnd_mod.Gdk, "drag_status", lambda *_a, **_k: None)
+        monkeypatch.setattr(dnd_mod.GLib, "idle_add", MagicMock())
+        widget = handler._window.drawing_area
+        handler._on_drag_begin(widget, MagicMock())
+        calls = compute.call_count
+
+        # When
+        handler._on_drag_motion(widget, MagicMock(), 100, 5, 1)
+        # Then
+        assert handler.drag_index == 0
+        assert compute.call_count == calls
+
+    def test_drag_begin_reuses_scaled_icon(self, monkeypatch):
+        # Given
+        handler = _make_handler(monkeypatch)
+        icon = MagicMock()
+        scaled = object()
+        icon.scale_simple.return_value = scaled
+        handler._model.visible_items.return_value = [
+            DockItem(desktop_id="firefox.desktop", name="Firefox", icon=icon)
+        ]
+        monkeypatch.setattr(
+            dnd_mod, "compute_layout", lambda *args, **kwargs: _layout([0.0])
+        )
+        icon_set = MagicMock()
+        monkeypatch.setattr(dnd_mod.Gtk, "drag_set_icon_pixbuf", icon_set)
+
+        # When: the same item is dragged twice
+        handler._on_drag_begin(handler._window.drawing_area, MagicMock())
+        handler._on_drag_begin(handler._window.drawing_area, MagicMock())
+        # Then
+        icon.scale_simple.assert_called_once()
+        assert icon_set.call_count == 2
+        assert icon_set.call_args[0][1] is scaled
+
     def test_drag_motion_external_updates_insert_gap(self, monkeypatch):
         # Given
         handler = _make_handler(monkeypatch)
@@ -142,15 +190,165 @@ class TestDragBeginMotion:
         )
         monkeypatch.setattr(dnd_mod.Gdk, "drag_status", lambda *_a, **_k: None)
 
+        idle_add = MagicMock()
+        monkeypatch.setattr(dnd_mod.GLib, "idle_add", idle_add)
+
         # When
         handled = handler._on_drag_motion(
             handler._window.drawing_area, MagicMock(), 200, 5, 1
         )
+        handler._flush_reorder()
         # Then
         assert handled is True
-        handler._model.reorder_visible.assert_called_once()
+        idle_add.assert_called_once_with(handler._flush_reorder)
+        handler._model.reorder_visible.assert_called_once_with(0, 1)
         assert handler.drag_index == 1
 
+    def test_drag_motion_burst_reorders_once_to_latest_target(self, monkeypatch):
+        # Given
+        handler = _make_handler(monkeypatch)
+        handler._drag_from = 0
+        handler.drag_index = 0
+        handler._model.visible_items.return_value = [
+            DockItem("a.desktop"),
+            DockItem("b.desktop"),
+            DockItem("c.desktop"),
+        ]
+        monkeypatch.setattr(
+            dnd_mod,
+            "compute_layout",
+            lambda *args, **kwargs: _layout([0.0, 70.0, 140.0]),
+        )
+        monkeypatch.setattr(dnd_mod.Gdk, "drag_status", lambda *_a, **_k: None)
+        idle_add = MagicMock()
+        monkeypatch.setattr(dnd_mod.GLib, "idle_add", idle_add)
+        widget = handler._window.drawing_area
+
+        # When: two motion events cross two centers before the idle runs
+        handler._on_drag_motion(widget, MagicMock(), 100, 5, 1)
+        handler._on_drag_motion(widget, MagicMock(), 200, 5, 2)
+        widget.queue_draw.assert_not_called()
+        handler._flush_reorder()
+        # Then
+        idle_add.assert_called_once()
+        handler._model.reorder_visible.assert_called_once_with(0, 2)
+        assert handler.drag_index == 2
+
+    def test_drag_motion_enters_autohide_once_per_entry(self, monkeypatch):
+        # Given
+        handler = _make_handler(monkeypatch)
+        handler._model.visible_items.return_value = [DockItem("a.desktop")]
+        monkeypatch.setattr(
+            dnd_mod, "compute_layout", lambda *args, **kwargs: _layout([0.0])
+        )
+        monkeypatch.setattr(dnd_mod.Gdk, "drag_status", lambda *_a, **_k: None)
+        widget = handler._window.drawing_area
+        autohide = handler._window.autohide
+
+        # When
+        handler._on_drag_motion(widget, MagicMock(), 10, 5, 1)
+        handler._on_drag_motion(widget, MagicMock(), 12, 5, 2)
+        # Then
+        autohide.on_mouse_enter.assert_called_once()
+
+        # When: the drag leaves and comes back
+        handler._on_drag_leave(widget, MagicMock(), 3)
+        handler._on_drag_motion(widget, MagicMock(), 10, 5, 4)
+        # Then
+        assert autohide.on_mouse_enter.call_count == 2
+
+    def test_drag_motion_within_slot_skips_bisect(self, monkeypatch):
+        # Given: dragging item 1, centers at 24/94/164
+        handler = _make_handler(monkeypatch)
+        handler._drag_from = 1
+        handler.drag_index = 1
+        handler._model.visible_items.return_value = [
+            DockItem("a.desktop"),
+            DockItem("b.desktop"),
+            DockItem("c.desktop"),
+        ]
+        monkeypatch.setattr(
+            dnd_mod,
+            "compute_layout",
+            lambda *args, **kwargs: _layout([0.0, 70.0, 140.0]),
+        )
+        monkeypatch.setattr(dnd_mod.Gdk, "drag_status", lambda *_a, **_k: None)
+        idle_add = MagicMock()
+        monkeypatch.setattr(dnd_mod.GLib, "idle_add", idle_add)
+        bisect_right = MagicMock(side_effect=dnd_mod.bisect.bisect_right)
+        monkeypatch.setattr(dnd_mod.bisect, "bisect_right", bisect_right)
+        widget = handler._window.drawing_area
+
+        # When: cursor stays between the neighbouring centers
+        handler._on_drag_motion(widget, MagicMock(), 60, 5, 1)
+        # Then
+        bisect_right.assert_not_called()
+        idle_add.assert_not_called()
+        assert handler._pending_new_index == 1
+
+        # When: cursor crosses the next center
+        handler._on_drag_motion(widget, MagicMock(), 170, 5, 2)
+        # Then
+        bisect_right.assert_called_once()
+        assert handler._pending_new_index == 2
+        idle_add.assert_called_once_with(handler._flush_reorder)
+
+    def test_drag_motion_reuses_centers_for_same_items(self, monkeypatch):
+        # Given
+        handler = _make_handler(monkeypatch)
+        handler._model.visible_items.return_value = [
+            DockItem("a.desktop"),
+            DockItem("b.desktop"),
+            DockItem("c.desktop"),
+        ]
+        compute = MagicMock(return_value=_layout([0.0, 70.0, 140.0]))
+        monkeypatch.setattr(dnd_mod, "compute_layout", compute)
+        monkeypatch.setattr(dnd_mod.Gdk, "drag_status", lambda *_a, **_k: None)
+        widget = handler._window.drawing_area
+
+        # When: centers are at 24, 94 and 164
+        handler._on_drag_motion(widget, MagicMock(), x=24, y=5, time=1)
+        first = handler.drop_insert_index
+        handler._on_drag_motion(widget, MagicMock(), x=200, y=5, time=2)
+        # Then
+        assert first == 1
+        assert handler.drop_insert_index == 3
+        compute.assert_called_once()
+
+    def test_drag_centers_round_up_to_ints(self, monkeypatch):
+        # Given: a half-pixel offset puts the first center at 24.5
+        handler = _make_handler(monkeypatch)
+        handler._window.zoomed_main_offset.return_value = 0.5
+        handler._model.visible_items.return_value = [
+            DockItem("a.desktop"),
+            DockItem("b.desktop"),
+        ]
+        monkeypatch.setattr(
+            dnd_mod, "compute_layout", lambda *args, **kwargs: _layout([0.0, 70.0])
+        )
+
+        # When
+        centers = handler._layout_centers()
+        # Then: int motion coordinates bisect as against the float centers
+        assert centers == [25, 95]
+        assert all(type(c) is int for c in centers)
+        assert dnd_mod.bisect.bisect_right(centers, 24) == 0
+        assert dnd_mod.bisect.bisect_right(centers, 25) == 1
+
+    def test_drag_centers_recomputed_when_icon_size_changes(self, monkeypatch):
+        # Given
+        handler = _make_handler(monkeypatch)
+        handler._model.visible_items.return_value = [DockItem("a.desktop")]
+        compute = MagicMock(return_value=_layout([0.0]))
+        monkeypatch.setattr(dnd_mod, "compute_layout", compute)
+        handler._layout_centers()
+        # When
+        handler._config.icon_size = 64
+        centers = handler._layout_centers()
+        # Then
+        assert compute.call_count == 2
+        assert centers == [32.0]
+
 
 class TestDropAndReceive:
     def test_drag_drop_requests_target_data(self, monkeypatch):
@@ -233,11 +431,93 @@ class TestDropAndReceive:
         # Then
         assert handler._config.pinned == ["firefox.desktop"]
         assert len(handler._model.pinned_items) == 1
-        handler._config.save.assert_called_once()
+        handler._config.save.assert_not_called()
         handler._model.sync_pinned_to_config.assert_called_once()
         handler._model.notify.assert_called_once()
         finish.assert_called_once_with(ANY, True, False, 77)
 
+    def test_drag_data_received_inserts_batch_in_order(self, monkeypatch):
+        # Given
+        handler = _make_handler(monkeypatch)
+        handler._drag_from = -1
+        handler.drop_insert_index = 1
+        existing = [DockItem("a.desktop"), DockItem("z.desktop")]
+        handler._model.pinned_items = list(existing)
+        handler._config.pinned = ["a.desktop", "z.desktop"]
+        handler._model.find_by_desktop_id.return_value = None
+        handler._launcher.resolve.return_value = SimpleNamespace(
+            name="App", icon_name="app", wm_class="app"
+        )
+        selection = MagicMock()
+        selection.get_uris.return_value = [
+            "file:///apps/b.desktop",
+            "file:///apps/c.desktop",
+            "file:///apps/b.desktop",
+        ]
+        monkeypatch.setattr(dnd_mod.Gtk, "drag_finish", MagicMock())
+
+        # When
+        handler._on_drag_data_received(
+            handler._window.drawing_area, MagicMock(), 0, 0, selection, 1, 1
+        )
+        # Then
+        assert handler._config.pinned == [
+            "a.desktop",
+            "b.desktop",
+            "c.desktop",
+            "z.desktop",
+        ]
+        assert [i.desktop_id for i in handler._model.pinned_items] == [
+            "a.desktop",
+            "b.desktop",
+            "c.desktop",
+            "z.desktop",
+        ]
+        assert handler._launcher.resolve.call_count == 2
+
+    def test_dropped_icons_load_one_per_idle_pass(self, monkeypatch):
+        # Given
+        handler = _make_handler(monkeypatch)
+        handler._drag_from = -1
+        handler._model.pinned_items = []
+        handler._model.find_by_desktop_id.return_value = None
+        handler._launcher.resolve.side_effect = lambda desktop_id: SimpleNamespace(
+            name=desktop_id, icon_name=desktop_id[:1], wm_class=""
+        )
+        icons = {"b": object(), "c": object()}
+        handler._launcher.load_icon.side_effect = lambda name, _size: icons[name]
+        selection = MagicMock()
+        selection.get_uris.return_value = [
+            "file:///apps/b.desktop",
+            "file:///apps/c.desktop",
+        ]
+        monkeypatch.setattr(dnd_mod.Gtk, "drag_finish", MagicMock())
+        idle_add = MagicMock()
+        monkeypatch.setattr(dnd_mod.GLib, "idle_add", idle_add)
+
+        # When
+        handler._on_drag_data_received(
+            handler._window.drawing_area, MagicMock(), 0, 0, selection, 1, 1
+        )
+        # Then: items are in place before any icon is loaded
+        b, c = handler._model.pinned_items
+        assert b.icon is None and c.icon is None
+        handler._launcher.load_icon.assert_not_called()
+        callback, pending = idle_add.call_args.args
+
+        # When
+        more = callback(pending)
+        # Then
+        assert more is True
+        assert b.icon is icons["b"] and c.icon is None
+
+        # When
+        more = callback(pending)
+        # Then
+        assert more is False
+        assert c.icon is icons["c"]
+        handler._launcher.load_icon.assert_called_with("c", 96)
+
 
 class TestDragLeaveEnd:
     def test_drag_leave_schedules_deferred_clear_and_autohide(self, monkeypatch):
@@ -245,18 +525,14 @@ class TestDragLeaveEnd:
         handler = _make_handler(monkeypatch)
         handler._drag_from = -1
         handler.drop_insert_index = 1
-        timeout_calls = []
-        monkeypatch.setattr(
-            dnd_mod.GLib,
-            "timeout_add",
-            lambda delay, cb, widget: timeout_calls.append((delay, cb, widget)) or 1,
-        )
+        idle_add = MagicMock()
+        monkeypatch.setattr(dnd_mod.GLib, "idle_add", idle_add)
         widget = handler._window.drawing_area
 
         # When
         handler._on_drag_leave(widget, MagicMock(), 0)
         # Then
-        assert timeout_calls and timeout_calls[0][0] == 100
+        idle_add.assert_called_once_with(handler._deferred_clear_drop_gap, widget)
         handler._window.autohide.on_mouse_leave.assert_called_once()
         widget.queue_draw.assert_called()
 
@@ -272,6 +548,19 @@ class TestDragLeaveEnd:
         assert handler.drop_insert_index == -1
         widget.queue_draw.assert_called_once()
 
+    def test_deferred_clear_keeps_gap_while_drop_data_pending(self, monkeypatch):
+        # Given: drag-drop requested the URI data right after drag-leave
+        handler = _make_handler(monkeypatch)
+        handler._drag_from = -1
+        handler.drop_insert_index = 2
+        widget = handler._window.drawing_area
+        widget.drag_dest_find_target.return_value = "text/uri-list"
+        handler._on_drag_drop(widget, MagicMock(), 0, 0, 1)
+        # When
+        handler._deferred_clear_drop_gap(widget)
+        # Then
+        assert handler.drop_insert_index == 2
+
     def test_drag_end_unpins_when_dropped_outside(self, monkeypatch):
         # Given
         handler = _make_handler(monkeypatch)
@@ -296,5 +585,72 @@ class TestDragLeaveEnd:
         handler._model.unpin_item.assert_called_once_with("firefox.desktop")
         assert handler._renderer.slide_offsets == {}
         assert handler._renderer.prev_positions == {}
-        handler._config.save.assert_called()
+        assert handler._save_timer_id != 0
         widget.queue_draw.assert_called()
+
+    def test_drag_end_skips_pointer_and_items_when_not_needed(self, monkeypatch):
+        # Given: an external drag never touches the pointer
+        handler = _make_handler(monkeypatch)
+        widget = handler._window.drawing_area
+
+        # When
+        handler._on_drag_end(widget, MagicMock())
+        # Then
+        handler._window.get_display.assert_not_called()
+
+        # Given: an internal drag released over the dock
+        handler._drag_from = 0
+        handler.drag_index = 0
+        pointer = MagicMock()
+        pointer.get_position.return_value = (None, 200, 230)
+        seat = MagicMock()
+        seat.get_pointer.return_value = pointer
+        display = MagicMock()
+        display.get_default_seat.return_value = seat
+        handler._window.get_display.return_value = display
+        handler._window.get_position.return_value = (100, 200)
+        handler._window.get_size.return_value = (400, 60)
+
+        # When
+        handler._on_drag_end(widget, MagicMock())
+        # Then
+        handler._model.visible_items.assert_not_called()
+        handler._model.unpin_item.assert_not_called()
+
+    def test_drag_end_and_drop_share_one_debounced_save(self, monkeypatch):
+        # Given
+        handler = _make_handler(monkeypatch)
+        timeout_add = MagicMock(return_value=42)
+        monkeypatch.setattr(dnd_mod.GLib, "timeout_add", timeout_add)
+        handler._model.visible_items.return_value = []
+        widget = handler._window.drawing_area
+
+        # When
+        handler._on_drag_end(widget, MagicMock())
+        handler._on_drag_end(widget, MagicMock())
+        # Then
+        timeout_add.assert_called_once_with(
+            dnd_mod.SAVE_DEBOUNCE_MS, handler._on_save_timeout
+        )
+        handler._config.save.assert_not_called()
+
+        # When
+        assert handler._on_save_timeout() is False
+        # Then
+        handler._config.save.assert_called_once()
+        assert handler._save_timer_id == 0
+
+    def test_flush_pending_save_writes_immediately(self, monkeypatch):
+        # Given
+        handler = _make_handler(monkeypatch)
+        monkeypatch.setattr(dnd_mod.GLib, "timeout_add", MagicMock(return_value=42))
+        source_remove = MagicMock()
+        monkeypatch.setattr(dnd_mod.GLib, "source_remove", source_remove)
+        handler._schedule_save()
+
+        # When
+        handler.flush_pending_save()
+        handler.flush_pending_save()
+        # Then
+        source_remove.assert_called_once_with(42)
+        handler._config.save.assert_called_once()
@@ -19,6 +19,7 @@ def _make_stub(item: DockItem | None = None):
     item = item or DockItem(desktop_id="firefox.desktop")
     stub = SimpleNamespace()
     stub.config = SimpleNamespace(pos=Position.BOTTOM)
+    stub._horizontal = True
     stub.model = MagicMock()
     stub.model.visible_items.return_value = [item]
     stub.model.get_applet = MagicMock()
@@ -38,10 +39,28 @@ def _make_stub(item: DockItem | None = None):
     stub.local_cursor_main = MagicMock(return_value=-1e6)
     stub._main_axis_cursor = MagicMock(return_value=33.0)
     stub.hit_test = MagicMock(return_value=item)
+    stub.cached_layout = MagicMock(return_value=_layout())
     stub._update_dock_size = MagicMock()
+    stub.renderer = MagicMock()
+    stub.renderer.slide_offsets = {}
+    stub._slide_tick_id = 0
+    stub._glow_until_us = 0
     return stub, item
 
 
+def _record_idle(monkeypatch):
+    calls: list[tuple] = []
+    monkeypatch.setattr(
+        dock_window_mod.GLib, "idle_add", lambda *args: calls.append(args)
+    )
+    return calls
+
+
+def _run_idle(calls):
+    for func, *args in calls:
+        assert func(*args) is False
+
+
 class TestButtonReleaseFlow:
     def test_right_click_opens_context_menu(self):
         # Given
@@ -99,6 +118,8 @@ class TestButtonReleaseFlow:
         )
         monkeypatch.setattr(dock_window_mod, "is_applet", lambda desktop_id: False)
         monkeypatch.setattr(dock_window_mod.GLib, "get_monotonic_time", lambda: 1010)
+        monkeypatch.setattr(dock_window_mod.Gtk, "get_current_event_time", lambda: 77)
+        idle = _record_idle(monkeypatch)
 
         # When
         handled = dock_window_mod.DockWindow._on_button_release(
@@ -106,7 +127,9 @@ class TestButtonReleaseFlow:
         )
         # Then
         assert handled is True
-        stub.window_tracker.toggle_focus.assert_called_once_with("firefox.desktop")
+        stub.window_tracker.toggle_focus.assert_not_called()
+        _run_idle(idle)
+        stub.window_tracker.toggle_focus.assert_called_once_with("firefox.desktop", 77)
         stub._hover.start_anim_pump.assert_called_once_with(350)
         assert item.last_clicked == 1010
         assert item.last_launched == 0
@@ -129,6 +152,7 @@ class TestButtonReleaseFlow:
             "launch",
             lambda desktop_id: launch_calls.append(desktop_id),
         )
+        idle = _record_idle(monkeypatch)
 
         # When
         handled = dock_window_mod.DockWindow._on_button_release(
@@ -136,9 +160,12 @@ class TestButtonReleaseFlow:
         )
         # Then
         assert handled is True
+        assert launch_calls == []
+        _run_idle(idle)
         assert launch_calls == ["firefox.desktop"]
         assert item.last_launched == 2020
         stub._hover.start_anim_pump.assert_called_once_with(700)
+        stub.renderer.invalidate_frame.assert_called_once()
 
     def test_drag_delta_above_threshold_is_ignored(self):
         # Given
@@ -259,7 +286,7 @@ class TestLeaveEnterFlow:
         stub._preview.schedule_hide.assert_called_once()
         assert stub.cursor_x == -1.0
         assert stub.cursor_y == -1.0
-        stub._update_dock_size.assert_called_once()
+        stub._update_dock_size.assert_not_called()
         widget.queue_draw.assert_called_once()
 
     def test_enter_sets_cursor_and_notifies_autohide(self):
@@ -294,11 +321,373 @@ class TestUrgentGlow:
         stub.autohide.state = HideState.VISIBLE
         assert dock_window_mod.DockWindow._has_active_urgent_glow(stub) is False
 
-    def test_urgent_glow_tick_requests_redraw_once(self):
+    def test_glow_end_is_cached_until_it_passes(self, monkeypatch):
         # Given
         stub, _item = _make_stub()
+        urgent = DockItem(desktop_id="urgent.desktop", last_urgent=1500)
+        stub.model.visible_items.return_value = [urgent]
+        stub.autohide = SimpleNamespace(enabled=True, state=HideState.HIDDEN)
+        stub.theme = SimpleNamespace(urgent_glow_time_ms=2)
+        now = [3000]
+        monkeypatch.setattr(dock_window_mod.GLib, "get_monotonic_time", lambda: now[0])
+        has_glow = dock_window_mod.DockWindow._has_active_urgent_glow
+        assert has_glow(stub) is True
+
+        # When: still glowing, then past the end with a newer urgent item
+        now[0] = 3400
+        still = has_glow(stub)
+        calls_while_glowing = stub.model.visible_items.call_count
+        urgent.last_urgent = 3600
+        now[0] = 3700
+        renewed = has_glow(stub)
+        now[0] = 5700
+        expired = has_glow(stub)
+
+        # Then
+        assert still is True
+        assert calls_while_glowing == 1
+        assert renewed is True
+        assert expired is False
+
+    def test_urgent_glow_tick_redraws_until_glow_expires(self):
+        # Given
+        stub, _item = _make_stub()
+        stub._has_active_urgent_glow = MagicMock(return_value=True)
+        stub._glow_tick_id = 4
+        widget = MagicMock()
+
+        # When
+        keep = dock_window_mod.DockWindow._urgent_glow_tick(stub, widget, None)
+        # Then
+        assert keep is True
+        widget.queue_draw.assert_called_once()
+
+        # When
+        stub._has_active_urgent_glow.return_value = False
+        keep = dock_window_mod.DockWindow._urgent_glow_tick(stub, widget, None)
+        # Then
+        assert keep is False
+        assert stub._glow_tick_id == 0
+        widget.queue_draw.assert_called_once()
+
+
+class TestSlidePump:
+    def test_reorder_slides_run_to_completion_without_motion(self):
+        # Given: a real renderer that has drawn two items, then a reorder
+        from docking.ui.renderer import DockRenderer
+
+        stub, _item = _make_stub()
+        stub.renderer = DockRenderer()
+        stub._dnd = None
+        stub._glow_tick_id = 0
+        stub._has_active_urgent_glow = MagicMock(return_value=False)
+        stub._input_region_key = (False, 1920, 120)
+        stub._autohide_state = lambda: None
+        stub.get_size = MagicMock(return_value=(1920, 120))
         stub.drawing_area = MagicMock()
+        stub.drawing_area.add_tick_callback.return_value = 9
+        stub._slide_tick = lambda widget, clock: dock_window_mod.DockWindow._slide_tick(
+            stub, widget, clock
+        )
+        a, b = DockItem("a.desktop"), DockItem("b.desktop")
+        before = [SimpleNamespace(x=0.0), SimpleNamespace(x=56.0)]
+        after = [SimpleNamespace(x=0.0), SimpleNamespace(x=56.0)]
+        stub.renderer._update_slide_offsets([a, b], before, icon_offset=0.0)
+        frames = 0
+
+        def draw_frame(*_args):
+            # What renderer.draw does to the slides on every frame
+            nonlocal frames
+            frames += 1
+            stub.renderer._update_slide_offsets([b, a], after, icon_offset=0.0)
+
+        stub.renderer.draw = MagicMock(side_effect=draw_frame)
+        widget = MagicMock()
+        widget.queue_draw.side_effect = lambda: dock_window_mod.DockWindow._on_draw(
+            stub, widget, MagicMock()
+        )
+
+        # When: the reorder's redraw lands, then the frame clock ticks
+        dock_window_mod.DockWindow._on_draw(stub, widget, MagicMock())
+        tick = stub.drawing_area.add_tick_callback.call_args[0][0]
+        assert stub._slide_tick_id == 9
+        for _ in range(100):
+            if not tick(widget, None):
+                break
+
         # Then
+        assert stub.renderer.slide_offsets == {}
+        assert stub._slide_tick_id == 0
+        assert frames > 2
+        stub.drawing_area.add_tick_callback.assert_called_once()
+
+
+class TestCachedLayout:
+    def _stub(self):
+        stub, _item = _make_stub()
+        stub.config = SimpleNamespace(
+            pos=Position.BOTTOM, icon_size=48, zoom_percent=2.0, zoom_enabled=True
+        )
+        stub._layout_cache = {}
+        stub._layout_cache_key = None
+        return stub
+
+    def test_reuses_layout_per_cursor_and_shares_rest_layout(self, monkeypatch):
+        # Given
+        stub = self._stub()
+        compute = MagicMock(side_effect=lambda *_a, **_k: _layout())
+        monkeypatch.setattr(dock_window_mod, "compute_layout", compute)
+        cached_layout = dock_window_mod.DockWindow.cached_layout
+
         # When
-        assert dock_window_mod.DockWindow._urgent_glow_tick(stub) is False
-        stub.drawing_area.queue_draw.assert_called_once()
+        hovered = cached_layout(stub, local_cursor=20.0)
+        again = cached_layout(stub, local_cursor=20.0)
+        rest = cached_layout(stub, local_cursor=-1e6)
+        rest_again = cached_layout(stub, local_cursor=-1.0)
+        # Then
+        assert again is hovered
+        assert rest_again is rest
+        assert compute.call_count == 2
+
+    def test_recomputes_when_items_or_sizes_change(self, monkeypatch):
+        # Given
+        stub = self._stub()
+        compute = MagicMock(side_effect=lambda *_a, **_k: _layout())
+        monkeypatch.setattr(dock_window_mod, "compute_layout", compute)
+        cached_layout = dock_window_mod.DockWindow.cached_layout
+        first = cached_layout(stub, local_cursor=20.0)
+
+        # When
+        stub.config.icon_size = 64
+        resized = cached_layout(stub, local_cursor=20.0)
+        stub.model.visible_items.return_value = [DockItem("other.desktop")]
+        changed = cached_layout(stub, local_cursor=20.0)
+        # Then
+        assert resized is not first
+        assert changed is not resized
+        assert compute.call_count == 3
+
+
+class TestHitTest:
+    def test_matches_full_scan_across_zoomed_layout(self):
+        # Given: a real zoomed layout with the cursor over the third icon
+        from docking.core.zoom import compute_layout
+
+        stub, _item = _make_stub()
+        items = [DockItem(desktop_id=f"{i}.desktop") for i in range(6)]
+        stub.model.visible_items.return_value = items
+        stub.config = SimpleNamespace(icon_size=48, zoom_percent=2.0, zoom_enabled=True)
+        stub.zoomed_main_offset = MagicMock(return_value=0.0)
+        layout = compute_layout(items, stub.config, 150.0, item_padding=8, h_padding=10)
+
+        def full_scan(coord):
+            for it, li in zip(items, layout):
+                if li.x <= coord <= li.x + li.scale * 48:
+                    return it
+            return None
+
+        # When / Then
+        for coord in range(-20, 500, 3):
+            found = dock_window_mod.DockWindow.hit_test(
+                stub, main_coord=float(coord), layout=layout
+            )
+            assert found is full_scan(coord)
+
+
+class TestZoomedMainOffset:
+    def _stub(self):
+        stub, _item = _make_stub()
+        stub.config = SimpleNamespace(icon_size=48)
+        stub._offset_layout = None
+        stub._offset_main_size = -1
+        stub._offset = 0.0
+        stub.size = 1000
+        stub._main_axis_window_size = lambda: stub.size
+        return stub
+
+    def test_same_layout_reuses_offset(self, monkeypatch):
+        # Given
+        stub = self._stub()
+        bounds = MagicMock(return_value=(0.0, 200.0))
+        monkeypatch.setattr(dock_window_mod, "content_bounds", bounds)
+        layout = _layout()
+        offset_of = dock_window_mod.DockWindow.zoomed_main_offset
+
+        # When
+        first = offset_of(stub, layout=layout)
+        second = offset_of(stub, layout=layout)
+
+        # Then
+        assert first == second == 400.0
+        bounds.assert_called_once()
+
+    def test_new_layout_or_window_size_recomputes(self, monkeypatch):
+        # Given
+        stub = self._stub()
+        bounds = MagicMock(return_value=(0.0, 200.0))
+        monkeypatch.setattr(dock_window_mod, "content_bounds", bounds)
+        layout = _layout()
+        offset_of = dock_window_mod.DockWindow.zoomed_main_offset
+        offset_of(stub, layout=layout)
+
+        # When
+        offset_of(stub, layout=_layout())
+        stub.size = 800
+        resized = offset_of(stub, layout=layout)
+
+        # Then
+        assert resized == 300.0
+        assert bounds.call_count == 3
+
+
+class TestDockMonitor:
+    def _stub(self):
+        stub, _item = _make_stub()
+        stub._monitor = None
+        stub._monitor_geom = None
+        stub.display = MagicMock()
+        stub.get_display = lambda: stub.display
+        stub._dock_monitor = lambda: dock_window_mod.DockWindow._dock_monitor(stub)
+        stub.get_realized = MagicMock(return_value=True)
+        stub.reposition = MagicMock()
+        return stub
+
+    def test_monitor_is_looked_up_once(self):
+        # Given
+        stub = self._stub()
+
+        # When
+        first = stub._dock_monitor()
+        second = stub._dock_monitor()
+
+        # Then
+        assert first == second
+        stub.display.get_primary_monitor.assert_called_once()
+        first[0].get_geometry.assert_called_once()
+
+    def test_monitors_changed_refreshes_and_repositions(self):
+        # Given
+        stub = self._stub()
+        stub._dock_monitor()
+
+        # When
+        dock_window_mod.DockWindow._on_monitors_changed(stub, MagicMock())
+        stub._dock_monitor()
+
+        # Then
+        assert stub.display.get_primary_monitor.call_count == 2
+        stub.reposition.assert_called_once()
+
+
+class TestUpdateInputRegion:
+    def _stub(self):
+        stub, _item = _make_stub()
+        stub.config = SimpleNamespace(pos=Position.BOTTOM, icon_size=48)
+        stub.theme = SimpleNamespace(h_padding=10, item_padding=8, bottom_padding=4)
+        stub.gdk_window = MagicMock()
+        stub.get_window = lambda: stub.gdk_window
+        stub.get_size = lambda: (1920, 120)
+        stub._autohide_state = lambda: None
+        stub._input_region_key = None
+        stub._last_input_rect = None
+        return stub
+
+    def _update(self, monkeypatch, stub, rect):
+        monkeypatch.setattr(
+            dock_window_mod, "content_bounds", lambda **_kwargs: (0.0, 100.0)
+        )
+        monkeypatch.setattr(dock_window_mod, "compute_input_rect", lambda **_k: rect)
+        dock_window_mod.DockWindow._update_input_region(stub)
+
+    def test_partial_rect_installs_region_once(self, monkeypatch):
+        # Given
+        rect = dock_window_mod.Rect(900, 68, 120, 52)
+        stub = self._stub()
+
+        # When
+        self._update(monkeypatch, stub, rect)
+        self._update(monkeypatch, stub, rect)
+
+        # Then
+        stub.gdk_window.input_shape_combine_region.assert_called_once()
+        assert stub.gdk_window.input_shape_combine_region.call_args[0][0] is not None
+
+    def test_full_window_rect_clears_shape(self, monkeypatch):
+        # Given
+        rect = dock_window_mod.Rect(0, 0, 1920, 120)
+        stub = self._stub()
+
+        # When
+        self._update(monkeypatch, stub, rect)
+
+        # Then
+        stub.gdk_window.input_shape_combine_region.assert_called_once_with(None, 0, 0)
+
+
+class TestDrawInputRegion:
+    def _stub(self):
+        stub, _item = _make_stub()
+        stub._dnd = None
+        stub._glow_tick_id = 0
+        stub._has_active_urgent_glow = MagicMock(return_value=False)
+        stub._input_region_key = None
+        stub.get_size = MagicMock(return_value=(1920, 120))
+        stub.autohide = SimpleNamespace(
+            enabled=True, state=HideState.VISIBLE, hide_offset=0.0, zoom_progress=1.0
+        )
+        stub._autohide_state = lambda: dock_window_mod.DockWindow._autohide_state(stub)
+
+        def update_input_region():
+            hidden = stub._autohide_state() == HideState.HIDDEN
+            stub._input_region_key = (hidden, *stub.get_size())
+
+        stub._update_input_region = MagicMock(side_effect=update_input_region)
+        return stub
+
+    def test_input_region_refreshed_only_on_hidden_flip_or_resize(self):
+        # Given
+        stub = self._stub()
+        draw = dock_window_mod.DockWindow._on_draw
+
+        # When: first frame, then an unchanged frame
+        draw(stub, MagicMock(), MagicMock())
+        draw(stub, MagicMock(), MagicMock())
+        # Then
+        assert stub._update_input_region.call_count == 1
+
+        # When: hiding is still not HIDDEN
+        stub.autohide.state = HideState.HIDING
+        draw(stub, MagicMock(), MagicMock())
+        # Then
+        assert stub._update_input_region.call_count == 1
+
+        # When: fully hidden, then a resize lands
+        stub.autohide.state = HideState.HIDDEN
+        draw(stub, MagicMock(), MagicMock())
+        stub.get_size.return_value = (1280, 120)
+        draw(stub, MagicMock(), MagicMock())
+        # Then
+        assert stub._update_input_region.call_count == 3
+
+
+class TestMotionRedraw:
+    def test_motion_redraws_only_after_main_axis_moves(self):
+        # Given: last frame drawn with the cursor at x=100
+        stub, _item = _make_stub()
+        stub._main_axis_cursor = lambda: stub.cursor_x
+        stub._last_drawn_main = 100.0
+        widget = MagicMock()
+        motion = dock_window_mod.DockWindow._on_motion
+
+        # When: sub-pixel and cross-axis moves
+        motion(stub, widget, SimpleNamespace(x=100.25, y=6.0))
+        motion(stub, widget, SimpleNamespace(x=100.0, y=30.0))
+        # Then: hover still tracks, but no frame is queued
+        widget.queue_draw.assert_not_called()
+        assert stub._hover.update.call_count == 2
+        assert stub.cursor_y == 30.0
+
+        # When
+        motion(stub, widget, SimpleNamespace(x=101.0, y=30.0))
+        # Then
+        widget.queue_draw.assert_called_once()
@@ -23,14 +23,33 @@ class TestHoverManagerInit:
         hover = HoverManager(window, config, model, theme, MagicMock())
         # Then
         assert hover.hovered_item is None
+        assert hover.hovered_id == ""
         assert hover._preview_timer_id == 0
-        assert hover._anim_timer_id == 0
+        assert hover._anim_tick_id == 0
 
     def test_preview_show_delay_reasonable(self):
         # Given / When / Then
         assert 200 <= PREVIEW_SHOW_DELAY_MS <= 800
 
 
+class TestHoveredId:
+    def test_tracks_hovered_item(self):
+        # Given
+        hover = HoverManager(
+            MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock()
+        )
+        item = MagicMock(desktop_id="firefox.desktop")
+
+        # When
+        hover.hovered_item = item
+        hovered = hover.hovered_id
+        hover.hovered_item = None
+
+        # Then
+        assert hovered == "firefox.desktop"
+        assert hover.hovered_id == ""
+
+
 class TestHoverManagerPreview:
     def test_set_preview(self):
         # Given
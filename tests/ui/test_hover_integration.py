@@ -58,15 +58,14 @@ class TestHoverUpdates:
         model.visible_items.return_value = [item]
         window.hit_test.return_value = item
         hover.set_preview(MagicMock())
-        monkeypatch.setattr(
-            hover_mod, "compute_layout", lambda *args, **kwargs: _layout()
-        )
+        window.cached_layout.return_value = _layout()
         monkeypatch.setattr(hover_mod.GLib, "timeout_add", lambda _ms, _cb, *_args: 77)
 
         # When
         hover.update(cursor_main=20.0)
         # Then
         assert hover.hovered_item is item
+        assert hover.hovered_id == "firefox.desktop"
         tooltip.update.assert_called_once_with(item, _layout())
         assert hover._preview_timer_id == 77
 
@@ -77,9 +76,7 @@ class TestHoverUpdates:
         hover.hovered_item = item
         model.visible_items.return_value = [item]
         window.hit_test.return_value = item
-        monkeypatch.setattr(
-            hover_mod, "compute_layout", lambda *args, **kwargs: _layout()
-        )
+        window.cached_layout.return_value = _layout()
 
         hover.cancel = MagicMock()
         # When
@@ -99,9 +96,7 @@ class TestHoverUpdates:
         preview = MagicMock()
         hover.set_preview(preview)
         config.previews_enabled = True
-        monkeypatch.setattr(
-            hover_mod, "compute_layout", lambda *args, **kwargs: _layout()
-        )
+        window.cached_layout.return_value = _layout()
 
         # When
         hover.update(cursor_main=20.0)
@@ -128,23 +123,38 @@ class TestHoverTimers:
     def test_start_anim_pump_ticks_and_stops(self, monkeypatch):
         # Given
         hover, window, _model, _config, _tooltip = _make_hover()
-        callbacks = []
-        monkeypatch.setattr(
-            hover_mod.GLib,
-            "timeout_add",
-            lambda _ms, cb: callbacks.append(cb) or 1,
-        )
+        window.drawing_area.add_tick_callback.return_value = 3
+        monkeypatch.setattr(hover_mod.GLib, "get_monotonic_time", lambda: 1_000_000)
+        clock = MagicMock()
+        widget = window.drawing_area
 
         # When
         hover.start_anim_pump(duration_ms=48)
         # Then
-        assert callbacks
-        tick = callbacks[0]
-        assert tick() is True
-        assert tick() is True
-        assert tick() is False
-        window.drawing_area.queue_draw.assert_called()
-        assert hover._anim_timer_id == 0
+        window.drawing_area.add_tick_callback.assert_called_once_with(hover._anim_tick)
+        assert hover._anim_tick_id == 3
+
+        # When: frames before the deadline redraw, the first after it stops
+        clock.get_frame_time.return_value = 1_016_000
+        assert hover._anim_tick(widget, clock) is True
+        clock.get_frame_time.return_value = 1_048_000
+        assert hover._anim_tick(widget, clock) is False
+        # Then
+        widget.queue_draw.assert_called_once()
+        assert hover._anim_tick_id == 0
+
+    def test_start_anim_pump_extends_running_pump(self, monkeypatch):
+        # Given
+        hover, window, _model, _config, _tooltip = _make_hover()
+        window.drawing_area.add_tick_callback.return_value = 3
+        monkeypatch.setattr(hover_mod.GLib, "get_monotonic_time", lambda: 0)
+
+        # When: a short pump starts while a longer one is running
+        hover.start_anim_pump(duration_ms=700)
+        hover.start_anim_pump(duration_ms=350)
+        # Then
+        window.drawing_area.add_tick_callback.assert_called_once()
+        assert hover._anim_until_us == 700_000
 
     def test_on_model_changed_starts_pump_for_urgent_item(self):
         # Given
@@ -190,9 +200,7 @@ class TestShowPreview:
         config.pos = position
         preview = MagicMock()
         hover.set_preview(preview)
-        monkeypatch.setattr(
-            hover_mod, "compute_layout", lambda *args, **kwargs: _layout()
-        )
+        window.cached_layout.return_value = _layout()
 
         assert hover._show_preview(item, object()) is False
         preview.show_for_item.assert_called_once()
@@ -209,9 +217,7 @@ class TestShowPreview:
         hover.hovered_item = None
         hover.set_preview(MagicMock())
         model.visible_items.return_value = [item]
-        monkeypatch.setattr(
-            hover_mod, "compute_layout", lambda *args, **kwargs: _layout()
-        )
+        window.cached_layout.return_value = _layout()
         # Then
         # When
         assert hover._show_preview(item, object()) is False
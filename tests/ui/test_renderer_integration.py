@@ -26,6 +26,32 @@ def _layout():
     ]
 
 
+def _draw_config():
+    return SimpleNamespace(
+        pos=Position.BOTTOM, icon_size=48, zoom_enabled=True, zoom_percent=2.0
+    )
+
+
+def _draw(renderer, cursor_main=30.0):
+    widget = MagicMock()
+    widget.get_allocation.return_value = SimpleNamespace(width=420, height=90)
+    renderer.draw(
+        cr=_surface_context(),
+        widget=widget,
+        model=MagicMock(),
+        config=_draw_config(),
+        theme=None,
+        cursor_main=cursor_main,
+    )
+
+
+def _settled_content(renderer, settled=True):
+    def draw_content(**kwargs):
+        renderer._frame_settled = settled
+
+    return MagicMock(side_effect=draw_content)
+
+
 class TestRendererDrawEntry:
     def test_draw_invokes_offscreen_content_pipeline(self):
         # Given
@@ -35,7 +61,7 @@ class TestRendererDrawEntry:
         widget.get_allocation.return_value = SimpleNamespace(width=420, height=90)
         cr = _surface_context()
         model = MagicMock()
-        config = SimpleNamespace()
+        config = _draw_config()
         theme = MagicMock()
 
         # When
@@ -51,6 +77,122 @@ class TestRendererDrawEntry:
         renderer._draw_content.assert_called_once()
 
 
+class TestRendererFrameReuse:
+    def test_identical_settled_draw_reuses_frame(self):
+        # Given
+        renderer = renderer_mod.DockRenderer()
+        renderer._draw_content = _settled_content(renderer)
+        _draw(renderer)
+
+        # When
+        _draw(renderer)
+
+        # Then
+        renderer._draw_content.assert_called_once()
+
+    def test_changed_cursor_renders(self):
+        # Given
+        renderer = renderer_mod.DockRenderer()
+        renderer._draw_content = _settled_content(renderer)
+        _draw(renderer, cursor_main=30.0)
+
+        # When
+        _draw(renderer, cursor_main=31.0)
+
+        # Then
+        assert renderer._draw_content.call_count == 2
+
+    def test_animating_frame_is_not_reused(self):
+        # Given
+        renderer = renderer_mod.DockRenderer()
+        renderer._draw_content = _settled_content(renderer, settled=False)
+        _draw(renderer)
+
+        # When
+        _draw(renderer)
+
+        # Then
+        assert renderer._draw_content.call_count == 2
+
+    def test_invalidate_frame_forces_render(self):
+        # Given
+        renderer = renderer_mod.DockRenderer()
+        renderer._draw_content = _settled_content(renderer)
+        _draw(renderer)
+
+        # When
+        renderer.invalidate_frame()
+        _draw(renderer)
+
+        # Then
+        assert renderer._draw_content.call_count == 2
+
+
+def _pixbuf():
+    pixbuf = MagicMock()
+    pixbuf.get_width.return_value = 4
+    pixbuf.get_height.return_value = 4
+    return pixbuf
+
+
+class TestRendererIconSurfaces:
+    def test_icon_is_converted_once_per_pixbuf(self, monkeypatch):
+        # Given
+        renderer = renderer_mod.DockRenderer()
+        set_source = MagicMock()
+        monkeypatch.setattr(renderer_mod.Gdk, "cairo_set_source_pixbuf", set_source)
+        item = DockItem(desktop_id="a.desktop", icon=_pixbuf())
+
+        # When
+        first = renderer._icon_surface(item=item)
+        second = renderer._icon_surface(item=item)
+        item.icon = _pixbuf()
+        replaced = renderer._icon_surface(item=item)
+
+        # Then
+        assert first is second
+        assert renderer._icon_surfaces["a.desktop"] == (item.icon, replaced)
+        assert set_source.call_count == 2
+
+    def test_swapped_item_drops_its_surface(self, monkeypatch):
+        # Given
+        renderer = renderer_mod.DockRenderer()
+        monkeypatch.setattr(renderer_mod.Gdk, "cairo_set_source_pixbuf", MagicMock())
+        old = DockItem(desktop_id="old.desktop", icon=_pixbuf())
+        renderer._prune_icon_surfaces(items=[old])
+        renderer._icon_surface(item=old)
+
+        # When: another app takes its place, same item count
+        new = DockItem(desktop_id="new.desktop", icon=_pixbuf())
+        renderer._prune_icon_surfaces(items=[new])
+
+        # Then
+        assert "old.desktop" not in renderer._icon_surfaces
+
+    def test_plain_icon_paints_without_scratch_surface(self, monkeypatch):
+        # Given
+        renderer = renderer_mod.DockRenderer()
+        monkeypatch.setattr(renderer_mod.Gdk, "cairo_set_source_pixbuf", MagicMock())
+        item = DockItem(desktop_id="a.desktop", icon=_pixbuf())
+        li = SimpleNamespace(x=0.0, scale=1.0)
+        cr = _surface_context()
+        renderer._draw_icon(cr=cr, item=item, li=li, base_size=4, x=0, y=0)
+        surfaces = []
+        image_surface = renderer_mod.cairo.ImageSurface
+        monkeypatch.setattr(
+            renderer_mod.cairo,
+            "ImageSurface",
+            lambda *args: surfaces.append(args) or image_surface(*args),
+        )
+
+        # When
+        renderer._draw_icon(cr=cr, item=item, li=li, base_size=4, x=0, y=0)
+        renderer._draw_icon(cr=cr, item=item, li=li, base_size=4, x=0, y=0, lighten=0.2)
+
+        # Then: only the lightened draw needed a scratch surface
+        assert len(surfaces) == 1
+
+
 class TestRendererContentFlow:
     def test_draw_content_runs_icons_indicators_and_urgent_glow(self, monkeypatch):
         # Given
@@ -120,6 +262,8 @@ class TestRendererContentFlow:
         assert renderer._draw_urgent_glow.call_count >= 1
         assert "firefox.desktop" in renderer._hover_lighten
         assert renderer.smooth_shelf_w > 0
+        # Click, bounce and glow timers are still running
+        assert renderer._frame_settled is False
 
     def test_draw_content_returns_early_for_empty_items(self):
         # Given